@@ -0,0 +1,3 @@
+"""
+Benchmark suite for the Olympic Underdogs build (synthetic data at scale).
+"""
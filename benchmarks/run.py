@@ -0,0 +1,267 @@
+"""
+Benchmark runner - times the build stages against synthetic data.
+
+Usage (from the repository root):
+    python -m benchmarks.run                        # current + medium scales
+    python -m benchmarks.run --scale large --target watchlists overview
+    python -m benchmarks.run --check                # exit 1 on regressions
+
+Each result (wall/CPU time, throughput, peak traced memory) is appended to
+benchmarks/results/history.jsonl and compared with the previous result for
+the same scale and target.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Add parent directory to path
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / 'scripts'))
+
+from benchmarks.synthetic import SCALES, generate_dataset
+from src.data_loader import DataLoader
+from src.medals_per_capita import MedalsPerCapitaCalculator
+from src.underdog_checker import UnderdogChecker
+from src.watchlist_generator import WatchlistGenerator
+from generate_html_overview import OlympicsHTMLGenerator
+from generate_schedule_html import generate_interactive_schedule
+from match_schedule_dates import create_nation_schedule_mapping
+
+
+DEFAULT_HISTORY = REPO_ROOT / 'benchmarks' / 'results' / 'history.jsonl'
+
+
+def _setup_data_loader(root: Path, config: Dict) -> Callable:
+    def run():
+        DataLoader(config).load_all()
+    return run
+
+
+def _setup_watchlists(root: Path, config: Dict) -> Callable:
+    data_loader = DataLoader(config)
+    data_loader.load_all()
+    generator = WatchlistGenerator(
+        data_loader, UnderdogChecker(data_loader, config),
+        MedalsPerCapitaCalculator(data_loader), config
+    )
+    return lambda: generator.generate_all_dates(force=True)
+
+
+def _setup_overview(root: Path, config: Dict) -> Callable:
+    generator = OlympicsHTMLGenerator(root, use_cache=False)
+    return generator.generate_html
+
+
+def _setup_schedule(root: Path, config: Dict) -> Callable:
+    return lambda: generate_interactive_schedule(base_path=root)
+
+
+def _setup_schedule_mapping(root: Path, config: Dict) -> Callable:
+    return lambda: create_nation_schedule_mapping(root)
+
+
+# name -> (setup returning the timed callable, count used for throughput)
+# The mapping runs last: it rewrites the schedule files the other targets read.
+TARGETS: Dict[str, Tuple[Callable[[Path, Dict], Callable], str]] = {
+    'data_loader': (_setup_data_loader, 'sessions'),
+    'watchlists': (_setup_watchlists, 'sessions'),
+    'overview': (_setup_overview, 'nations'),
+    'schedule': (_setup_schedule, 'nation_events'),
+    'schedule_mapping': (_setup_schedule_mapping, 'nation_events'),
+}
+
+
+def measure(func: Callable, repeat: int, memory: bool = True) -> Dict:
+    """Time func (stdout suppressed) and optionally measure its peak traced memory."""
+    walls = []
+    cpus = []
+    for _ in range(repeat):
+        gc.collect()
+        with contextlib.redirect_stdout(io.StringIO()):
+            cpu_start = time.process_time()
+            wall_start = time.perf_counter()
+            func()
+            walls.append(time.perf_counter() - wall_start)
+            cpus.append(time.process_time() - cpu_start)
+    
+    result = {
+        'wall_s_min': min(walls),
+        'wall_s_median': statistics.median(walls),
+        'cpu_s_median': statistics.median(cpus),
+        'peak_mem_bytes': None
+    }
+    
+    # Separate run: tracemalloc slows allocation-heavy code, so keep it out of the timings
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                func()
+            result['peak_mem_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    
+    return result
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path: Path) -> List[Dict]:
+    """Read previous results (one JSON object per line)."""
+    if not path.exists():
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_regressions(record: Dict, history: List[Dict], tolerance: float) -> List[str]:
+    """Compare a result with the latest one for the same scale/target."""
+    previous = None
+    for entry in reversed(history):
+        if entry['scale'] == record['scale'] and entry['target'] == record['target']:
+            previous = entry
+            break
+    if previous is None:
+        return []
+    
+    problems = []
+    if record['wall_s_median'] > previous['wall_s_median'] * (1 + tolerance):
+        problems.append(
+            f"wall {previous['wall_s_median']:.3f}s -> {record['wall_s_median']:.3f}s"
+        )
+    if record['peak_mem_bytes'] and previous.get('peak_mem_bytes') and \
+            record['peak_mem_bytes'] > previous['peak_mem_bytes'] * (1 + tolerance):
+        problems.append(
+            f"peak memory {previous['peak_mem_bytes'] / 1_000_000:.1f}MB -> "
+            f"{record['peak_mem_bytes'] / 1_000_000:.1f}MB"
+        )
+    return problems
+
+
+def run_benchmarks(scales: List[str], targets: List[str], repeat: int = 3,
+                   memory: bool = True, data_dir: Optional[Path] = None) -> List[Dict]:
+    """Generate each scale's dataset and benchmark every target against it."""
+    records = []
+    commit = _git_commit()
+    
+    for scale in scales:
+        with tempfile.TemporaryDirectory(prefix=f'olympics-bench-{scale}-') as tmp:
+            root = (data_dir / scale) if data_dir else Path(tmp)
+            
+            started = time.perf_counter()
+            dataset = generate_dataset(root, scale)
+            counts = dataset['counts']
+            print(f"\n[{scale}] {counts['nations']:,} nations, {counts['events']:,} events, "
+                  f"{counts['sessions']:,} sessions, {counts['nation_events']:,} nation entries "
+                  f"(generated in {time.perf_counter() - started:.1f}s)")
+            
+            for target in targets:
+                setup, count_key = TARGETS[target]
+                with contextlib.redirect_stdout(io.StringIO()):
+                    func = setup(root, dataset['config'])
+                result = measure(func, repeat, memory)
+                
+                record = {
+                    'timestamp': datetime.now().isoformat(timespec='seconds'),
+                    'commit': commit,
+                    'python': platform.python_version(),
+                    'machine': platform.machine(),
+                    'scale': scale,
+                    'target': target,
+                    'repeat': repeat,
+                    'items': counts[count_key],
+                    'item_kind': count_key,
+                    'throughput_per_s': round(counts[count_key] / result['wall_s_median'], 1)
+                    if result['wall_s_median'] else None
+                }
+                record.update(result)
+                records.append(record)
+                
+                memory_text = (f"{record['peak_mem_bytes'] / 1_000_000:8.1f}MB"
+                               if record['peak_mem_bytes'] is not None else '       n/a')
+                print(f"  {target:<18} {record['wall_s_median']:9.3f}s "
+                      f"(min {record['wall_s_min']:.3f}s) {memory_text} "
+                      f"{record['throughput_per_s']:>12,.0f} {count_key}/s")
+    
+    return records
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark the build against synthetic data')
+    parser.add_argument(
+        '--scale', nargs='+', choices=sorted(SCALES), default=['current', 'medium'],
+        help='Dataset sizes to run (default: current medium)'
+    )
+    parser.add_argument(
+        '--target', nargs='+', choices=list(TARGETS), default=list(TARGETS),
+        help='Stages to benchmark (default: all)'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per target')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Skip the extra tracemalloc run used for peak memory')
+    parser.add_argument('--history', type=Path, default=DEFAULT_HISTORY,
+                        help='JSONL file results are compared with and appended to')
+    parser.add_argument('--no-record', action='store_true',
+                        help="Compare with the history but don't append to it")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown/memory growth before flagging (default: 0.25)')
+    parser.add_argument('--check', action='store_true',
+                        help='Exit with status 1 if any regression is flagged')
+    parser.add_argument('--data-dir', type=Path,
+                        help='Keep the generated datasets here instead of a temp directory')
+    args = parser.parse_args()
+    
+    # Keep the targets in their canonical order (the mapping must run last)
+    targets = [name for name in TARGETS if name in args.target]
+    records = run_benchmarks(args.scale, targets, args.repeat,
+                             not args.no_memory, args.data_dir)
+    
+    history = load_history(args.history)
+    regressions = []
+    for record in records:
+        for problem in find_regressions(record, history, args.tolerance):
+            regressions.append(f"{record['scale']}/{record['target']}: {problem}")
+    
+    if not args.no_record:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.history, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+        print(f"\nResults appended to: {args.history}")
+    
+    if regressions:
+        print(f"\n⚠ {len(regressions)} regression(s) over {args.tolerance:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        if args.check:
+            sys.exit(1)
+    else:
+        print("\n✓ No regressions against the previous results")
+
+
+if __name__ == '__main__':
+    main()
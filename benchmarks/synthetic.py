@@ -0,0 +1,358 @@
+"""
+Synthetic Games data for the benchmark suite.
+
+Writes the same file shapes as the real data/ directory (participating
+nations, nation events, daily underdog schedule, medals, population, ...)
+into a scratch directory, scaled from today's size up to 10k nations and
+100k sessions. Generation is seeded, so every run sees identical data.
+"""
+
+import json
+import random
+from datetime import date, timedelta
+from itertools import islice, product
+from pathlib import Path
+from string import ascii_uppercase
+from typing import Dict, List, Union
+
+
+# Dataset sizes. "sessions" are entries in data/schedule/schedule.json,
+# "events" the distinct medal events in the IOC schedule.
+SCALES = {
+    'current': {'nations': 91, 'events': 100, 'sessions': 300, 'events_per_nation': 20},
+    'medium': {'nations': 1_000, 'events': 1_000, 'sessions': 10_000, 'events_per_nation': 20},
+    'large': {'nations': 10_000, 'events': 5_000, 'sessions': 100_000, 'events_per_nation': 20},
+}
+
+# (sport, IOC discipline) as matched by scripts/match_schedule_dates.py
+SPORTS = (
+    ('Alpine Skiing', 'Alpine'),
+    ('Biathlon', 'Biathlon'),
+    ('Bobsleigh', 'Bobsleigh'),
+    ('Cross-Country Skiing', 'Cross-Country Skiing'),
+    ('Curling', 'Curling'),
+    ('Figure Skating', 'Figure Skating'),
+    ('Freestyle Skiing', 'Freestyle Skiing'),
+    ('Ice Hockey', 'Ice Hockey'),
+    ('Luge', 'Luge'),
+    ('Short Track Speed Skating', 'Short Track'),
+    ('Skeleton', 'Skeleton'),
+    ('Ski Jumping', 'Ski Jumping'),
+    ('Ski Mountaineering', 'Ski Mountaineering'),
+    ('Snowboarding', 'Snowboard'),
+    ('Speed Skating', 'Speed Skating'),
+)
+
+GENDERS = ("Men's", "Women's", 'Mixed')
+
+GAMES_START = date(2026, 2, 6)
+GAMES_DAYS = 17
+
+
+def nation_codes(count: int) -> List[str]:
+    """Deterministic nation codes (XAAA, XAAB, ...) that never clash with real IOC codes."""
+    return ['X' + ''.join(letters) for letters in islice(product(ascii_uppercase, repeat=3), count)]
+
+
+def _medals(rng: random.Random, medal_rate: float) -> Dict[str, int]:
+    """Heavy-tailed medal counts: most nations have none, a few have hundreds."""
+    if rng.random() > medal_rate:
+        return {'gold': 0, 'silver': 0, 'bronze': 0, 'total': 0}
+    total = min(int(rng.paretovariate(0.8)), 3000)
+    gold = rng.randint(0, total)
+    silver = rng.randint(0, total - gold)
+    return {'gold': gold, 'silver': silver, 'bronze': total - gold - silver, 'total': total}
+
+
+def _write(root: Path, relative: str, payload):
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+
+
+def generate_dataset(root: Union[str, Path], scale: str = 'current', seed: int = 2026) -> Dict:
+    """
+    Write a synthetic dataset under root/data.
+    
+    Args:
+        root: Scratch directory (acts as the repository root for the generators)
+        scale: Key of SCALES
+        seed: Random seed
+    
+    Returns:
+        Dict with 'config' (a config.yaml equivalent pointing at the dataset)
+        and 'counts' (nations, events, sessions, nation_events)
+    """
+    root = Path(root)
+    sizes = SCALES[scale]
+    rng = random.Random(seed)
+    
+    codes = nation_codes(sizes['nations'])
+    dates = [(GAMES_START + timedelta(days=i)).isoformat() for i in range(GAMES_DAYS)]
+    
+    # IOC medal events, spread over the sports and the days of the Games
+    catalog = []
+    disciplines = {discipline: {'code': discipline[:3].upper(), 'medal_events': []}
+                   for _, discipline in SPORTS}
+    for i in range(sizes['events']):
+        sport, discipline = SPORTS[i % len(SPORTS)]
+        hour = rng.randint(3, 15)
+        minute = rng.choice((0, 15, 30, 45))
+        event = {
+            'sport': sport,
+            'discipline': discipline,
+            'event': f"{GENDERS[i % len(GENDERS)]} Event {i:05d}",
+            'date': rng.choice(dates),
+            'time_est': f"{hour:02d}:{minute:02d}",
+            'time_cet': f"{hour + 6:02d}:{minute:02d}"
+        }
+        catalog.append(event)
+        disciplines[discipline]['medal_events'].append({
+            'date': event['date'],
+            'time_cet': event['time_cet'],
+            'time_est': event['time_est'],
+            'event': event['event']
+        })
+    
+    # Per-nation entries
+    nation_events = {}
+    nation_schedules = {}
+    nation_sports = {}
+    daily_schedule = {d: {} for d in dates}
+    event_nations = {}
+    athlete_counts = {}
+    all_time_medals = {}
+    winter_medals = {}
+    population = {}
+    nation_tiers = {}
+    nation_event_count = 0
+    
+    for code in codes:
+        entries = rng.sample(catalog, min(sizes['events_per_nation'], len(catalog)))
+        events = []
+        events_by_date = {}
+        for event in entries:
+            athletes = min(int(rng.paretovariate(1.5)), 12)
+            status = rng.choice(('probable', 'probable', 'unconfirmed'))
+            events.append({'sport': event['sport'], 'event': event['event'],
+                           'athletes': athletes, 'status': status})
+            events_by_date.setdefault(event['date'], []).append({
+                'sport': event['sport'], 'event': event['event'],
+                'time_est': event['time_est'], 'athletes': athletes, 'status': status
+            })
+            event_key = f"{event['sport']} - {event['event']}"
+            daily_schedule[event['date']].setdefault(event_key, []).append({
+                'nation': code, 'athletes': athletes, 'status': status,
+                'time_est': event['time_est']
+            })
+            event_nations.setdefault(event_key, []).append({
+                'nation': code, 'athletes': athletes, 'status': status
+            })
+        nation_event_count += len(events)
+        
+        sports = sorted({event['sport'] for event in events})
+        probable = sum(1 for event in events if event['status'] == 'probable')
+        nation_events[code] = {
+            'sports': sports,
+            'events': events,
+            'total_events': len(events),
+            'probable_events': probable,
+            'unconfirmed_events': len(events) - probable
+        }
+        
+        competition_dates = sorted(events_by_date)
+        nation_schedules[code] = {
+            'sports': sports,
+            'competition_dates': competition_dates,
+            'events_by_date': events_by_date,
+            'first_competition': competition_dates[0] if competition_dates else None,
+            'last_competition': competition_dates[-1] if competition_dates else None,
+            'total_competition_days': len(competition_dates)
+        }
+        
+        nation_sports[code] = {}
+        for sport in sports:
+            men = rng.randint(0, 6)
+            women = rng.randint(0, 6)
+            nation_sports[code][sport] = {'men': men, 'women': women, 'total': men + women}
+        
+        athlete_counts[code] = max(1, min(int(rng.paretovariate(0.7)), 250))
+        all_time_medals[code] = _medals(rng, 0.5)
+        if rng.random() < 0.3:
+            winter_medals[code] = _medals(rng, 1.0)
+        population[code] = int(10 ** rng.uniform(4.5, 9.2))
+        nation_tiers[code] = rng.randint(0, 5)
+    
+    # Sessions: the DataLoader schedule, several sessions per medal event
+    sessions = {d: [] for d in dates}
+    for i in range(sizes['sessions']):
+        event = catalog[i % len(catalog)]
+        session_date = event['date'] if i < len(catalog) else rng.choice(dates)
+        sessions[session_date].append({
+            'sport': event['sport'],
+            'discipline': event['discipline'],
+            'event': event['event'],
+            'session': 'Medal Event' if i < len(catalog) else 'Regular Event',
+            'time': event['time_cet'],
+            'nations': rng.sample(codes, min(len(codes), rng.randint(2, 12)))
+        })
+    
+    olympics_schedule = {}
+    for d in dates:
+        day_sports = {}
+        for session in sessions[d]:
+            event_type = 'medal_event' if session['session'] == 'Medal Event' else 'regular_event'
+            if day_sports.get(session['sport']) != 'medal_event':
+                day_sports[session['sport']] = event_type
+        olympics_schedule[d] = {'sports': [{'sport': sport, 'type': day_sports[sport]}
+                                           for sport in sorted(day_sports)]}
+    
+    _write(root, 'data/participating_nations_2026.json', codes)
+    _write(root, 'data/athlete_counts_2026.json', athlete_counts)
+    _write(root, 'data/nation_sports_participation_2026.json', nation_sports)
+    _write(root, 'data/nation_events_2026.json', nation_events)
+    _write(root, 'data/nation_schedules_2026.json', nation_schedules)
+    _write(root, 'data/daily_underdog_schedule_2026.json',
+           {d: events for d, events in daily_schedule.items() if events})
+    _write(root, 'data/event_nations_2026.json', event_nations)
+    _write(root, 'data/nation_tiers_2026.json', nation_tiers)
+    _write(root, 'data/medals/all_time_medals.json', all_time_medals)
+    _write(root, 'data/medals/historical_medals.json', all_time_medals)
+    _write(root, 'data/medals/winter_medals.json', winter_medals)
+    _write(root, 'data/population/population.json', population)
+    _write(root, 'data/schedule/schedule.json', sessions)
+    _write(root, 'data/schedule/2026_olympics_schedule.json', olympics_schedule)
+    _write(root, 'data/schedules/ioc_schedule_complete.json', {
+        'metadata': {'source': 'synthetic benchmark data', 'seed': seed, 'scale': scale},
+        'summary': {'total_disciplines': len(disciplines),
+                    'disciplines_with_data': sorted(disciplines)},
+        'disciplines': disciplines
+    })
+    
+    data = root / 'data'
+    config = {
+        'olympics': {
+            'name': 'Synthetic Winter Olympics',
+            'start_date': dates[0],
+            'end_date': dates[-1],
+            'host_city': 'Benchmark'
+        },
+        'criteria': {'never_medaled': True, 'never_won_gold': True, 'population_threshold': 1_000_000},
+        'data_paths': {
+            'schedule': str(data / 'schedule' / 'schedule.json'),
+            'medals': str(data / 'medals' / 'historical_medals.json'),
+            'winter_medals': str(data / 'medals' / 'winter_medals.json'),
+            'athlete_counts': str(data / 'athlete_counts_2026.json'),
+            'population': str(data / 'population' / 'population.json'),
+            'processed': str(data / 'processed')
+        },
+        'output': {
+            'directory': str(root / 'outputs' / 'daily_watchlists'),
+            'format': 'markdown',
+            'include_sidebar': True
+        },
+        'display': {'show_session_times': True, 'group_by_sport': True, 'max_nations_sidebar': 20}
+    }
+    
+    return {
+        'config': config,
+        'counts': {
+            'nations': len(codes),
+            'events': len(catalog),
+            'sessions': sizes['sessions'],
+            'nation_events': nation_event_count
+        }
+    }
+
+
+def _paragraphs(rng: random.Random, count: int) -> str:
+    words = ('the', 'team', 'olympic', 'qualified', 'athletes', 'quota', 'event', 'games',
+             'national', 'committee', 'winter', 'competed', 'selected', 'places', 'final')
+    return '\n'.join(
+        '<p>' + ' '.join(rng.choice(words) for _ in range(rng.randint(40, 120))) +
+        '<sup class="reference"><a href="#cite_note-1">[1]</a></sup></p>'
+        for _ in range(count)
+    )
+
+
+def wiki_nation_page(code: str, seed: int = 2026) -> str:
+    """
+    A "<Nation> at the 2026 Winter Olympics" style page.
+    
+    Prose, an infobox, a competitors-by-sport table and one results table
+    per sport (with rowspans and reference markers), roughly the size and
+    shape of the real Wikipedia pages.
+    """
+    rng = random.Random(f"{seed}-{code}")
+    sports = rng.sample([sport for sport, _ in SPORTS], rng.randint(2, len(SPORTS)))
+    parts = [
+        f'<html><head><title>{code} at the 2026 Winter Olympics</title>'
+        '<style>.mw-parser-output table { border: 1px solid; }</style>'
+        '<script>var wgPageName = "x"; document.write("<table><tr><td>x</td></tr></table>");</script>'
+        '</head><body><div class="mw-parser-output">',
+        f'<table class="infobox"><tr><th colspan="2">{code} at the 2026 Winter Olympics</th></tr>'
+        f'<tr><th>IOC code</th><td>{code}</td></tr><tr><th>Competitors</th><td>42</td></tr></table>',
+        _paragraphs(rng, 12),
+        '<h2>Competitors</h2><table class="wikitable sortable" style="text-align:center">'
+        '<tr><th>Sport</th><th>Men</th><th>Women</th><th>Total</th></tr>'
+    ]
+    totals = [0, 0]
+    for sport in sorted(sports):
+        men, women = rng.randint(0, 12), rng.randint(0, 12)
+        totals[0] += men
+        totals[1] += women
+        parts.append(f'<tr><td style="text-align:left"><a href="/wiki/{sport}">{sport}</a></td>'
+                     f'<td>{men}</td><td>{women}</td><td>{men + women}</td></tr>')
+    parts.append(f'<tr><th>Total</th><th>{totals[0]}</th><th>{totals[1]}</th>'
+                 f'<th>{sum(totals)}</th></tr></table>')
+    
+    for sport in sports:
+        parts.append(f'<h2>{sport}</h2>' + _paragraphs(rng, 3))
+        parts.append('<table class="wikitable" style="font-size:90%">'
+                     '<tr><th rowspan="2">Athlete</th><th rowspan="2">Event</th>'
+                     '<th colspan="2">Run 1</th><th colspan="2">Final</th></tr>'
+                     '<tr><th>Time</th><th>Rank</th><th>Time</th><th>Rank</th></tr>')
+        for athlete in range(rng.randint(2, 10)):
+            events = rng.randint(1, 3)
+            for event in range(events):
+                name = (f'<td rowspan="{events}"><a href="/wiki/A{athlete}">Athlete {athlete}</a></td>'
+                        if event == 0 else '')
+                parts.append(
+                    f'<tr>{name}<td>{GENDERS[event % 3]} event {event}</td>'
+                    f'<td>{rng.randint(50, 99)}.{rng.randint(10, 99)}</td><td>{rng.randint(1, 60)}</td>'
+                    f'<td>{rng.randint(100, 199)}.{rng.randint(10, 99)}</td>'
+                    f'<td><span style="display:none">{rng.randint(1, 60):03d}</span>{rng.randint(1, 60)}'
+                    f'<sup class="reference">[{event}]</sup></td></tr>'
+                )
+        parts.append('</table>')
+    
+    parts.append(_paragraphs(rng, 6) + '</div></body></html>')
+    return '\n'.join(parts)
+
+
+def wiki_medal_table_page(codes: List[str], seed: int = 2026) -> str:
+    """An all-time medal table page: Summer/Winter/Combined column groups, one row per nation."""
+    rng = random.Random(seed)
+    parts = [
+        '<html><body><div class="mw-parser-output">', _paragraphs(rng, 8),
+        '<table class="wikitable sortable plainrowheaders"><tr><th rowspan="2">Team</th>'
+        '<th colspan="5">Summer Olympic Games</th><th colspan="5">Winter Olympic Games</th>'
+        '<th colspan="5">Combined total</th></tr><tr>' +
+        '<th>No.</th><th>Gold</th><th>Silver</th><th>Bronze</th><th>Total</th>' * 3 + '</tr>'
+    ]
+    for code in codes:
+        row = []
+        combined = [0, 0, 0, 0, 0]
+        for rate in (0.8, 0.3):
+            games = rng.randint(1, 30)
+            medals = _medals(rng, rate)
+            values = [games, medals['gold'], medals['silver'], medals['bronze'], medals['total']]
+            combined = [a + b for a, b in zip(combined, values)]
+            row.extend(values)
+        row.extend(combined)
+        cells = ''.join(f'<td>{value:,}</td>' for value in row)
+        parts.append(f'<tr><th scope="row"><a href="/wiki/{code}">Nation {code}</a> '
+                     f'<span style="font-size:90%;">({code})</span></th>{cells}</tr>')
+    parts.append('</table>' + _paragraphs(rng, 4) + '</div></body></html>')
+    return '\n'.join(parts)
@@ -0,0 +1,199 @@
+"""
+Table extraction benchmark - src.html_tables against the previous parse path.
+
+Usage (from the repository root):
+    python -m benchmarks.tables                     # synthetic Wikipedia-like pages
+    python -m benchmarks.tables --pages saved/      # saved pages (*.html)
+    python -m benchmarks.tables --corpus fixtures/scrapers.corpus.gz
+    python -m benchmarks.tables --nations 500 --repeat 5
+
+Times finding the competitors table on every nation page and the combined
+medal table on the all-time medal page. The previous path (BeautifulSoup,
+then pd.read_html on each serialized table, or read_html on the whole page)
+is timed as well when bs4, pandas and lxml are installed, and so is turning
+the tables into medal/competitor dicts (use a large --nations to mimic the
+historical multi-Games medal tables). With --corpus, the pages come from a
+record/replay corpus (src/replay.py), which also times parse_ioc_schedule on
+the recorded IOC schedule pages.
+"""
+
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import time
+from io import StringIO
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add parent directory to path
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / 'scripts'))
+
+from benchmarks.synthetic import nation_codes, wiki_medal_table_page, wiki_nation_page
+from src.html_tables import find_table, iter_tables
+from src.replay import Corpus
+from scrape_ioc_schedule import DISCIPLINES, parse_ioc_schedule
+
+try:
+    import pandas as pd
+    from bs4 import BeautifulSoup
+    import lxml  # noqa: F401 (read_html's parser)
+    from scrape_nation_sports import NationCompetitorsScraper
+    from scrape_pandas import PandasOlympicScraper
+except ImportError:
+    pd = None
+
+
+COMPETITORS_SIGNATURE = (('sport', 'discipline'), ('men', 'women'))
+MEDALS_SIGNATURE = ('summer', 'winter', 'combined')
+
+
+def extract_competitors(html: str):
+    """Current path: one streaming pass, DataFrame only for the matching table."""
+    for table in iter_tables(html, classes=('wikitable',)):
+        if table.matches(COMPETITORS_SIGNATURE):
+            return table.to_frame() if pd is not None else table
+    return None
+
+
+def extract_medals(html: str):
+    table = find_table(html, MEDALS_SIGNATURE, classes=None)
+    if table is None:
+        return None
+    return table.to_frame() if pd is not None else table
+
+
+def legacy_competitors(html: str):
+    """Previous path: BeautifulSoup tree, then read_html per serialized wikitable."""
+    soup = BeautifulSoup(html, 'html.parser')
+    for html_table in soup.find_all('table', class_='wikitable'):
+        df = pd.read_html(StringIO(str(html_table)))[0]
+        cols_str = str(df.columns).lower()
+        if ('sport' in cols_str or 'discipline' in cols_str) and ('men' in cols_str or 'women' in cols_str):
+            return df
+    return None
+
+
+def legacy_medals(html: str):
+    """Previous path: read_html over every table on the page."""
+    for table in pd.read_html(StringIO(html)):
+        cols_str = str(table.columns).lower()
+        if 'summer' in cols_str and 'winter' in cols_str and 'combined' in cols_str:
+            return table
+    return None
+
+
+def time_pages(func: Callable, pages: List, repeat: int) -> float:
+    """Median seconds to run func over every page (or parsed table)."""
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for page in pages:
+            func(page)
+        runs.append(time.perf_counter() - started)
+    return statistics.median(runs)
+
+
+def parse_schedule(page):
+    """IOC schedule page, as (html, discipline) -> events."""
+    return parse_ioc_schedule(*page)
+
+
+def load_corpus(path: Path) -> Dict[str, List]:
+    """Nation, medal table and IOC schedule pages from a record/replay corpus."""
+    pages = {'competitors': [], 'medals': [], 'schedule': []}
+    for url, result in Corpus(path).pages():
+        if not result.ok:
+            continue
+        name = url.rstrip('/').rsplit('/', 1)[-1]
+        if '/schedule/' in url and name in DISCIPLINES:
+            pages['schedule'].append((result.text, DISCIPLINES[name]))
+        elif 'medal_table' in name.lower():
+            pages['medals'].append(result.text)
+        elif name.endswith('_at_the_2026_Winter_Olympics'):
+            pages['competitors'].append(result.text)
+    return pages
+
+
+def load_pages(pages_dir: Optional[Path], nations: int) -> Dict[str, List[str]]:
+    """Saved pages from a directory, or synthetic ones."""
+    if pages_dir is not None:
+        nation_pages, medal_pages = [], []
+        for path in sorted(pages_dir.rglob('*.html')):
+            html = path.read_text(encoding='utf-8', errors='replace')
+            (medal_pages if 'medal_table' in path.name.lower() else nation_pages).append(html)
+        return {'competitors': nation_pages, 'medals': medal_pages}
+    
+    codes = nation_codes(nations)
+    return {
+        'competitors': [wiki_nation_page(code) for code in codes],
+        # Three-letter codes, so the rows parse as IOC codes
+        'medals': [wiki_medal_table_page([code[1:] for code in codes])]
+    }
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark HTML table extraction')
+    parser.add_argument('--pages', type=Path, default=None,
+                        help='Directory of saved pages (*.html; medal pages need "medal_table" in the name)')
+    parser.add_argument('--corpus', type=Path, default=None,
+                        help='Record/replay corpus to take the pages from (see src/replay.py)')
+    parser.add_argument('--nations', type=int, default=91,
+                        help='Synthetic nation pages / medal table rows (default: 91)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per path')
+    args = parser.parse_args()
+    
+    pages = load_corpus(args.corpus) if args.corpus else load_pages(args.pages, args.nations)
+    paths = {
+        'competitors': (extract_competitors, legacy_competitors),
+        'medals': (extract_medals, legacy_medals),
+        'schedule': (parse_schedule, None)
+    }
+    
+    if pd is None:
+        print("Note: bs4/pandas/lxml not installed; timing the new path only (without DataFrames)")
+    
+    for name, (current, legacy) in paths.items():
+        if not pages.get(name):
+            continue
+        if name == 'schedule':
+            size = sum(len(html) for html, _ in pages[name]) / 1_000_000
+            seconds = time_pages(current, pages[name], args.repeat)
+            print(f"\n[schedule] {len(pages[name])} page(s), {size:.1f} MB")
+            print(f"  {'ioc schedule':<16} {seconds:8.3f}s {len(pages[name]) / seconds:10,.1f} pages/s "
+                  f"{size / seconds:8.1f} MB/s")
+            continue
+        size = sum(len(html) for html in pages[name]) / 1_000_000
+        count = len(pages[name])
+        print(f"\n[{name}] {count} page(s), {size:.1f} MB")
+        
+        results = [('html_tables', current)]
+        if pd is not None:
+            results.append(('bs4 + read_html', legacy))
+        baseline = None
+        for label, func in results:
+            seconds = time_pages(func, pages[name], args.repeat)
+            speedup = f"  ({seconds / baseline:.1f}x slower)" if baseline else ''
+            baseline = baseline or seconds
+            print(f"  {label:<16} {seconds:8.3f}s {count / seconds:10,.1f} pages/s "
+                  f"{size / seconds:8.1f} MB/s{speedup}")
+        
+        if pd is not None:
+            frames = [current(html) for html in pages[name]]
+            frames = [frame for frame in frames if frame is not None]
+            if name == 'competitors':
+                parse = NationCompetitorsScraper(parse_workers=0, use_cache=False)._parse_competitors_table
+            else:
+                parse = PandasOlympicScraper()._parse_combined_table
+            rows = sum(len(frame) for frame in frames)
+            with contextlib.redirect_stdout(io.StringIO()):
+                seconds = time_pages(parse, frames, args.repeat)
+            print(f"  {'rows -> dicts':<16} {seconds:8.3f}s {rows / seconds:10,.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main()
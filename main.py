@@ -11,6 +11,8 @@ from src.data_loader import DataLoader
 from src.underdog_checker import UnderdogChecker
 from src.medals_per_capita import MedalsPerCapitaCalculator
 from src.watchlist_generator import WatchlistGenerator
+from src.watcher import WatchService
+from src.profiling import add_profiling_arguments, profiler_from_args, finish_profiling
 from src.utils import load_config, format_date
 
 
@@ -29,36 +31,74 @@ def main():
         action='store_true',
         help='Generate watchlists for all dates in the Olympics'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of processes to render dates with when using --all or --watch'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='With --all, rebuild every watchlist even if its inputs are unchanged'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and regenerate watchlists whenever data files change'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=2.0,
+        help='Seconds between data polls in --watch mode'
+    )
     parser.add_argument(
         '--config',
         type=str,
         default='config.yaml',
         help='Path to configuration file'
     )
+    add_profiling_arguments(parser)
     
     args = parser.parse_args()
+    profiler = profiler_from_args(args, 'main')
     
     # Load configuration
     print("Loading configuration...")
-    config = load_config(args.config)
+    with profiler.stage('config'):
+        config = load_config(args.config)
     
     # Initialize components
     print("Initializing data loader...")
-    data_loader = DataLoader(config)
-    data_loader.load_all()
+    with profiler.stage('load_data'):
+        data_loader = DataLoader(config)
+        data_loader.load_all()
     
     underdog_checker = UnderdogChecker(data_loader, config)
     medals_calculator = MedalsPerCapitaCalculator(data_loader)
     watchlist_generator = WatchlistGenerator(
-        data_loader, underdog_checker, medals_calculator, config
+        data_loader, underdog_checker, medals_calculator, config,
+        profiler=profiler
     )
     
     # Generate watchlist(s)
-    if args.all:
+    if args.watch:
+        print("\nGenerating watchlists for all Olympic dates...")
+        counts = watchlist_generator.generate_all_dates(workers=args.workers, force=args.force)
+        print(f"✓ Rebuilt {counts['rebuilt']} watchlist(s), {counts['skipped']} unchanged")
+        
+        service = WatchService(config, data_loader, watchlist_generator,
+                               event_mapper=watchlist_generator.event_mapper)
+        service.run(interval=args.interval, workers=args.workers)
+    elif args.all:
         print("\nGenerating watchlists for all Olympic dates...")
-        generated_files = watchlist_generator.generate_all_dates()
-        print(f"\n✓ Generated {len(generated_files)} watchlists")
-        print(f"  from {generated_files[0]} to {generated_files[-1]}")
+        counts = watchlist_generator.generate_all_dates(
+            workers=args.workers, force=args.force
+        )
+        dates = watchlist_generator.get_olympic_dates()
+        print(f"\n✓ Rebuilt {counts['rebuilt']} watchlist(s), {counts['skipped']} unchanged")
+        print(f"  from {dates[0]} to {dates[-1]}")
     else:
         # Determine target date
         if args.date:
@@ -67,16 +107,19 @@ def main():
             target_date = format_date(datetime.now())
         
         print(f"\nGenerating watchlist for {target_date}...")
-        content = watchlist_generator.generate_for_date(target_date)
+        with profiler.stage('render'):
+            content = watchlist_generator.generate_for_date(target_date)
         
         # Save to file
-        watchlist_generator.save_watchlist(target_date, content)
+        with profiler.stage('save'):
+            watchlist_generator.save_watchlist(target_date, content)
         
         # Also print to console
         print("\n" + "="*60)
         print(content)
         print("="*60)
     
+    finish_profiling(profiler, args)
     print("\n✓ Done!")
 
 
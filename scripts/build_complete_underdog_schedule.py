@@ -4,9 +4,17 @@ Build complete underdog schedule for all 16 sports using criteria-based classifi
 """
 
 import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.snapshot import load_json as load_snapshot_json
+from src.nation_table import NationTable
+from src.underdog_criteria import CriteriaResult, evaluate as evaluate_criteria
+
 # All 92 participating nations and their sports
 NATIONS_SPORTS = {
     "Albania": ["Alpine skiing"],
@@ -103,47 +111,24 @@ NATIONS_SPORTS = {
 def load_json(filepath: str) -> Dict:
     """Load JSON file safely."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_snapshot_json(filepath)
     except FileNotFoundError:
         return {}
 
-def check_underdog_criteria(nation: str, athlete_count: int, all_medals: Dict, winter_medals: Dict, population: int) -> Tuple[bool, List[str]]:
-    """Check how many underdog criteria a nation meets."""
-    criteria_met = []
-    
-    # Criterion 1: < 5 athletes (but at least 1)
-    if 1 <= athlete_count < 5:
-        criteria_met.append("< 5 Athletes")
-    
-    # Criterion 2: No Olympic gold medals
-    if all_medals.get('gold', 0) == 0:
-        criteria_met.append("No Olympic Gold")
-    
-    # Criterion 3: No Olympic medals
-    if all_medals.get('total', 0) == 0:
-        criteria_met.append("No Olympic Medals")
-    
-    # Criterion 4: Population under 1M
-    if 0 < population < 1_000_000:
-        criteria_met.append("Population < 1M")
-    
-    # Criterion 5: No Winter Olympic gold
-    if winter_medals.get('gold', 0) == 0:
-        criteria_met.append("No Winter Gold")
-    
-    # Criterion 6: No Winter Olympic medals
-    if winter_medals.get('total', 0) == 0:
-        criteria_met.append("No Winter Medals")
-    
-    # Criterion 7: Southern Hemisphere
-    southern_hemisphere = {
-        "Argentina", "Australia", "Bolivia", "Brazil", "Chile", 
-        "New Zealand", "Paraguay", "South Africa", "Uruguay"
-    }
-    if nation in southern_hemisphere:
-        criteria_met.append("Southern Hemisphere")
-    
+# Labels used in underdog_schedule_2026.json, by criterion key
+CRITERIA_LABELS = {
+    'small_athletes': "< 5 Athletes",
+    'no_olympic_gold': "No Olympic Gold",
+    'no_olympic_medals': "No Olympic Medals",
+    'small_population': "Population < 1M",
+    'no_winter_gold': "No Winter Gold",
+    'no_winter_medals': "No Winter Medals",
+    'southern_hemisphere': "Southern Hemisphere"
+}
+
+def check_underdog_criteria(ioc_code: str, criteria: CriteriaResult) -> Tuple[bool, List[str]]:
+    """Look up which underdog criteria a nation meets in the evaluated criteria."""
+    criteria_met = [CRITERIA_LABELS[key] for key in criteria.criteria_keys(ioc_code)]
     is_underdog = len(criteria_met) > 0
     return is_underdog, criteria_met
 
@@ -183,6 +168,17 @@ def main():
         "United Arab Emirates": "UAE", "Uruguay": "URU", "Uzbekistan": "UZB", "Venezuela": "VEN"
     }
     
+    # Classify every nation once with the shared criteria engine
+    ioc_codes = [name_to_ioc.get(nation, nation[:3].upper()) for nation in NATIONS_SPORTS]
+    table = NationTable.from_sources(
+        medals=all_time_medals,
+        winter_medals=winter_medals,
+        population=population,
+        athletes=athlete_counts,
+        nations=ioc_codes
+    )
+    criteria_result = evaluate_criteria(table, ioc_codes)
+    
     underdog_by_sport = {}
     nation_underdog_status = {}
     
@@ -196,12 +192,7 @@ def main():
             continue
         
         ioc_code = name_to_ioc.get(nation, nation[:3].upper())
-        athlete_count = athlete_counts.get(ioc_code, 0)
-        all_med = all_time_medals.get(ioc_code, {})
-        winter_med = winter_medals.get(ioc_code, {})
-        pop = population.get(ioc_code, 0)
-        
-        is_underdog, criteria = check_underdog_criteria(nation, athlete_count, all_med, winter_med, pop)
+        is_underdog, criteria = check_underdog_criteria(ioc_code, criteria_result)
         nation_underdog_status[nation] = {
             "is_underdog": is_underdog,
             "criteria_met": criteria,
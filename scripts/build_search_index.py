@@ -0,0 +1,160 @@
+"""
+Build the prebuilt client-side search index (search_index.json).
+
+Documents are nations (names, IOC codes and aliases), sports and events,
+taken from nation_events_2026.json, event_nations_2026.json and
+OlympicsHTMLGenerator.NATION_NAMES. The index is a sorted token list with
+one postings list per token, so search.js can answer prefix queries with a
+binary search instead of scanning the schedule.
+"""
+
+import argparse
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.snapshot import load_json
+from src.templates import write_stream
+from generate_html_overview import OlympicsHTMLGenerator
+from generate_nation_pages import NATIONS_DIR
+
+
+INDEX_FILE = 'search_index.json'
+INDEX_VERSION = 1
+
+# Document types (also the result order in search.js)
+NATION, SPORT, EVENT = 0, 1, 2
+
+# Other names people search for, by IOC code
+NATION_ALIASES = {
+    'GBR': ['UK', 'Britain', 'United Kingdom'],
+    'USA': ['US', 'America'],
+    'KOR': ['Korea'],
+    'TPE': ['Taiwan'],
+    'NED': ['Holland'],
+    'CZE': ['Czechia'],
+    'ROM': ['ROU'],
+    'TUR': ['Türkiye'],
+    'UAE': ['Emirates'],
+    'HKG': ['China Hong Kong'],
+}
+
+_COMBINING = re.compile('[\u0300-\u036f]')
+_SEPARATOR = re.compile(r'[^a-z0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, accent-folded alphanumeric tokens (must match search.js)."""
+    text = _COMBINING.sub('', unicodedata.normalize('NFKD', text)).lower()
+    return [token for token in _SEPARATOR.split(text) if token]
+
+
+def build_search_index(base_path: Optional[Path] = None) -> Dict:
+    """
+    Build the index from the data files under base_path (default: repo root).
+    
+    Returns:
+        {'version', 'docs': [[type, label, detail, url], ...],
+         'tokens': [sorted tokens], 'postings': [[doc ids], ...]}
+    """
+    base_path = Path(base_path) if base_path else Path(__file__).parent.parent
+    data_dir = base_path / 'data'
+    
+    def load(name: str) -> Dict:
+        try:
+            return load_json(data_dir / name)
+        except FileNotFoundError:
+            return {}
+    
+    nation_events = load('nation_events_2026.json')
+    event_nations = load('event_nations_2026.json')
+    try:
+        participating = load_json(data_dir / 'participating_nations_2026.json')
+    except FileNotFoundError:
+        participating = []
+    
+    # Data files key nations by full name; pages and aliases use IOC codes
+    names = OlympicsHTMLGenerator.NATION_NAMES
+    codes_by_name: Dict[str, List[str]] = {}
+    for code, name in names.items():
+        codes_by_name.setdefault(name, []).append(code)
+    has_page = set(participating)
+    
+    docs: List[List] = []
+    doc_terms: List[Tuple[int, List[str]]] = []
+    
+    def add(doc_type: int, label: str, detail: str, url: str, *terms: str):
+        doc_terms.append((len(docs), [label, *terms]))
+        docs.append([doc_type, label, detail, url])
+    
+    # Nations: participating codes plus anyone named in the event data
+    nation_names = {names.get(code, code): code for code in participating}
+    for name in list(nation_events) + [entry['nation'] for nations in event_nations.values()
+                                       for entry in nations]:
+        nation_names.setdefault(name, (codes_by_name.get(name) or [name])[0])
+    
+    for name, code in sorted(nation_names.items()):
+        codes = sorted(set(codes_by_name.get(name, [])) | ({code} if code != name else set()))
+        aliases = [alias for c in codes for alias in NATION_ALIASES.get(c, [])]
+        page = next((c for c in codes if c in has_page), None)
+        url = f"{NATIONS_DIR}/{page}.html" if page else f"schedule.html?nation={quote(name)}"
+        add(NATION, name, ' / '.join(codes), url, *codes, *aliases)
+    
+    # Events, and sports with their event counts
+    sport_events: Dict[str, int] = {}
+    events = set(event_nations)
+    for nation in nation_events.values():
+        for entry in nation.get('events', []):
+            events.add(f"{entry['sport']} - {entry['event']}")
+    
+    for event in sorted(events):
+        sport = event.split(' - ')[0]
+        sport_events[sport] = sport_events.get(sport, 0) + 1
+        count = len(event_nations.get(event, []))
+        detail = f"{count} nation{'s' if count != 1 else ''}" if count else sport
+        add(EVENT, event, detail, f"schedule.html?sport={quote(sport)}")
+    
+    for sport, count in sorted(sport_events.items()):
+        add(SPORT, sport, f"{count} event{'s' if count != 1 else ''}", f"schedule.html?sport={quote(sport)}")
+    
+    postings: Dict[str, set] = {}
+    for doc_id, terms in doc_terms:
+        for term in terms:
+            for token in tokenize(term):
+                postings.setdefault(token, set()).add(doc_id)
+    
+    tokens = sorted(postings)
+    return {
+        'version': INDEX_VERSION,
+        'docs': docs,
+        'tokens': tokens,
+        'postings': [sorted(postings[token]) for token in tokens]
+    }
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Build the client-side search index')
+    parser.add_argument('--output', type=Path, default=None,
+                        help=f'Index file (default: {INDEX_FILE} in the repository root)')
+    args = parser.parse_args()
+    
+    index = build_search_index()
+    output_file = args.output or Path(__file__).parent.parent / INDEX_FILE
+    write_stream(output_file, [json.dumps(index, ensure_ascii=False, separators=(',', ':'))])
+    
+    print(f"[OK] Search index: {output_file}")
+    print(f"     {len(index['docs'])} documents, {len(index['tokens'])} tokens, "
+          f"{output_file.stat().st_size / 1024:.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,9 @@
 """
 Extract schedule data from schedule.html and create schedule-data.json
 
+Pages generated with per-day shards (schedule_data/manifest.json) are read
+from the shards instead, since their event cards are rendered in the browser.
+
 This script parses the HTML to extract:
 - All days with dates
 - All events with sports and times
@@ -96,6 +99,39 @@ def extract_schedule_data(html_file: str) -> dict:
     return schedule
 
 
+def extract_schedule_shards(shard_dir: str) -> dict:
+    """Build the same structure from the per-day JSON shards."""
+    
+    shard_dir = Path(shard_dir)
+    with open(shard_dir / 'manifest.json', 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    schedule = {}
+    for date, filename in sorted(manifest['days'].items()):
+        with open(shard_dir / filename, 'r', encoding='utf-8') as f:
+            shard = json.load(f)
+        
+        date_obj = datetime.strptime(date, '%Y-%m-%d')
+        schedule[date] = {
+            'date': date,
+            'events': [],
+            'title': f"{date_obj.strftime('%A')}, {date_obj.strftime('%B %d, %Y')}"
+        }
+        
+        for sport, event, time_est, nations in shard['events']:
+            schedule[date]['events'].append({
+                'sport': sport,
+                'title': f"{sport} - {event}",
+                'time': f"⏰ {time_est} EST",
+                'nations': [
+                    {'name': name, 'count': athletes, 'tier': tier or 3, 'confirmed': not unconfirmed}
+                    for name, athletes, unconfirmed, tier in nations
+                ]
+            })
+    
+    return schedule
+
+
 def save_schedule_data(data: dict, output_file: str = 'data/schedule-data.json'):
     """Save extracted schedule data to JSON."""
     with open(output_file, 'w', encoding='utf-8') as f:
@@ -110,9 +146,12 @@ def main():
         print(f"❌ File not found: {html_file}")
         return 1
     
-    print("📊 Extracting schedule data from HTML...")
-    
-    schedule = extract_schedule_data(html_file)
+    if Path('schedule_data/manifest.json').exists():
+        print("📊 Extracting schedule data from the day shards...")
+        schedule = extract_schedule_shards('schedule_data')
+    else:
+        print("📊 Extracting schedule data from HTML...")
+        schedule = extract_schedule_data(html_file)
     
     # Count stats
     total_events = sum(len(day['events']) for day in schedule.values())
@@ -2,11 +2,33 @@
 Generate comprehensive HTML overview page for 2026 Winter Olympics underdogs.
 """
 
+import argparse
+import hashlib
 import json
+import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Callable, Dict, List, Optional, Sequence, Set
 from datetime import datetime
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.snapshot import load_json
+from src.nation_table import NationTable, SOUTHERN_HEMISPHERE
+from src.underdog_criteria import CRITERIA, evaluate as evaluate_criteria
+from src.profiling import add_profiling_arguments, profiler_from_args, finish_profiling
+from src.templates import get_template, link_output, templates_digest, write_stream
+import src.nation_table
+import src.templates
+import src.underdog_criteria
+
+
+# Rendered page sections, keyed by a hash of the data each section reads.
+# Bump SECTION_CACHE_VERSION to discard every cached section.
+SECTION_CACHE_FILE = Path('.cache') / 'overview_sections.json'
+SECTION_CACHE_VERSION = 1
+
 
 class OlympicsHTMLGenerator:
     """Generates HTML overview page."""
@@ -40,12 +62,38 @@ class OlympicsHTMLGenerator:
     }
     
     # Nations below the equator (Southern Hemisphere)
-    SOUTHERN_HEMISPHERE = {
-        'AUS', 'NZL', 'RSA', 'BRA', 'CHI', 'ARG', 'URU', 'ECU', 'MAD'
+    SOUTHERN_HEMISPHERE = SOUTHERN_HEMISPHERE
+    
+    # Short criterion labels shown on nation cards
+    CARD_LABELS = {
+        'small_athletes': '< 5 athletes',
+        'no_olympic_gold': 'No Olympic gold',
+        'no_olympic_medals': 'No Olympic medals',
+        'no_winter_gold': 'No Winter gold',
+        'no_winter_medals': 'No Winter medals',
+        'southern_hemisphere': 'Southern Hemisphere'
     }
     
-    def __init__(self):
-        """Load all data files."""
+    # Tier -> (title, description, CSS class)
+    TIER_INFO = {
+        5: ('Tier 5: Ultimate Underdogs', 'Meet 6-7 criteria - the most compelling underdog stories', 'tier-5'),
+        4: ('Tier 4: Major Underdogs', 'Meet 4-5 criteria - exceptional underdog potential', 'tier-4'),
+        3: ('Tier 3: Strong Underdogs', 'Meet 3 criteria - significant underdog narratives', 'tier-3'),
+        2: ('Tier 2: Moderate Underdogs', 'Meet 2 criteria - notable underdog elements', 'tier-2'),
+        1: ('Tier 1: Mild Underdogs', 'Meet 1 criterion - emerging underdog stories', 'tier-1')
+    }
+    
+    def __init__(self, base_path: Optional[Path] = None, use_cache: bool = True):
+        """
+        Load all data files (from base_path, defaulting to the repository root).
+        
+        With use_cache, sections whose inputs are unchanged since the last run
+        are reused from the section cache instead of being re-rendered.
+        """
+        self.base_path = Path(base_path) if base_path else Path(__file__).parent.parent
+        self.use_cache = use_cache
+        self.section_cache = self._load_section_cache() if use_cache else {}
+        self.section_stats = {'cached': 0, 'rendered': 0}
         self.participating_nations = self._load_json('data/participating_nations_2026.json')
         self.athlete_counts = self._load_json('data/athlete_counts_2026.json')
         self.nation_sports = self._load_json('data/nation_sports_participation_2026.json')
@@ -54,17 +102,167 @@ class OlympicsHTMLGenerator:
         self.winter_medals = self._load_json('data/medals/winter_medals.json')
         self.all_time_medals = self._load_json('data/medals/all_time_medals.json')
         self.population = self._load_json('data/population/population.json')
+        
+        # Classify every participating nation once
+        self.nation_table = NationTable.from_sources(
+            medals=self.all_time_medals,
+            winter_medals=self.winter_medals,
+            population=self.population,
+            athletes=self.athlete_counts,
+            nations=self.participating_nations
+        )
+        self.criteria = evaluate_criteria(self.nation_table, self.participating_nations)
+        
+        # Schedule indexes read by every section (see _build_indexes)
+        self.sport_dates, self.day_underdogs = self._build_indexes()
+    
+    def _build_indexes(self):
+        """
+        Index the schedule once so sections scale with their output.
+        
+        Returns:
+            (sport -> sorted dates on the schedule,
+             date -> underdog IOC codes competing that day)
+        """
+        sport_dates: Dict[str, List[str]] = {}
+        day_underdogs: Dict[str, List[str]] = {}
+        for date in sorted(self.schedule.keys()):
+            day_underdogs[date] = []
+            for sport_info in self.schedule[date]['sports']:
+                dates = sport_dates.setdefault(sport_info['sport'], [])
+                if not dates or dates[-1] != date:
+                    dates.append(date)
+        
+        for nation in dict.fromkeys(self.criteria.underdogs()):
+            nation_days = set()
+            for sport in self.nation_sports.get(nation, {}):
+                nation_days.update(sport_dates.get(sport, ()))
+            for date in nation_days:
+                day_underdogs[date].append(nation)
+        
+        return sport_dates, day_underdogs
     
     def _load_json(self, filepath: str):
         """Load JSON file."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json(self.base_path / filepath)
         except FileNotFoundError:
             return {} if 'json' in filepath else []
     
-    def generate_html(self) -> str:
-        """Generate complete HTML page."""
+    def _section_cache_path(self) -> Path:
+        return self.base_path / SECTION_CACHE_FILE
+    
+    def _load_section_cache(self) -> Dict[str, Dict]:
+        """Load cached section HTML ({name: {key, html}})."""
+        try:
+            with open(self._section_cache_path(), 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if cache.get('version') != SECTION_CACHE_VERSION:
+            return {}
+        return cache.get('sections', {})
+    
+    def _save_section_cache(self):
+        """Write the section cache atomically."""
+        path = self._section_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': SECTION_CACHE_VERSION, 'sections': self.section_cache},
+                          f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not write section cache ({e})")
+    
+    def _render_section(self, name: str, inputs, render: Callable[[], str]) -> str:
+        """
+        Return a section's HTML, re-rendering only if its inputs changed.
+        
+        The cache key covers the inputs plus this file's source, so template
+        edits invalidate every section.
+        """
+        if not self.use_cache:
+            self.section_stats['rendered'] += 1
+            return render()
+        
+        encoded = json.dumps([name, inputs], ensure_ascii=False, default=str)
+        key = hashlib.sha256(_source_digest().encode('ascii') + encoded.encode('utf-8')).hexdigest()
+        
+        entry = self.section_cache.get(name)
+        if entry is not None and entry['key'] == key:
+            self.section_stats['cached'] += 1
+            return entry['html']
+        
+        html = render()
+        self.section_cache[name] = {'key': key, 'html': html}
+        self.section_stats['rendered'] += 1
+        return html
+    
+    def _render_sections(self, nation_data, sport_stats, underdog_stats) -> Dict[str, str]:
+        """Render (or reuse) every page section from only the data it reads."""
+        def card_fields(data: Dict) -> Dict:
+            return {key: data[key] for key in (
+                'name', 'sports', 'athlete_count', 'competing_days', 'underdog_criteria',
+                'underdog_tier', 'criteria_count', 'winter_medals', 'all_time_medals'
+            )}
+        
+        underdogs = [(nation, data) for nation, data in nation_data.items() if data['is_underdog']]
+        others = [(nation, data) for nation, data in nation_data.items() if not data['is_underdog']]
+        
+        sections = {
+            'overview': self._render_section(
+                'overview',
+                {
+                    'total_nations': len(self.participating_nations),
+                    'sports': list(sport_stats),
+                    'underdog_stats': underdog_stats,
+                    'tiers': [data.get('underdog_tier', 0) for data in nation_data.values()]
+                },
+                lambda: self._generate_overview_section(nation_data, sport_stats, underdog_stats)
+            ),
+            'criteria': self._render_section(
+                'criteria',
+                {
+                    'masks': list(zip(self.criteria.codes, self.criteria.masks)),
+                    'names': {nation: data['name'] for nation, data in nation_data.items()}
+                },
+                lambda: self._generate_underdog_criteria_section(underdog_stats, nation_data)
+            ),
+            'day_by_day': self._render_section(
+                'day_by_day',
+                {
+                    'schedule': self.schedule,
+                    'underdogs': [(nation, data['name'], list(self.nation_sports.get(nation, {})))
+                                  for nation, data in underdogs]
+                },
+                lambda: self._generate_day_by_day_section(nation_data)
+            ),
+            'sports_rankings': self._render_section(
+                'sports_rankings',
+                sport_stats,
+                lambda: self._generate_sports_rankings_section(sport_stats)
+            ),
+            'nations': self._render_section(
+                'nations',
+                [(nation, card_fields(data)) for nation, data in underdogs],
+                lambda: self._generate_nations_section(nation_data)
+            ),
+            'all_nations': self._render_section(
+                'all_nations',
+                [(nation, card_fields(data)) for nation, data in others],
+                lambda: self._generate_all_nations_section(nation_data)
+            ),
+        }
+        
+        if self.use_cache and self.section_stats['rendered']:
+            self._save_section_cache()
+        
+        return sections
+    
+    def generate_sections(self) -> Dict[str, str]:
+        """Calculate stats and render (or reuse) every page section."""
         
         # Calculate stats
         nation_data = self._calculate_nation_data()
@@ -74,759 +272,25 @@ class OlympicsHTMLGenerator:
         # Persist nation tiers mapping (Full Name -> Tier) for schedule page use
         try:
             tiers_map = { data['name']: data['underdog_tier'] for data in nation_data.values() }
-            out_path = Path(__file__).parent.parent / 'data' / 'nation_tiers_2026.json'
+            out_path = self.base_path / 'data' / 'nation_tiers_2026.json'
             with open(out_path, 'w', encoding='utf-8') as tf:
                 json.dump(tiers_map, tf, ensure_ascii=False, indent=2)
         except Exception:
             # Non-fatal: continue generating HTML even if tier export fails
             pass
         
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>2026 Winter Olympics - Underdog Nations Overview</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: #0f0f23;
-            color: #e0e0e0;
-            line-height: 1.6;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: #1a1a2e;
-            border-radius: 20px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.8);
-            overflow: hidden;
-        }}
-        
-        header {{
-            background: linear-gradient(135deg, #0f4c75 0%, #1b1b2f 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-            border-bottom: 3px solid #00d4ff;
-        }}
-        
-        h1 {{
-            font-size: 3em;
-            margin-bottom: 10px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
-            color: #00d4ff;
-        }}
-        
-        .subtitle {{
-            font-size: 1.2em;
-            opacity: 0.9;
-            color: #a8dadc;
-        }}
-        
-        .content {{
-            padding: 40px;
-        }}
-        
-        .section {{
-            margin-bottom: 50px;
-        }}
-        
-        h2 {{
-            color: #00d4ff;
-            font-size: 2em;
-            margin-bottom: 20px;
-            border-bottom: 3px solid #00d4ff;
-            padding-bottom: 10px;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        
-        .stat-card {{
-            background: linear-gradient(135deg, #16213e 0%, #0f3460 100%);
-            color: white;
-            padding: 25px;
-            border-radius: 15px;
-            text-align: center;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.5);
-            border: 2px solid #00d4ff;
-        }}
-        
-        .stat-number {{
-            font-size: 3em;
-            font-weight: bold;
-            margin: 10px 0;
-            color: #00d4ff;
-        }}
-        
-        .stat-label {{
-            font-size: 1.1em;
-            opacity: 0.9;
-        }}
-        
-        .accordion {{
-            background: #16213e;
-            border-radius: 10px;
-            margin-bottom: 10px;
-            border: 1px solid #2a2a40;
-        }}
-        
-        .accordion-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 15px 20px;
-            cursor: pointer;
-            background: #16213e;
-            border-radius: 10px;
-            transition: background 0.3s;
-        }}
-        
-        .accordion-header:hover {{
-            background: #1e2d50;
-        }}
-        
-        .accordion-title {{
-            font-weight: bold;
-            color: #00d4ff;
-            font-size: 1.1em;
-        }}
-        
-        .accordion-count {{
-            background: #00d4ff;
-            color: #0f0f23;
-            padding: 5px 15px;
-            border-radius: 20px;
-            font-weight: bold;
-        }}
-        
-        .accordion-content {{
-            max-height: 0;
-            overflow: hidden;
-            transition: max-height 0.3s ease-out;
-            background: #1a1a2e;
-        }}
-        
-        .accordion-content.active {{
-            max-height: 1000px;
-            padding: 20px;
-        }}
-        
-        .nations-list {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
-        
-        .nation-pill {{
-            background: #0f3460;
-            padding: 8px 15px;
-            border-radius: 20px;
-            border: 1px solid #00d4ff;
-            color: #e0e0e0;
-            font-size: 0.95em;
-        }}
-        
-        .day-tabs {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-bottom: 30px;
-        }}
-        
-        .day-tab {{
-            padding: 12px 20px;
-            background: #16213e;
-            border: 2px solid #2a2a40;
-            border-radius: 10px;
-            cursor: pointer;
-            transition: all 0.3s;
-            color: #a8dadc;
-        }}
-        
-        .day-tab:hover {{
-            border-color: #00d4ff;
-            transform: translateY(-2px);
-        }}
-        
-        .day-tab.active {{
-            background: #00d4ff;
-            color: #0f0f23;
-            border-color: #00d4ff;
-        }}
-        
-        .day-content {{
-            display: none;
-            background: #16213e;
-            padding: 30px;
-            border-radius: 15px;
-            border: 2px solid #00d4ff;
-        }}
-        
-        .day-content.active {{
-            display: block;
-            animation: fadeIn 0.3s;
-        }}
-        
-        @keyframes fadeIn {{
-            from {{ opacity: 0; }}
-            to {{ opacity: 1; }}
-        }}
-        
-        .sport-section {{
-            margin-bottom: 25px;
-            background: #1a1a2e;
-            padding: 20px;
-            border-radius: 10px;
-            border-left: 4px solid #00d4ff;
-        }}
-        
-        .sport-title {{
-            font-size: 1.3em;
-            color: #00d4ff;
-            margin-bottom: 15px;
-            font-weight: bold;
-        }}
-        
-        .underdog-nations {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
-        
-        .underdog-chip {{
-            background: #f39c12;
-            color: #0f0f23;
-            padding: 8px 15px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 0.95em;
-        }}
-        
-        .nations-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-        }}
-        
-        .nation-card {{
-            background: #16213e;
-            border-radius: 10px;
-            padding: 20px;
-            border: 2px solid #2a2a40;
-            transition: transform 0.3s, box-shadow 0.3s, border-color 0.3s;
-        }}
-        
-        .nation-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 10px 20px rgba(0,212,255,0.3);
-            border-color: #00d4ff;
-        }}
-        
-        .nation-card.underdog {{
-            border-color: #f39c12;
-            background: #1e2530;
-        }}
-        
-        .nation-header {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            margin-bottom: 15px;
-        }}
-        
-        .nation-name {{
-            font-size: 1.3em;
-            font-weight: bold;
-            color: #00d4ff;
-        }}
-        
-        .underdog-badge {{
-            background: #f39c12;
-            color: #0f0f23;
-            padding: 3px 8px;
-            border-radius: 5px;
-            font-size: 0.7em;
-            margin-left: auto;
-            font-weight: bold;
-        }}
-        
-        .tier-badge {{
-            padding: 5px 12px;
-            border-radius: 8px;
-            font-size: 0.85em;
-            font-weight: bold;
-            margin-left: 10px;
-        }}
-        
-        .tier-5 {{
-            background: #e74c3c;
-            color: white;
-            border: 2px solid #c0392b;
-        }}
-        
-        .tier-4 {{
-            background: #e67e22;
-            color: white;
-            border: 2px solid #d35400;
-        }}
-        
-        .tier-3 {{
-            background: #f39c12;
-            color: #0f0f23;
-            border: 2px solid #d68910;
-        }}
-        
-        .tier-2 {{
-            background: #f1c40f;
-            color: #0f0f23;
-            border: 2px solid #d4ac0d;
-        }}
-        
-        .tier-1 {{
-            background: #3498db;
-            color: white;
-            border: 2px solid #2980b9;
-        }}
-        
-        .tier-section {{
-            margin-bottom: 40px;
-            background: #16213e;
-            padding: 25px;
-            border-radius: 15px;
-            border-left: 5px solid;
-        }}
-        
-        .tier-section.tier-5 {{
-            border-left-color: #e74c3c;
-        }}
-        
-        .tier-section.tier-4 {{
-            border-left-color: #e67e22;
-        }}
-        
-        .tier-section.tier-3 {{
-            border-left-color: #f39c12;
-        }}
-        
-        .tier-section.tier-2 {{
-            border-left-color: #f1c40f;
-        }}
-        
-        .tier-section.tier-1 {{
-            border-left-color: #3498db;
-        }}
-        
-        .tier-header {{
-            display: flex;
-            align-items: center;
-            margin-bottom: 20px;
-        }}
-        
-        .tier-title {{
-            font-size: 1.8em;
-            font-weight: bold;
-            color: #00d4ff;
-        }}
-        
-        .tier-description {{
-            color: #a8dadc;
-            margin-bottom: 20px;
-            font-style: italic;
-        }}
-        
-        .nation-stats {{
-            display: flex;
-            gap: 15px;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-        }}
-        
-        .mini-stat {{
-            background: #1a1a2e;
-            padding: 8px 12px;
-            border-radius: 5px;
-            font-size: 0.9em;
-            color: #a8dadc;
-            border: 1px solid #2a2a40;
-        }}
-        
-        .sports-list {{
-            margin-top: 10px;
-        }}
-        
-        .sport-tag {{
-            display: inline-block;
-            background: #0f3460;
-            color: #00d4ff;
-            padding: 5px 10px;
-            border-radius: 5px;
-            margin: 3px;
-            font-size: 0.85em;
-            border: 1px solid #00d4ff;
-        }}
-        
-        .competing-days {{
-            margin-top: 10px;
-            font-size: 0.9em;
-            color: #a8dadc;
-        }}
-        
-        .criteria-text {{
-            color: white;
-            font-size: 0.9em;
-        }}
-        
-        .sport-rankings {{
-            background: #16213e;
-            padding: 20px;
-            border-radius: 10px;
-            border: 2px solid #2a2a40;
-        }}
-        
-        .sport-row {{
-            padding: 12px;
-            margin: 5px 0;
-            background: #1a1a2e;
-            border-radius: 5px;
-            transition: transform 0.2s, border-left 0.2s;
-            border-left: 3px solid transparent;
-        }}
-        
-        .sport-row:hover {{
-            transform: translateX(5px);
-            border-left-color: #00d4ff;
-        }}
-        
-        .sport-row[open] {{
-            border-left-color: #00d4ff;
-        }}
-
-        .sport-row summary {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            cursor: pointer;
-            list-style: none;
-        }}
-
-        .sport-row summary::-webkit-details-marker {{
-            display: none;
-        }}
-
-        .sport-name {{
-            font-weight: bold;
-            color: #e0e0e0;
-        }}
-        
-        .sport-count {{
-            background: #00d4ff;
-            color: #0f0f23;
-            padding: 5px 15px;
-            border-radius: 20px;
-            font-weight: bold;
-        }}
-
-        .sport-nations {{
-            margin-top: 12px;
-            padding-top: 10px;
-            border-top: 1px solid #2a2a40;
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-        }}
-
-        .sport-nation {{
-            background: #0f3460;
-            color: #00d4ff;
-            padding: 6px 10px;
-            border-radius: 16px;
-            border: 1px solid #00d4ff;
-            font-size: 0.9em;
-        }}
-        
-        footer {{
-            background: #0f0f23;
-            color: #a8dadc;
-            text-align: center;
-            padding: 20px;
-            margin-top: 40px;
-            border-top: 2px solid #00d4ff;
-        }}
-        
-        /* Mobile Responsive Styles */
-        @media (max-width: 768px) {{
-            body {{
-                padding: 10px;
-            }}
-            
-            .container {{
-                border-radius: 10px;
-            }}
-            
-            header {{
-                padding: 20px 15px;
-            }}
-            
-            h1 {{
-                font-size: 1.8em;
-                margin-bottom: 8px;
-            }}
-            
-            .subtitle {{
-                font-size: 0.9em;
-            }}
-            
-            .content {{
-                padding: 20px 15px;
-            }}
-            
-            h2 {{
-                font-size: 1.5em;
-                margin-bottom: 15px;
-            }}
-            
-            h3 {{
-                font-size: 1.2em;
-            }}
-            
-            .stats-grid {{
-                grid-template-columns: 1fr;
-                gap: 15px;
-            }}
-            
-            .stat-card {{
-                padding: 20px 15px;
-            }}
-            
-            .stat-number {{
-                font-size: 2.2em;
-            }}
-            
-            .stat-label {{
-                font-size: 1em;
-            }}
-            
-            .day-tabs {{
-                overflow-x: auto;
-                flex-wrap: nowrap;
-                -webkit-overflow-scrolling: touch;
-                scrollbar-width: thin;
-                scrollbar-color: #00d4ff #16213e;
-            }}
-            
-            .day-tabs::-webkit-scrollbar {{
-                height: 6px;
-            }}
-            
-            .day-tabs::-webkit-scrollbar-track {{
-                background: #16213e;
-                border-radius: 3px;
-            }}
-            
-            .day-tabs::-webkit-scrollbar-thumb {{
-                background: #00d4ff;
-                border-radius: 3px;
-            }}
-            
-            .day-tab {{
-                padding: 10px 15px;
-                font-size: 0.9em;
-                white-space: nowrap;
-                flex-shrink: 0;
-            }}
-            
-            .day-content {{
-                padding: 20px 15px;
-            }}
-            
-            .sport-section {{
-                padding: 15px;
-                margin-bottom: 20px;
-            }}
-            
-            .sport-title {{
-                font-size: 1.1em;
-            }}
-            
-            .nations-grid {{
-                grid-template-columns: 1fr;
-                gap: 15px;
-            }}
-            
-            .nation-card {{
-                padding: 15px;
-            }}
-            
-            .nation-name {{
-                font-size: 1.1em;
-            }}
-            
-            .nation-stats {{
-                gap: 10px;
-            }}
-            
-            .mini-stat {{
-                font-size: 0.85em;
-                padding: 6px 10px;
-            }}
-            
-            .sport-tag {{
-                font-size: 0.8em;
-                padding: 4px 8px;
-            }}
-            
-            .tier-badge {{
-                font-size: 0.75em;
-                padding: 4px 10px;
-            }}
-            
-            .tier-title {{
-                font-size: 1.4em;
-            }}
-            
-            .tier-description {{
-                font-size: 0.9em;
-            }}
-            
-            .accordion-header {{
-                padding: 12px 15px;
-            }}
-            
-            .accordion-title {{
-                font-size: 1em;
-            }}
-            
-            .accordion-count {{
-                font-size: 0.9em;
-                padding: 4px 12px;
-            }}
-            
-            .nations-list {{
-                gap: 8px;
-            }}
-            
-            .nation-pill {{
-                font-size: 0.85em;
-                padding: 6px 12px;
-            }}
-            
-            .underdog-chip {{
-                font-size: 0.85em;
-                padding: 6px 12px;
-            }}
-            
-            .sport-row {{
-                padding: 10px;
-                font-size: 0.9em;
-            }}
-            
-            .criteria-text {{
-                font-size: 0.85em;
-            }}
-            
-            footer {{
-                padding: 15px;
-                font-size: 0.9em;
-            }}
-        }}
-        
-        @media (max-width: 480px) {{
-            h1 {{
-                font-size: 1.5em;
-            }}
-            
-            .subtitle {{
-                font-size: 0.85em;
-            }}
-            
-            .stat-number {{
-                font-size: 1.8em;
-            }}
-            
-            .tier-title {{
-                font-size: 1.2em;
-            }}
-            
-            .day-tab {{
-                padding: 8px 12px;
-                font-size: 0.85em;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>🏂 2026 Winter Olympics</h1>
-            <div class="subtitle">Underdog Nations & Competition Overview</div>
-            <div class="subtitle">Milan-Cortina d'Ampezzo | February 6-22, 2026</div>
-            <div style="margin-top: 20px;">
-                <a href="schedule.html" style="display: inline-block; padding: 12px 30px; background: #00d4ff; color: #0f0f23; text-decoration: none; border-radius: 8px; font-weight: bold; transition: transform 0.2s;">📅 View Full Schedule</a>
-            </div>
-        </header>
-        
-        <div class="content">
-            {self._generate_overview_section(nation_data, sport_stats, underdog_stats)}
-            {self._generate_underdog_criteria_section(underdog_stats, nation_data)}
-            {self._generate_day_by_day_section(nation_data)}
-            {self._generate_sports_rankings_section(sport_stats)}
-            {self._generate_nations_section(nation_data)}
-            {self._generate_all_nations_section(nation_data)}
-        </div>
-        
-        <footer>
-            <p>Data compiled from Wikipedia and official Olympic sources</p>
-            <p>Generated {datetime.now().strftime('%B %d, %Y')}</p>
-        </footer>
-    </div>
+        return self._render_sections(nation_data, sport_stats, underdog_stats)
     
-    <script>
-        // Accordion functionality
-        document.querySelectorAll('.accordion-header').forEach(header => {{
-            header.addEventListener('click', () => {{
-                const content = header.nextElementSibling;
-                content.classList.toggle('active');
-            }});
-        }});
-        
-        // Day tab functionality
-        document.querySelectorAll('.day-tab').forEach(tab => {{
-            tab.addEventListener('click', () => {{
-                const targetDay = tab.dataset.day;
-                
-                // Remove active class from all tabs and contents
-                document.querySelectorAll('.day-tab').forEach(t => t.classList.remove('active'));
-                document.querySelectorAll('.day-content').forEach(c => c.classList.remove('active'));
-                
-                // Add active class to clicked tab and corresponding content
-                tab.classList.add('active');
-                document.getElementById('day-' + targetDay).classList.add('active');
-            }});
-        }});
-        
-        // Activate first day tab by default
-        if (document.querySelector('.day-tab')) {{
-            document.querySelector('.day-tab').click();
-        }}
-    </script>
-</body>
-</html>
-"""
-        return html
+    def generate_html(self) -> str:
+        """Generate complete HTML page."""
+        return ''.join(self.stream_html(self.generate_sections()))
+    
+    def stream_html(self, sections: Dict[str, str]):
+        """Yield the page in chunks: the precompiled shell around the rendered sections."""
+        return get_template('overview/page.html').stream(
+            generated_on=datetime.now().strftime('%B %d, %Y'),
+            **sections
+        )
     
     def _calculate_nation_data(self) -> Dict:
         """Calculate comprehensive data for each nation."""
@@ -839,51 +303,21 @@ class OlympicsHTMLGenerator:
             # Calculate which days they compete
             competing_days = self._get_competing_days(nation, sports)
             
-            # Check underdog status
-            underdog_criteria = []
-            
-            # Criterion 1: < 5 athletes
             athlete_count = self.athlete_counts.get(nation, 0)
-            if 1 <= athlete_count < 5:
-                underdog_criteria.append("< 5 athletes")
-            
-            # Criterion 2-3: Olympic medals
             all_time = self.all_time_medals.get(nation, {})
-            if all_time.get('gold', 0) == 0:
-                underdog_criteria.append("No Olympic gold")
-            if all_time.get('total', 0) == 0:
-                underdog_criteria.append("No Olympic medals")
-            
-            # Criterion 4: Population
-            pop = self.population.get(nation, float('inf'))
-            if pop < 1_000_000:
-                underdog_criteria.append(f"Pop: {pop:,}")
-            
-            # Criterion 5-6: Winter medals
             winter = self.winter_medals.get(nation, {})
-            if winter.get('gold', 0) == 0:
-                underdog_criteria.append("No Winter gold")
-            if winter.get('total', 0) == 0:
-                underdog_criteria.append("No Winter medals")
+            pop = self.population.get(nation, float('inf'))
             
-            # Criterion 7: Southern Hemisphere
-            if nation in self.SOUTHERN_HEMISPHERE:
-                underdog_criteria.append("Southern Hemisphere")
+            # Underdog status from the shared criteria engine
+            underdog_criteria = []
+            for key in self.criteria.criteria_keys(nation):
+                if key == 'small_population':
+                    underdog_criteria.append(f"Pop: {pop:,}")
+                else:
+                    underdog_criteria.append(self.CARD_LABELS[key])
             
-            # Calculate underdog tier (1-5, where 5 is ultimate underdog)
             criteria_count = len(underdog_criteria)
-            if criteria_count >= 6:
-                tier = 5  # Ultimate underdog (6-7 criteria)
-            elif criteria_count >= 4:
-                tier = 4  # Major underdogs (4-5 criteria)
-            elif criteria_count == 3:
-                tier = 3  # Strong underdogs (3 criteria)
-            elif criteria_count == 2:
-                tier = 2
-            elif criteria_count == 1:
-                tier = 1
-            else:
-                tier = 0  # Not an underdog
+            tier = self.criteria.tier(nation)
             
             nation_data[nation] = {
                 'ioc_code': nation,
@@ -913,11 +347,9 @@ class OlympicsHTMLGenerator:
         if 'competition_dates' in nation_schedule:
             return set(nation_schedule['competition_dates'])
         
-        # Fallback to schedule data
-        for date, day_data in self.schedule.items():
-            for sport_entry in day_data['sports']:
-                if sport_entry['sport'] in sports:
-                    days.add(date)
+        # Fallback to the days each of its sports is on the schedule
+        for sport in sports:
+            days.update(self.sport_dates.get(sport, ()))
         
         return days
     
@@ -940,68 +372,18 @@ class OlympicsHTMLGenerator:
     
     def _calculate_underdog_stats(self) -> Dict:
         """Calculate underdog statistics."""
-        stats = {
-            'total_underdogs': 0,
-            'by_criteria': {
-                'small_athletes': 0,
-                'no_olympic_gold': 0,
-                'no_olympic_medals': 0,
-                'small_population': 0,
-                'no_winter_gold': 0,
-                'no_winter_medals': 0,
-                'southern_hemisphere': 0
-            },
-            'ultimate_underdogs': []  # Nations meeting all criteria
+        return {
+            'total_underdogs': len(self.criteria.underdogs()),
+            'by_criteria': self.criteria.counts_by_criteria(),
+            # Nations meeting 6-7 criteria
+            'ultimate_underdogs': [
+                nation for nation in self.participating_nations
+                if self.criteria.tier(nation) == 5
+            ]
         }
-        
-        for nation in self.participating_nations:
-            criteria_count = 0
-            
-            athlete_count = self.athlete_counts.get(nation, 0)
-            if 1 <= athlete_count < 5:
-                stats['by_criteria']['small_athletes'] += 1
-                criteria_count += 1
-            
-            all_time = self.all_time_medals.get(nation, {})
-            if all_time.get('gold', 0) == 0:
-                stats['by_criteria']['no_olympic_gold'] += 1
-                criteria_count += 1
-            if all_time.get('total', 0) == 0:
-                stats['by_criteria']['no_olympic_medals'] += 1
-                criteria_count += 1
-            
-            pop = self.population.get(nation, float('inf'))
-            if pop < 1_000_000:
-                stats['by_criteria']['small_population'] += 1
-                criteria_count += 1
-            
-            winter = self.winter_medals.get(nation, {})
-            if winter.get('gold', 0) == 0:
-                stats['by_criteria']['no_winter_gold'] += 1
-                criteria_count += 1
-            if winter.get('total', 0) == 0:
-                stats['by_criteria']['no_winter_medals'] += 1
-                criteria_count += 1
-            
-            if nation in self.SOUTHERN_HEMISPHERE:
-                stats['by_criteria']['southern_hemisphere'] += 1
-                criteria_count += 1
-            
-            if criteria_count > 0:
-                stats['total_underdogs'] += 1
-            
-            if criteria_count >= 6:
-                stats['ultimate_underdogs'].append(nation)
-        
-        return stats
     
     def _generate_overview_section(self, nation_data, sport_stats, underdog_stats) -> str:
         """Generate overview statistics section."""
-        total_nations = len(self.participating_nations)
-        total_underdogs = underdog_stats['total_underdogs']
-        most_popular_sport = list(sport_stats.keys())[0] if sport_stats else "N/A"
-        least_popular_sport = list(sport_stats.keys())[-1] if sport_stats else "N/A"
-        
         # Calculate tier breakdown
         tier_counts = {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}
         for nation, data in nation_data.items():
@@ -1009,192 +391,80 @@ class OlympicsHTMLGenerator:
             if tier > 0:
                 tier_counts[tier] += 1
         
-        return f"""
-            <section class="section">
-                <h2>📊 Overview Statistics</h2>
-                <div class="stats-grid">
-                    <div class="stat-card">
-                        <div class="stat-label">Participating Nations</div>
-                        <div class="stat-number">{total_nations}</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-label">Underdog Nations</div>
-                        <div class="stat-number">{total_underdogs}</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-label">Total Sports</div>
-                        <div class="stat-number">{len(sport_stats)}</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-label">Ultimate Underdogs (Tier 5)</div>
-                        <div class="stat-number">{len(underdog_stats['ultimate_underdogs'])}</div>
-                        <div style="font-size: 0.9em; margin-top: 10px;">
-                            {', '.join([self.NATION_NAMES.get(n, n) for n in underdog_stats['ultimate_underdogs']])}
-                        </div>
-                    </div>
-                </div>
-                
-                <h3 style="color: #00d4ff; margin-top: 30px; margin-bottom: 15px;">🎯 Underdog Tier Breakdown</h3>
-                <div class="stats-grid">
-                    <div class="stat-card" style="background: linear-gradient(135deg, #c0392b 0%, #e74c3c 100%);">
-                        <div class="stat-label">Tier 5 (6-7 criteria)</div>
-                        <div class="stat-number">{tier_counts[5]}</div>
-                        <div style="font-size: 0.85em; margin-top: 5px;">Ultimate Underdogs</div>
-                    </div>
-                    <div class="stat-card" style="background: linear-gradient(135deg, #d35400 0%, #e67e22 100%);">
-                        <div class="stat-label">Tier 4 (4-5 criteria)</div>
-                        <div class="stat-number">{tier_counts[4]}</div>
-                        <div style="font-size: 0.85em; margin-top: 5px;">Major Underdogs</div>
-                    </div>
-                    <div class="stat-card" style="background: linear-gradient(135deg, #d68910 0%, #f39c12 100%);">
-                        <div class="stat-label">Tier 3 (3 criteria)</div>
-                        <div class="stat-number">{tier_counts[3]}</div>
-                        <div style="font-size: 0.85em; margin-top: 5px;">Strong Underdogs</div>
-                    </div>
-                    <div class="stat-card" style="background: linear-gradient(135deg, #d4ac0d 0%, #f1c40f 100%); color: #0f0f23;">
-                        <div class="stat-label" style="color: #0f0f23;">Tier 2 (2 criteria)</div>
-                        <div class="stat-number" style="color: #0f0f23;">{tier_counts[2]}</div>
-                        <div style="font-size: 0.85em; margin-top: 5px;">Moderate Underdogs</div>
-                    </div>
-                    <div class="stat-card" style="background: linear-gradient(135deg, #2980b9 0%, #3498db 100%);">
-                        <div class="stat-label">Tier 1 (1 criterion)</div>
-                        <div class="stat-number">{tier_counts[1]}</div>
-                        <div style="font-size: 0.85em; margin-top: 5px;">Mild Underdogs</div>
-                    </div>
-                </div>
-            </section>
-        """
+        return get_template('overview/stats_section.html').render(
+            total_nations=len(self.participating_nations),
+            total_underdogs=underdog_stats['total_underdogs'],
+            sport_count=len(sport_stats),
+            ultimate_count=len(underdog_stats['ultimate_underdogs']),
+            ultimate_names=', '.join([self.NATION_NAMES.get(n, n) for n in underdog_stats['ultimate_underdogs']]),
+            **{f'tier_{tier}_count': count for tier, count in tier_counts.items()}
+        )
     
     def _generate_underdog_criteria_section(self, underdog_stats, nation_data) -> str:
         """Generate underdog criteria breakdown with interactive accordions."""
-        criteria = underdog_stats['by_criteria']
-        
-        # Map criteria to nation lists
-        criteria_nations = {
-            'small_athletes': [],
-            'no_olympic_gold': [],
-            'no_olympic_medals': [],
-            'small_population': [],
-            'no_winter_gold': [],
-            'no_winter_medals': [],
-            'southern_hemisphere': []
-        }
-        
-        for ioc, nation_info in nation_data.items():
-            athletes = nation_info.get('athlete_count', 0)
-            
-            if athletes < 5:
-                criteria_nations['small_athletes'].append(ioc)
-            
-            all_time = self.all_time_medals.get(ioc, {})
-            if all_time.get('gold', 0) == 0:
-                criteria_nations['no_olympic_gold'].append(ioc)
-            if all_time.get('total', 0) == 0:
-                criteria_nations['no_olympic_medals'].append(ioc)
-            
-            pop = self.population.get(ioc, float('inf'))
-            if pop < 1_000_000:
-                criteria_nations['small_population'].append(ioc)
-            
-            winter = self.winter_medals.get(ioc, {})
-            if winter.get('gold', 0) == 0:
-                criteria_nations['no_winter_gold'].append(ioc)
-            if winter.get('total', 0) == 0:
-                criteria_nations['no_winter_medals'].append(ioc)
-            
-            if ioc in self.SOUTHERN_HEMISPHERE:
-                criteria_nations['southern_hemisphere'].append(ioc)
-        
-        criteria_info = [
-            ('small_athletes', '< 5 Athletes'),
-            ('no_olympic_gold', 'No Olympic Gold Medals'),
-            ('no_olympic_medals', 'No Olympic Medals'),
-            ('small_population', 'Population Under 1M'),
-            ('no_winter_gold', 'No Winter Olympic Gold'),
-            ('no_winter_medals', 'No Winter Olympic Medals'),
-            ('southern_hemisphere', 'Southern Hemisphere (Below Equator)')
-        ]
-        
-        html = '<section class="section">\n'
-        html += '<h2>🎯 Underdog Criteria Breakdown</h2>\n'
-        
-        for key, label in criteria_info:
-            nations = sorted(criteria_nations[key])
-            count = len(nations)
-            
-            html += f'''
-            <div class="accordion">
-                <div class="accordion-header">
-                    <div class="accordion-title">{label}</div>
-                    <div class="accordion-count">{count} nations</div>
-                </div>
-                <div class="accordion-content">
-                    <div class="nations-list">
-            '''
-            
-            for ioc_code in nations:
-                name = nation_data[ioc_code]['name'] if ioc_code in nation_data else self.NATION_NAMES.get(ioc_code, ioc_code)
-                
-                html += f'<div class="nation-pill">{name}</div>\n'
-            
-            html += '''
-                    </div>
-                </div>
-            </div>
-            '''
-        
-        html += '</section>\n'
-        return html
+        accordion = get_template('overview/accordion.html')
+        nation_pill = get_template('overview/nation_pill.html')
+        
+        items = []
+        for flag, key, label in CRITERIA:
+            nations = sorted(self.criteria.nations_meeting(flag))
+            names = [
+                nation_data[ioc_code]['name'] if ioc_code in nation_data else self.NATION_NAMES.get(ioc_code, ioc_code)
+                for ioc_code in nations
+            ]
+            items.append(accordion.render(label=label, count=len(nations),
+                                          nations=nation_pill.render_list(names)))
+        
+        return get_template('overview/criteria_section.html').render(criteria=''.join(items))
     
     def _generate_sports_rankings_section(self, sport_stats) -> str:
         """Generate sports popularity rankings (underdog nations only)."""
-        html = """
-            <section class="section">
-                <h2>🏅 Sports by Number of Underdog Nations</h2>
-                <div class="sport-rankings">
-        """
+        sport_row = get_template('overview/sport_row.html')
+        sport_nation = get_template('overview/sport_nation.html')
         
+        rows = []
         for sport, nations in sport_stats.items():
-            nation_names = sorted([self.NATION_NAMES.get(n, n) for n in nations])
-            html += """
-                    <details class="sport-row">
-                        <summary>
-                            <span class="sport-name">{sport}</span>
-                            <span class="sport-count">{count} underdog nations</span>
-                        </summary>
-                        <div class="sport-nations">
-            """.format(sport=sport, count=len(nations))
-            
-            if nation_names:
-                for name in nation_names:
-                    html += f"<span class=\"sport-nation\">{name}</span>"
-            else:
-                html += "<span class=\"sport-nation\">No underdog nations</span>"
-            
-            html += """
-                        </div>
-                    </details>
-            """
+            nation_names = sorted([self.NATION_NAMES.get(n, n) for n in nations]) or ['No underdog nations']
+            rows.append(sport_row.render(
+                sport=sport, count=len(nations),
+                nations=sport_nation.render_list(nation_names)
+            ))
         
-        html += """
-                </div>
-            </section>
-        """
-        
-        return html
+        return get_template('overview/sports_section.html').render(sports=''.join(rows))
+    
+    def _render_nation_card(self, nation: str, data: Dict, tier_class: str = '') -> str:
+        """Render one nation card (shared by the tier and other-nations sections)."""
+        competing_days_str = f"{len(data['competing_days'])} days"
+        if data['competing_days']:
+            first_day = datetime.strptime(data['competing_days'][0], '%Y-%m-%d').strftime('%b %d')
+            last_day = datetime.strptime(data['competing_days'][-1], '%Y-%m-%d').strftime('%b %d')
+            competing_days_str += f" ({first_day} - {last_day})"
+        
+        badge = ''
+        criteria_html = ''
+        if tier_class:
+            badge = get_template('overview/tier_badge.html').render(
+                tier_class=tier_class, tier=data['underdog_tier']
+            )
+            if data['underdog_criteria']:
+                criteria_html = '<br><span class="criteria-text">🎯 ' + ', '.join(data['underdog_criteria']) + '</span>'
+        
+        return get_template('overview/nation_card.html').render(
+            card_class=' underdog' if tier_class else '',
+            name=self.NATION_NAMES.get(nation, nation),
+            badge=badge,
+            athlete_count=data['athlete_count'],
+            winter_medals=data['winter_medals'],
+            all_time_medals=data['all_time_medals'],
+            competing_days=competing_days_str,
+            sports=get_template('overview/sport_tag.html').render_list(data['sports']),
+            criteria=criteria_html
+        )
     
     def _generate_nations_section(self, nation_data) -> str:
         """Generate nations grouped by tier."""
-        html = '<section class="section">\n'
-        html += '<h2>🏅 Nations by Underdog Tier</h2>\n'
-        
-        tier_info = {
-            5: ('Tier 5: Ultimate Underdogs', 'Meet 6-7 criteria - the most compelling underdog stories', 'tier-5'),
-            4: ('Tier 4: Major Underdogs', 'Meet 4-5 criteria - exceptional underdog potential', 'tier-4'),
-            3: ('Tier 3: Strong Underdogs', 'Meet 3 criteria - significant underdog narratives', 'tier-3'),
-            2: ('Tier 2: Moderate Underdogs', 'Meet 2 criteria - notable underdog elements', 'tier-2'),
-            1: ('Tier 1: Mild Underdogs', 'Meet 1 criterion - emerging underdog stories', 'tier-1')
-        }
+        tier_info = self.TIER_INFO
+        tier_section = get_template('overview/tier_section.html')
         
         # Group nations by tier
         nations_by_tier = {5: [], 4: [], 3: [], 2: [], 1: []}
@@ -1204,60 +474,21 @@ class OlympicsHTMLGenerator:
                 nations_by_tier[tier].append((nation, data))
         
         # Generate sections for each tier (5 to 1)
+        tiers = []
         for tier in [5, 4, 3, 2, 1]:
             if not nations_by_tier[tier]:
                 continue
-                
+            
             title, description, tier_class = tier_info[tier]
             nations = sorted(nations_by_tier[tier], key=lambda x: (-x[1]['criteria_count'], x[1]['name']))
             
-            html += f'<div class="tier-section {tier_class}">\n'
-            html += '<div class="tier-header">\n'
-            html += f'<div class="tier-title">{title}</div>\n'
-            html += f'<span class="tier-badge {tier_class}">TIER {tier}</span>\n'
-            html += '</div>\n'
-            html += f'<div class="tier-description">{description} ({len(nations)} nations)</div>\n'
-            html += '<div class="nations-grid">\n'
-            
-            for nation, data in nations:
-                nation_name = self.NATION_NAMES.get(nation, nation)
-                
-                sports_html = ''.join([f'<span class="sport-tag">{sport}</span>' for sport in data['sports']])
-                
-                competing_days_str = f"{len(data['competing_days'])} days"
-                if data['competing_days']:
-                    first_day = datetime.strptime(data['competing_days'][0], '%Y-%m-%d').strftime('%b %d')
-                    last_day = datetime.strptime(data['competing_days'][-1], '%Y-%m-%d').strftime('%b %d')
-                    competing_days_str += f" ({first_day} - {last_day})"
-                
-                criteria_html = ''
-                if data['underdog_criteria']:
-                    criteria_html = '<br><span class="criteria-text">🎯 ' + ', '.join(data['underdog_criteria']) + '</span>'
-                
-                html += f"""
-                    <div class="nation-card underdog">
-                        <div class="nation-header">
-                            <span class="nation-name">{nation_name}</span>
-                            <span class="tier-badge {tier_class}">T{tier}</span>
-                        </div>
-                        <div class="nation-stats">
-                            <div class="mini-stat">👥 {data['athlete_count']} athletes</div>
-                            <div class="mini-stat">🏆 {data['winter_medals']} Winter medals</div>
-                            <div class="mini-stat">🥇 {data['all_time_medals']} All-time medals</div>
-                        </div>
-                        <div class="competing-days">📅 Competing: {competing_days_str}</div>
-                        <div class="sports-list">
-                            {sports_html}
-                        </div>
-                        {criteria_html}
-                    </div>
-                """
-            
-            html += '</div>\n'
-            html += '</div>\n'
+            tiers.append(tier_section.render(
+                tier_class=tier_class, title=title, tier=tier,
+                description=description, count=len(nations),
+                cards=''.join(self._render_nation_card(nation, data, tier_class) for nation, data in nations)
+            ))
         
-        html += '</section>\n'
-        return html
+        return get_template('overview/tiers_section.html').render(tiers=''.join(tiers))
     
     def _generate_all_nations_section(self, nation_data) -> str:
         """Generate all nations including non-underdogs."""
@@ -1267,41 +498,11 @@ class OlympicsHTMLGenerator:
         if not non_underdogs:
             return ""
         
-        html = '<section class="section">\n'
-        html += '<h2>🌍 Other Participating Nations</h2>\n'
-        html += '<div class="nations-grid">\n'
-        
-        for nation, data in sorted(non_underdogs, key=lambda x: -x[1]['athlete_count']):
-            nation_name = self.NATION_NAMES.get(nation, nation)
-            
-            sports_html = ''.join([f'<span class="sport-tag">{sport}</span>' for sport in data['sports']])
-            
-            competing_days_str = f"{len(data['competing_days'])} days"
-            if data['competing_days']:
-                first_day = datetime.strptime(data['competing_days'][0], '%Y-%m-%d').strftime('%b %d')
-                last_day = datetime.strptime(data['competing_days'][-1], '%Y-%m-%d').strftime('%b %d')
-                competing_days_str += f" ({first_day} - {last_day})"
-            
-            html += f"""
-                <div class="nation-card">
-                    <div class="nation-header">
-                        <span class="nation-name">{nation_name}</span>
-                    </div>
-                    <div class="nation-stats">
-                        <div class="mini-stat">👥 {data['athlete_count']} athletes</div>
-                        <div class="mini-stat">🏆 {data['winter_medals']} Winter medals</div>
-                        <div class="mini-stat">🥇 {data['all_time_medals']} All-time medals</div>
-                    </div>
-                    <div class="competing-days">📅 Competing: {competing_days_str}</div>
-                    <div class="sports-list">
-                        {sports_html}
-                    </div>
-                </div>
-            """
-        
-        html += '</div>\n'
-        html += '</section>\n'
-        return html
+        cards = ''.join(
+            self._render_nation_card(nation, data)
+            for nation, data in sorted(non_underdogs, key=lambda x: -x[1]['athlete_count'])
+        )
+        return get_template('overview/other_nations_section.html').render(cards=cards)
     
     def _generate_calendar_section(self) -> str:
         """Generate day-by-day calendar."""
@@ -1340,48 +541,29 @@ class OlympicsHTMLGenerator:
     def _generate_day_by_day_section(self, nation_data) -> str:
         """Generate interactive day-by-day view with underdog nations."""
         
-        # Build map of date -> underdog nations competing
-        day_underdogs = {}
-        for date in sorted(self.schedule.keys()):
-            day_underdogs[date] = []
-            
-            # Get sports for this day
-            day_sports = set()
-            for sport_info in self.schedule[date]['sports']:
-                sport_name = sport_info['sport']
-                day_sports.add(sport_name)
-            
-            # Find underdog nations competing in these sports
-            for nation_info in nation_data.values():
-                if nation_info['is_underdog']:
-                    ioc = nation_info['ioc_code']
-                    # Check if this nation competes in any sport on this day
-                    nation_sports = set(self.nation_sports.get(ioc, {}).keys())
-                    if nation_sports.intersection(day_sports):
-                        day_underdogs[date].append(nation_info)
+        dates = sorted(self.schedule.keys())
+        date_objs = {date: datetime.strptime(date, '%Y-%m-%d') for date in dates}
         
-        html = '<section class="section">\n'
-        html += '<h2>📅 Daily Competition Schedule & Underdog Nations</h2>\n'
-        html += '<div class="day-tabs">\n'
+        day_tab = get_template('overview/day_tab.html')
+        day_content = get_template('overview/day_content.html')
+        sports_block = get_template('overview/day_sports.html')
+        sport_tag = get_template('overview/day_sport_tag.html')
+        underdog_chip = get_template('overview/underdog_chip.html')
         
         # Generate tabs for each day
-        for date in sorted(self.schedule.keys()):
-            date_obj = datetime.strptime(date, '%Y-%m-%d')
-            tab_label = date_obj.strftime('%b %d')
-            html += f'<div class="day-tab" data-day="{date}">{tab_label}</div>\n'
-        
-        html += '</div>\n'
+        tabs = day_tab.render_each(
+            {'date': date, 'label': date_objs[date].strftime('%b %d')}
+            for date in dates
+        )
         
         # Generate content for each day
-        for date in sorted(self.schedule.keys()):
-            date_obj = datetime.strptime(date, '%Y-%m-%d')
-            date_header = date_obj.strftime('%A, %B %d, %Y')
+        days = []
+        for date in dates:
+            date_obj = date_objs[date]
             
             day_data = self.schedule[date]
-            underdogs = day_underdogs[date]
-            
-            html += f'<div class="day-content" id="day-{date}">\n'
-            html += f'<h3 style="color: #00d4ff; margin-bottom: 20px;">{date_header}</h3>\n'
+            # Underdog nations competing in any of the day's sports
+            underdogs = [nation_data[nation] for nation in self.day_underdogs[date]]
             
             # Group sports by type
             regular_events = []
@@ -1397,68 +579,116 @@ class OlympicsHTMLGenerator:
                     regular_events.append(sport_name)
             
             # Display events
+            blocks = []
             if medal_events:
-                html += '<div class="sport-section">\n'
-                html += '<div class="sport-title">🥇 Medal Events</div>\n'
-                html += '<div class="day-sports">\n'
-                for sport in medal_events:
-                    html += f'<span class="sport-tag">{sport}</span>\n'
-                html += '</div>\n</div>\n'
+                blocks.append(sports_block.render(
+                    title='🥇 Medal Events',
+                    tags=sport_tag.render_list(medal_events)
+                ))
             
             if regular_events:
-                html += '<div class="sport-section">\n'
-                html += '<div class="sport-title">🏂 Competition Events</div>\n'
-                html += '<div class="day-sports">\n'
-                for sport in regular_events:
-                    html += f'<span class="sport-tag">{sport}</span>\n'
-                html += '</div>\n</div>\n'
+                blocks.append(sports_block.render(
+                    title='🏂 Competition Events',
+                    tags=sport_tag.render_list(regular_events)
+                ))
             
             # Display underdog nations
             if underdogs:
-                html += '<div class="sport-section">\n'
-                html += f'<div class="sport-title">⭐ Underdog Nations Competing ({len(underdogs)})</div>\n'
-                html += '<div class="underdog-nations">\n'
-                
-                for nation_info in sorted(underdogs, key=lambda x: x['name']):
-                    name = nation_info['name']
-                    html += f'<div class="underdog-chip">{name}</div>\n'
-                
-                html += '</div>\n</div>\n'
+                chips = underdog_chip.render_list(
+                    nation_info['name'] for nation_info in sorted(underdogs, key=lambda x: x['name'])
+                )
+                blocks.append(get_template('overview/day_underdogs.html').render(
+                    count=len(underdogs), chips=chips
+                ))
             else:
-                html += '<p style="color: #a8dadc; font-style: italic;">No underdog nations competing on this day.</p>\n'
+                blocks.append(get_template('overview/day_no_underdogs.html').render())
             
-            html += '</div>\n'
+            days.append(day_content.render(
+                date=date, header=date_obj.strftime('%A, %B %d, %Y'), blocks=''.join(blocks)
+            ))
         
-        html += '</section>\n'
-        return html
+        return get_template('overview/day_by_day_section.html').render(tabs=tabs, days=''.join(days))
     
-    def save(self, filepath: str):
-        """Generate and save HTML file."""
-        html = self.generate_html()
-        
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    def save(self, filepath: str, html: Optional[str] = None,
+             sections: Optional[Dict[str, str]] = None, links: Sequence[str] = ()):
+        """
+        Save the HTML page, streaming it to disk unless already rendered.
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html)
+        Args:
+            filepath: Output file
+            html: Complete page, if already rendered
+            sections: Rendered sections (from generate_sections) to stream into the page shell
+            links: Extra file names to publish the same page under (hard link, or copy)
+        """
+        if html is not None:
+            write_stream(filepath, [html])
+        else:
+            write_stream(filepath, self.stream_html(sections or self.generate_sections()))
         
         print(f"✓ HTML page generated: {filepath}")
+        
+        for link in links:
+            link_output(filepath, link)
+            print(f"✓ Linked {link} -> {filepath}")
+
+
+_SOURCE_DIGEST: Optional[str] = None
+
+
+def _source_digest() -> str:
+    """
+    SHA-256 of this file, its templates and the src modules the sections render
+    from (criteria labels and tiers, hemisphere list, template engine), so cached
+    sections expire when any of them changes.
+    """
+    global _SOURCE_DIGEST
+    if _SOURCE_DIGEST is None:
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        for module in (src.underdog_criteria, src.nation_table, src.templates):
+            digest.update(Path(module.__file__).read_bytes())
+        digest.update(templates_digest('overview').encode('ascii'))
+        _SOURCE_DIGEST = digest.hexdigest()
+    return _SOURCE_DIGEST
 
 
 def main():
     """Main function."""
+    parser = argparse.ArgumentParser(description='Generate the Winter Olympics overview HTML page')
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-render every section instead of reusing unchanged ones'
+    )
+    parser.add_argument(
+        '--index',
+        action='store_true',
+        help='Also publish the page as index.html (linked to the same file, not a second copy)'
+    )
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+    profiler = profiler_from_args(args, 'overview')
+    
     print("=" * 70)
     print("Generating 2026 Winter Olympics Overview HTML")
     print("=" * 70)
     print()
     
-    generator = OlympicsHTMLGenerator()
+    with profiler.stage('load_data'):
+        generator = OlympicsHTMLGenerator(use_cache=not args.no_cache)
+    with profiler.stage('render'):
+        sections = generator.generate_sections()
+    stats = generator.section_stats
+    print(f"Sections: {stats['rendered']} rendered, {stats['cached']} reused from cache")
     output_file = 'olympics_overview.html'
-    generator.save(output_file)
+    with profiler.stage('save'):
+        generator.save(output_file, sections=sections, links=['index.html'] if args.index else [])
     
     print()
     print("=" * 70)
     print(f"✓ Complete! Open {output_file} in your browser.")
     print("=" * 70)
+    
+    finish_profiling(profiler, args)
 
 
 if __name__ == '__main__':
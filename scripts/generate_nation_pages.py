@@ -0,0 +1,250 @@
+"""
+Generate one lightweight static page per participating nation.
+
+Each page (nations/<IOC code>.html) shows the nation's tier, underdog
+criteria, sports and events by date, so a single nation can be shared
+without the full overview page. All data is loaded once; pages render in a
+forked process pool and only nations whose data changed since the last run
+are rebuilt (tracked in nations/.manifest.json).
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.profiling import StageProfiler, add_profiling_arguments, profiler_from_args, finish_profiling
+from src.templates import get_template, templates_digest, write_stream
+from generate_html_overview import OlympicsHTMLGenerator
+from generate_schedule_html import MAYBE_SPORTS
+
+
+NATIONS_DIR = 'nations'
+
+# Build manifest recording the input hash of every generated page.
+# Bump MANIFEST_VERSION whenever the page data changes shape.
+MANIFEST_FILE = '.manifest.json'
+MANIFEST_VERSION = 1
+
+
+class NationPageGenerator:
+    """Renders per-nation pages from the overview generator's nation data."""
+    
+    def __init__(self, base_path: Optional[Path] = None,
+                 profiler: Optional[StageProfiler] = None):
+        """Load every data file once (from base_path, defaulting to the repository root)."""
+        self.profiler = profiler or StageProfiler('nation_pages')
+        with self.profiler.stage('load_data'):
+            self.overview = OlympicsHTMLGenerator(base_path, use_cache=False)
+            self.nation_data = self.overview._calculate_nation_data()
+        self.output_dir = self.overview.base_path / NATIONS_DIR
+    
+    def get_schedule(self, nation: str) -> Dict:
+        """Return the nation's entry in nation_schedules (keyed by full name)."""
+        schedules = self.overview.nation_schedules
+        return schedules.get(self.nation_data[nation]['name'], schedules.get(nation, {}))
+    
+    def compute_input_hash(self, nation: str) -> str:
+        """Hash everything a nation's page is rendered from."""
+        payload = json.dumps(
+            [MANIFEST_VERSION, _source_digest(), self.nation_data[nation], self.get_schedule(nation)],
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def render_page(self, nation: str) -> str:
+        """Render the page for one nation."""
+        data = self.nation_data[nation]
+        schedule = self.get_schedule(nation)
+        
+        badge = ''
+        tier = data['underdog_tier']
+        if tier > 0:
+            badge = get_template('nation/tier_badge.html').render(
+                tier=tier, title=self.overview.TIER_INFO[tier][0]
+            )
+        
+        criteria = ''
+        if data['underdog_criteria']:
+            criteria = get_template('nation/criteria.html').render(
+                count=data['criteria_count'],
+                items=get_template('nation/criterion.html').render_list(data['underdog_criteria'])
+            )
+        
+        sports = sorted(set(data['sports']) | set(schedule.get('sports', [])))
+        
+        day = get_template('nation/day.html')
+        event_row = get_template('nation/event.html')
+        days = []
+        for date, events in sorted(schedule.get('events_by_date', {}).items()):
+            rows = []
+            for event in sorted(events, key=lambda x: x.get('time_est', '')):
+                status = event.get('status', '')
+                unconfirmed = status == 'unconfirmed' or (
+                    status == 'probable' and event['sport'] in MAYBE_SPORTS
+                )
+                rows.append({
+                    'status_class': 'unconfirmed' if unconfirmed else '',
+                    'status_icon': '?' if unconfirmed else '✓',
+                    'time_est': event.get('time_est', ''),
+                    'sport': event['sport'],
+                    'event': event['event'],
+                    'athletes': event.get('athletes', '')
+                })
+            days.append(day.render(
+                date_str=datetime.strptime(date, '%Y-%m-%d').strftime('%A, %B %d'),
+                events=event_row.render_each(rows)
+            ))
+        
+        return get_template('nation/page.html').render(
+            name=data['name'],
+            code=nation,
+            badge=badge,
+            athlete_count=data['athlete_count'],
+            sport_count=len(sports),
+            day_count=len(data['competing_days']),
+            winter_medals=data['winter_medals'],
+            all_time_medals=data['all_time_medals'],
+            criteria=criteria,
+            sports=get_template('nation/sport_tag.html').render_list(sports),
+            days=''.join(days) or get_template('nation/no_events.html').render()
+        )
+    
+    def load_manifest(self) -> Dict[str, str]:
+        """Load the build manifest (IOC code -> input hash) from the last run."""
+        try:
+            with open(self.output_dir / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if manifest.get('version') != MANIFEST_VERSION:
+            return {}
+        return manifest.get('pages', {})
+    
+    def save_manifest(self, pages: Dict[str, str]):
+        """Persist the build manifest."""
+        manifest = {'version': MANIFEST_VERSION, 'pages': dict(sorted(pages.items()))}
+        write_stream(self.output_dir / MANIFEST_FILE, [json.dumps(manifest, indent=2)])
+    
+    def generate_all(self, workers: int = 1, force: bool = False) -> Dict[str, int]:
+        """
+        Write the page of every nation whose data changed since the last run.
+        
+        Args:
+            workers: Number of processes to render pages with (forked, so the
+                loaded data is shared rather than reloaded per worker)
+            force: Rebuild every page regardless of the manifest
+        
+        Returns:
+            Counts of 'rendered', 'skipped' and 'removed' pages
+        """
+        profiler = self.profiler
+        nations = list(self.nation_data)
+        
+        with profiler.stage('input_hashing'):
+            manifest = {} if force else self.load_manifest()
+            input_hashes = {nation: self.compute_input_hash(nation) for nation in nations}
+            stale = [
+                nation for nation in nations
+                if manifest.get(nation) != input_hashes[nation]
+                or not (self.output_dir / f"{nation}.html").exists()
+            ]
+        
+        with profiler.stage('render'):
+            if len(stale) > 1 and workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+                pages = self._render_parallel(stale, workers)
+            else:
+                if workers > 1 and len(stale) > 1:
+                    print("Warning: Parallel generation needs the 'fork' start method; rendering serially.")
+                pages = {nation: self.render_page(nation) for nation in stale}
+        
+        with profiler.stage('save'):
+            for nation, html in pages.items():
+                write_stream(self.output_dir / f"{nation}.html", [html])
+            
+            # Drop pages of nations no longer participating
+            removed = 0
+            if self.output_dir.exists():
+                for path in self.output_dir.glob('*.html'):
+                    if path.stem not in input_hashes:
+                        path.unlink()
+                        removed += 1
+            
+            if stale or removed or set(manifest) != set(input_hashes):
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                self.save_manifest(input_hashes)
+        
+        return {'rendered': len(stale), 'skipped': len(nations) - len(stale), 'removed': removed}
+    
+    def _render_parallel(self, nations: List[str], workers: int) -> Dict[str, str]:
+        """Render pages across a forked process pool."""
+        global _fork_generator
+        _fork_generator = self
+        try:
+            context = multiprocessing.get_context('fork')
+            with context.Pool(processes=min(workers, len(nations))) as pool:
+                rendered = pool.map(_render_nation, nations, chunksize=max(1, len(nations) // (workers * 4)))
+        finally:
+            _fork_generator = None
+        
+        return dict(zip(nations, rendered))
+
+
+# Generator inherited by forked worker processes (read-only in the workers)
+_fork_generator: Optional[NationPageGenerator] = None
+
+
+def _render_nation(nation: str) -> str:
+    """Render one nation's page in a worker process."""
+    return _fork_generator.render_page(nation)
+
+
+_SOURCE_DIGEST: Optional[str] = None
+
+
+def _source_digest() -> str:
+    """
+    Hash of this module, the nation templates and the settings imported from
+    the other generators (tier titles, ✓/? sports); part of every input hash.
+    """
+    global _SOURCE_DIGEST
+    if _SOURCE_DIGEST is None:
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        digest.update(templates_digest('nation').encode('ascii'))
+        settings = {'tier_info': OlympicsHTMLGenerator.TIER_INFO, 'maybe_sports': sorted(MAYBE_SPORTS)}
+        digest.update(json.dumps(settings, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        _SOURCE_DIGEST = digest.hexdigest()
+    return _SOURCE_DIGEST
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Generate one static page per participating nation')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Processes to render pages with (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild every page even if its data is unchanged')
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+    
+    profiler = profiler_from_args(args, 'nation_pages')
+    generator = NationPageGenerator(profiler=profiler)
+    counts = generator.generate_all(workers=args.workers, force=args.force)
+    
+    print(f"[OK] Nation pages in {generator.output_dir}: {counts['rendered']} rendered, "
+          f"{counts['skipped']} unchanged, {counts['removed']} removed")
+    
+    finish_profiling(profiler, args)
+
+
+if __name__ == '__main__':
+    main()
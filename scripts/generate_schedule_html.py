@@ -2,27 +2,39 @@
 Generate interactive schedule HTML page for underdog competitions.
 """
 
+import argparse
+import hashlib
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
 
-def generate_interactive_schedule():
-    """Generate interactive daily schedule HTML page."""
-    
-    base_path = Path(__file__).parent.parent
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.snapshot import load_json
+from src.profiling import StageProfiler, add_profiling_arguments, profiler_from_args, finish_profiling
+from src.templates import get_template, write_stream
+
+# Per-day event data fetched by schedule.html (relative to the page)
+SHARD_DIR = 'schedule_data'
+SHARD_MANIFEST = 'manifest.json'
+
+# Sports whose "probable" entries are shown as unconfirmed
+MAYBE_SPORTS = {'Cross-Country Skiing', 'Biathlon', 'Alpine Skiing'}
+
+def load_schedule_data(base_path: Path) -> Dict:
+    """Load the data files the schedule page is built from."""
     
-    # Load data
-    with open(base_path / 'data' / 'daily_underdog_schedule_2026.json', 'r', encoding='utf-8') as f:
-        daily_schedule = json.load(f)
+    daily_schedule = load_json(base_path / 'data' / 'daily_underdog_schedule_2026.json')
     
-    with open(base_path / 'data' / 'nation_schedules_2026.json', 'r', encoding='utf-8') as f:
-        nation_schedules = json.load(f)
+    nation_schedules = load_json(base_path / 'data' / 'nation_schedules_2026.json')
     
     # Load event_nations to derive a complete sports list
     try:
-        with open(base_path / 'data' / 'event_nations_2026.json', 'r', encoding='utf-8') as f:
-            event_nations = json.load(f)
+        event_nations = load_json(base_path / 'data' / 'event_nations_2026.json')
         event_sports = set()
         for event_name in event_nations.keys():
             sport = event_name.split(' - ')[0]
@@ -33,369 +45,136 @@ def generate_interactive_schedule():
     
     # Also load participating nations for cross-page consistency
     try:
-        with open(base_path / 'data' / 'participating_nations_2026.json', 'r', encoding='utf-8') as f:
-            participating_nations = json.load(f)
+        participating_nations = load_json(base_path / 'data' / 'participating_nations_2026.json')
     except FileNotFoundError:
         participating_nations = []
 
     # Load nation tiers (Full Name -> Tier) for color-coding
     try:
-        with open(base_path / 'data' / 'nation_tiers_2026.json', 'r', encoding='utf-8') as f:
-            nation_tiers = json.load(f)
+        nation_tiers = load_json(base_path / 'data' / 'nation_tiers_2026.json')
     except FileNotFoundError:
         nation_tiers = {}
     
-    print("Generating interactive schedule page...")
+    return {
+        'daily_schedule': daily_schedule,
+        'nation_schedules': nation_schedules,
+        'event_sports': event_sports,
+        'participating_nations': participating_nations,
+        'nation_tiers': nation_tiers
+    }
+
+def build_day_shard(date: str, events: Dict, nation_tiers: Dict) -> Dict:
+    """
+    Compact event data for one day, as fetched by the page.
     
-    # Group events by date
-    dates = sorted(daily_schedule.keys())
+    Events are [sport, event, time_est, nations] sorted by time; each nation
+    is [name, athletes, unconfirmed (0/1), tier (0 = none)].
+    """
+    # Sort events by time
+    sorted_events = sorted(events.items(), key=lambda x: x[1][0]['time_est'] if x[1] else '00:00')
     
-    # Build HTML
-    html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Olympic Underdog Schedule 2026 | Milano-Cortina</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 50%, #7e22ce 100%);
-            color: #fff;
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .header {
-            text-align: center;
-            padding: 40px 20px;
-            background: rgba(0, 0, 0, 0.3);
-            border-radius: 15px;
-            margin-bottom: 30px;
-        }
-        
-        .header h1 {
-            font-size: 3em;
-            margin-bottom: 10px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
-        }
-        
-        .header p {
-            font-size: 1.2em;
-            opacity: 0.9;
-        }
-        
-        .nav-links {
-            text-align: center;
-            margin: 20px 0;
-        }
-        
-        .nav-links a {
-            display: inline-block;
-            padding: 12px 24px;
-            margin: 0 10px;
-            background: rgba(255, 255, 255, 0.2);
-            color: white;
-            text-decoration: none;
-            border-radius: 8px;
-            font-weight: bold;
-            transition: all 0.3s;
-        }
-        
-        .nav-links a:hover {
-            background: rgba(255, 255, 255, 0.3);
-            transform: translateY(-2px);
-        }
-        
-        .filters {
-            background: rgba(0, 0, 0, 0.3);
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            display: flex;
-            gap: 15px;
-            flex-wrap: wrap;
-            align-items: center;
-        }
-        
-        .filter-group {
-            flex: 1;
-            min-width: 200px;
-        }
-        
-        .filter-group label {
-            display: block;
-            margin-bottom: 5px;
-            font-weight: bold;
-        }
-        
-        .filter-group input,
-        .filter-group select {
-            width: 100%;
-            padding: 10px;
-            border-radius: 5px;
-            border: none;
-            background: rgba(255, 255, 255, 0.9);
-            font-size: 14px;
-        }
-        
-        .day-section {
-            background: rgba(0, 0, 0, 0.3);
-            border-radius: 15px;
-            padding: 25px;
-            margin-bottom: 30px;
-            backdrop-filter: blur(10px);
-        }
-        
-        .day-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-            padding-bottom: 15px;
-            border-bottom: 2px solid rgba(255, 255, 255, 0.3);
-        }
-        
-        .day-title {
-            font-size: 2em;
-            font-weight: bold;
-        }
-        
-        .day-stats {
-            text-align: right;
-            opacity: 0.9;
-        }
-        
-        .event-card {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 15px;
-            border-left: 4px solid #4ade80;
-        }
-        
-        .event-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }
-        
-        .event-title {
-            font-size: 1.3em;
-            font-weight: bold;
-            color: #4ade80;
-        }
-        
-        .event-time {
-            background: rgba(0, 0, 0, 0.3);
-            padding: 8px 15px;
-            border-radius: 20px;
-            font-weight: bold;
-        }
-        
-        .nations-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
-            gap: 10px;
-        }
-        
-        .nation-pill {
-            background: rgba(255, 255, 255, 0.15);
-            padding: 8px 12px;
-            border-radius: 20px;
-            font-size: 0.9em;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            transition: all 0.3s;
-        }
-        
-        .nation-pill:hover {
-            background: rgba(255, 255, 255, 0.25);
-            transform: scale(1.05);
-        }
-        
-        .nation-pill.unconfirmed {
-            opacity: 0.6;
-            border: 1px dashed rgba(255, 255, 255, 0.3);
-        }
-        
-        .athlete-count {
-            background: rgba(0, 0, 0, 0.3);
-            padding: 2px 8px;
-            border-radius: 10px;
-            font-size: 0.85em;
-            margin-left: 5px;
-        }
-        
-        /* Tier color coding system - green gradient (tier 5 darkest to tier 1 lightest) */
-        .nation-pill.tier-1 {
-            background: rgba(173, 255, 47, 0.35) !important;
-            border-left: 4px solid #adff2f;
-        }
-        
-        .nation-pill.tier-2 {
-            background: rgba(152, 251, 152, 0.35) !important;
-            border-left: 4px solid #98fb98;
-        }
-        
-        .nation-pill.tier-3 {
-            background: rgba(144, 238, 144, 0.35) !important;
-            border-left: 4px solid #90ee90;
-        }
-        
-        .nation-pill.tier-4 {
-            background: rgba(60, 179, 113, 0.35) !important;
-            border-left: 4px solid #3cb371;
-        }
-        
-        .nation-pill.tier-5 {
-            background: rgba(34, 139, 34, 0.35) !important;
-            border-left: 4px solid #228b22;
-        }
-        
-        .legend {
-            background: rgba(0, 0, 0, 0.3);
-            padding: 25px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            backdrop-filter: blur(10px);
-        }
-        
-        .legend h3 {
-            margin-bottom: 15px;
-            font-size: 1.3em;
-        }
-        
-        .legend-items {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-        }
-        
-        .legend-item {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }
-        
-        .legend-color {
-            width: 30px;
-            height: 30px;
-            border-radius: 5px;
-            border-left: 4px solid;
-        }
-        
-        .legend-item-1 .legend-color {
-            background: rgba(173, 255, 47, 0.4);
-            border-left-color: #adff2f;
-        }
-        
-        .legend-item-2 .legend-color {
-            background: rgba(152, 251, 152, 0.4);
-            border-left-color: #98fb98;
-        }
-        
-        .legend-item-3 .legend-color {
-            background: rgba(144, 238, 144, 0.4);
-            border-left-color: #90ee90;
-        }
-        
-        .legend-item-4 .legend-color {
-            background: rgba(60, 179, 113, 0.4);
-            border-left-color: #3cb371;
-        }
-        
-        .legend-item-5 .legend-color {
-            background: rgba(34, 139, 34, 0.4);
-            border-left-color: #228b22;
-        }
-        
-        .summary-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-bottom: 30px;
-        }
-        
-        .summary-card {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 20px;
-            border-radius: 10px;
-            text-align: center;
-        }
-        
-        .summary-number {
-            font-size: 2.5em;
-            font-weight: bold;
-            color: #4ade80;
-        }
-        
-        .summary-label {
-            opacity: 0.8;
-            margin-top: 5px;
-        }
-        
-        @media (max-width: 768px) {
-            .header h1 {
-                font-size: 2em;
-            }
-            
-            .nation-pill.unconfirmed, .nation-pill.maybe {
-                font-size: 1.5em;
-            }
-            
-        
-            /* Tier color accents */
-            .nation-pill.tier-5 { border-left-color: #e74c3c; }
-            .nation-pill.tier-4 { border-left-color: #e67e22; }
-            .nation-pill.tier-3 { border-left-color: #f39c12; }
-            .nation-pill.tier-2 { border-left-color: #3498db; }
-            .nation-pill.tier-1 { border-left-color: #95a5a6; }
-            .nations-grid {
-                grid-template-columns: repeat(auto-fill, minmax(120px, 1fr));
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🏆 Olympic Underdog Schedule</h1>
-        <p>Milano-Cortina 2026 Winter Olympics | Complete Competition Calendar</p>
-    </div>
+    rows = []
+    for event_name, nations in sorted_events:
+        sport = event_name.split(' - ')[0]
+        event_display = event_name.split(' - ')[1] if ' - ' in event_name else event_name
+        time_est = nations[0]['time_est'] if nations else ''
+        
+        # Sort nations alphabetically
+        pills = []
+        for nation_info in sorted(nations, key=lambda x: x['nation']):
+            nation = nation_info['nation']
+            status = nation_info['status']
+            if sport in MAYBE_SPORTS and status == 'probable':
+                status = 'maybe'
+            tier = nation_tiers.get(nation, 0)
+            pills.append([
+                nation,
+                nation_info['athletes'],
+                1 if status in {'unconfirmed', 'maybe'} else 0,
+                tier if isinstance(tier, int) and tier > 0 else 0
+            ])
+        rows.append([sport, event_display, time_est, pills])
     
-    <div class="nav-links">
-        <a href="index.html">← Back to Main Page</a>
-        <a href="#summary">📊 Summary</a>
-    </div>
+    return {'date': date, 'events': rows}
+
+def build_day_shards(daily_schedule: Dict, nation_tiers: Dict) -> Dict[str, Tuple[str, str]]:
+    """
+    Encode every day's shard.
     
-    <div class="filters">
-        <div class="filter-group">
-            <label for="dateFilter">📅 Filter by Date:</label>
-            <select id="dateFilter" onchange="filterEvents()">
-                <option value="all">All Dates</option>
-"""
+    Returns:
+        Dict mapping date -> (content-hashed filename, JSON text)
+    """
+    shards = {}
+    for date in sorted(daily_schedule.keys()):
+        payload = json.dumps(build_day_shard(date, daily_schedule[date], nation_tiers),
+                             ensure_ascii=False, separators=(',', ':'))
+        digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:12]
+        shards[date] = (f"{date}.{digest}.json", payload)
+    return shards
+
+def write_day_shards(shard_dir: Path, shards: Dict[str, Tuple[str, str]]) -> int:
+    """
+    Write new shards and the manifest, and delete shards two builds old.
     
-    # Add date options
-    for date in dates:
-        date_obj = datetime.strptime(date, '%Y-%m-%d')
-        date_str = date_obj.strftime('%a %b %d, %Y')
-        html += f'                <option value="{date}">{date_str}</option>\n'
+    Shard names change only when their content does, so unchanged days are
+    left untouched (and stay valid in browser/CDN caches). Shards of the
+    previous build are kept until the next one, so a page that is already
+    open and still refers to them can finish loading its days.
     
-    html += """            </select>
-        </div>
-        <div class="filter-group">
-            <label for="sportFilter">🎿 Filter by Sport:</label>
-            <select id="sportFilter" onchange="filterEvents()">
-                <option value="all">All Sports</option>
-"""
+    Returns:
+        Number of shard files written
+    """
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    
+    try:
+        with open(shard_dir / SHARD_MANIFEST, 'r', encoding='utf-8') as f:
+            previous = set(json.load(f).get('days', {}).values())
+    except (OSError, ValueError, AttributeError):
+        previous = set()
+    
+    written = 0
+    for filename, payload in shards.values():
+        path = shard_dir / filename
+        if not path.exists():
+            write_stream(path, [payload])
+            written += 1
+    
+    manifest = {
+        'days': {date: filename for date, (filename, _) in shards.items()}
+    }
+    write_stream(shard_dir / SHARD_MANIFEST, [json.dumps(manifest, indent=2)])
+    
+    keep = previous | {filename for filename, _ in shards.values()}
+    for path in shard_dir.glob('*.json'):
+        if path.name != SHARD_MANIFEST and path.name not in keep:
+            path.unlink()
+    
+    return written
+
+def build_schedule_context(daily_schedule: Dict, nation_schedules: Dict, event_sports: Set[str],
+                           participating_nations: List[str], nation_tiers: Dict,
+                           shards: Optional[Dict[str, Tuple[str, str]]] = None) -> Dict:
+    """
+    Render the page fragments and summary figures for the schedule template.
+    
+    Day sections are rendered as headers only; their events are loaded from
+    the per-day shards (built here unless passed in) when a day is opened.
+    The first day's shard is also inlined, so it shows without a request
+    (and from file://, where browsers block fetch).
+    """
+    if shards is None:
+        shards = build_day_shards(daily_schedule, nation_tiers)
+    
+    # Group events by date
+    dates = sorted(daily_schedule.keys())
+    option = get_template('schedule/option.html')
+    day_section = get_template('schedule/day_section.html')
+    
+    # Date options
+    date_options = option.render_each(
+        {'value': date, 'label': datetime.strptime(date, '%Y-%m-%d').strftime('%a %b %d, %Y')}
+        for date in dates
+    )
     
     # Get unique sports (prefer the comprehensive set from event_nations)
     sports = set(event_sports)
@@ -405,207 +184,85 @@ def generate_interactive_schedule():
                 sport = event_name.split(' - ')[0]
                 sports.add(sport)
     
-    for sport in sorted(sports):
-        html += f'                <option value="{sport}">{sport}</option>\n'
-    
-    html += """            </select>
-        </div>
-        <div class="filter-group">
-            <label for="nationSearch">🔍 Search Nation:</label>
-            <input type="text" id="nationSearch" placeholder="Type nation name..." oninput="filterEvents()">
-        </div>
-    </div>
-    
-    <div class="legend">
-        <h3>🎯 Underdog Tier System</h3>
-        <div class="legend-items">
-            <div class="legend-item legend-item-1">
-                <div class="legend-color"></div>
-                <div><strong>Tier 1: Mild Underdogs</strong></div>
-            </div>
-            <div class="legend-item legend-item-2">
-                <div class="legend-color"></div>
-                <div><strong>Tier 2: Moderate Underdogs</strong></div>
-            </div>
-            <div class="legend-item legend-item-3">
-                <div class="legend-color"></div>
-                <div><strong>Tier 3: Strong Underdogs</strong></div>
-            </div>
-            <div class="legend-item legend-item-4">
-                <div class="legend-color"></div>
-                <div><strong>Tier 4: Major Underdogs</strong></div>
-            </div>
-            <div class="legend-item legend-item-5">
-                <div class="legend-color"></div>
-                <div><strong>Tier 5: Ultimate Underdogs</strong></div>
-            </div>
-        </div>
-    </div>
+    sport_options = option.render_each({'value': sport, 'label': sport} for sport in sorted(sports))
     
-    <div id="summary" class="summary-grid">
-        <div class="summary-card">
-            <div class="summary-number">""" + str(len(participating_nations)) + """</div>
-            <div class="summary-label">Participating Nations</div>
-        </div>
-        <div class="summary-card">
-            <div class="summary-number">""" + str(len([n for n in nation_schedules.values() if n.get('total_competition_days', 0) > 0])) + """</div>
-            <div class="summary-label">Nations with Schedules</div>
-        </div>
-        <div class="summary-card">
-            <div class="summary-number">""" + str(len(dates)) + """</div>
-            <div class="summary-label">Competition Days</div>
-        </div>
-        <div class="summary-card">
-            <div class="summary-number">""" + str(len(sports)) + """</div>
-            <div class="summary-label">Total Sports</div>
-        </div>
-        <div class="summary-card">
-            <div class="summary-number">""" + str(sum(len(events) for events in daily_schedule.values())) + """</div>
-            <div class="summary-label">Total Events</div>
-        </div>
-        <div class="summary-card">
-            <div class="summary-number">""" + str(sum(len(nations) for events in daily_schedule.values() for nations in events.values())) + """</div>
-            <div class="summary-label">Nation Participations</div>
-        </div>
-    </div>
-    
-    <div id="schedule">
-"""
-    
-    # Generate day sections
+    # Generate day section headers (events are fetched from the shards)
+    days = []
     for date in dates:
         date_obj = datetime.strptime(date, '%Y-%m-%d')
-        day_name = date_obj.strftime('%A')
-        date_str = date_obj.strftime('%B %d, %Y')
-        
         events = daily_schedule[date]
-        total_nations = sum(len(nations) for nations in events.values())
-        
-        html += f"""        <div class="day-section" data-date="{date}">
-            <div class="day-header">
-                <div class="day-title">{day_name}, {date_str}</div>
-                <div class="day-stats">
-                    {len(events)} events • {total_nations} nation participations
-                </div>
-            </div>
-"""
-        
-        # Sort events by time
-        sorted_events = sorted(events.items(), key=lambda x: x[1][0]['time_est'] if x[1] else '00:00')
         
-        for event_name, nations in sorted_events:
-            sport = event_name.split(' - ')[0]
-            event_display = event_name.split(' - ')[1] if ' - ' in event_name else event_name
-            time_est = nations[0]['time_est'] if nations else ''
-            
-            html += f"""            <div class="event-card" data-sport="{sport}">
-                <div class="event-header">
-                    <div class="event-title">{sport} - {event_display}</div>
-                    <div class="event-time">⏰ {time_est} EST</div>
-                </div>
-                <div class="nations-grid">
-"""
-            
-            # Sort nations alphabetically
-            for nation_info in sorted(nations, key=lambda x: x['nation']):
-                nation = nation_info['nation']
-                athletes = nation_info['athletes']
-                status = nation_info['status']
-                if sport in {'Cross-Country Skiing', 'Biathlon', 'Alpine Skiing'} and status == 'probable':
-                    status = 'maybe'
-                status_class = 'unconfirmed' if status in {'unconfirmed', 'maybe'} else ''
-                status_icon = '?' if status in {'unconfirmed', 'maybe'} else '✓'
-                tier = nation_tiers.get(nation, 0)
-                tier_class = f"tier-{tier}" if isinstance(tier, int) and tier > 0 else ''
-                
-                html += f"""                    <div class="nation-pill {status_class} {tier_class}" data-nation="{nation}">
-                        <span>{status_icon} {nation}</span>
-                        <span class="athlete-count">{athletes}</span>
-                    </div>
-"""
-            
-            html += """                </div>
-            </div>
-"""
-        
-        html += """        </div>
-"""
+        days.append(day_section.render(
+            date=date,
+            shard=f"{SHARD_DIR}/{shards[date][0]}",
+            day_name=date_obj.strftime('%A'),
+            date_str=date_obj.strftime('%B %d, %Y'),
+            event_count=len(events),
+            participation_count=sum(len(nations) for nations in events.values())
+        ))
     
-    html += """    </div>
+    # Inline the first day for script context ("</" would end the <script>)
+    inline_days = '{' + ','.join(
+        f'{json.dumps(date)}:{shards[date][1]}' for date in dates[:1]
+    ).replace('</', '<\\/') + '}'
     
-    <script>
-        function filterEvents() {
-            const dateFilter = document.getElementById('dateFilter').value;
-            const sportFilter = document.getElementById('sportFilter').value;
-            const nationSearch = document.getElementById('nationSearch').value.toLowerCase();
-            
-            const daySections = document.querySelectorAll('.day-section');
-            
-            daySections.forEach(section => {
-                const sectionDate = section.dataset.date;
-                let showSection = dateFilter === 'all' || dateFilter === sectionDate;
-                
-                if (showSection) {
-                    const eventCards = section.querySelectorAll('.event-card');
-                    let visibleEvents = 0;
-                    
-                    eventCards.forEach(card => {
-                        const cardSport = card.dataset.sport;
-                        const nations = card.querySelectorAll('.nation-pill');
-                        
-                        let showCard = sportFilter === 'all' || sportFilter === cardSport;
-                        
-                        if (showCard && nationSearch) {
-                            let hasMatchingNation = false;
-                            nations.forEach(nation => {
-                                const nationName = nation.dataset.nation.toLowerCase();
-                                if (nationName.includes(nationSearch)) {
-                                    hasMatchingNation = true;
-                                    nation.style.display = 'flex';
-                                } else {
-                                    nation.style.display = 'none';
-                                }
-                            });
-                            showCard = hasMatchingNation;
-                        } else {
-                            nations.forEach(nation => {
-                                nation.style.display = 'flex';
-                            });
-                        }
-                        
-                        card.style.display = showCard ? 'block' : 'none';
-                        if (showCard) visibleEvents++;
-                    });
-                    
-                    section.style.display = visibleEvents > 0 ? 'block' : 'none';
-                } else {
-                    section.style.display = 'none';
-                }
-            });
-        }
-        
-        // Add smooth scroll
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
-            anchor.addEventListener('click', function (e) {
-                e.preventDefault();
-                const target = document.querySelector(this.getAttribute('href'));
-                if (target) {
-                    target.scrollIntoView({ behavior: 'smooth', block: 'start' });
-                }
-            });
-        });
-    </script>
-</body>
-</html>
-"""
+    return {
+        'inline_days': inline_days,
+        'date_options': date_options,
+        'sport_options': sport_options,
+        'participating_count': len(participating_nations),
+        'scheduled_nation_count': len([n for n in nation_schedules.values() if n.get('total_competition_days', 0) > 0]),
+        'day_count': len(dates),
+        'sport_count': len(sports),
+        'event_count': sum(len(events) for events in daily_schedule.values()),
+        'participation_count': sum(len(nations) for events in daily_schedule.values() for nations in events.values()),
+        'days': days
+    }
+
+def render_schedule_html(daily_schedule: Dict, nation_schedules: Dict, event_sports: Set[str],
+                         participating_nations: List[str], nation_tiers: Dict) -> str:
+    """Render the interactive schedule page."""
+    context = build_schedule_context(daily_schedule, nation_schedules, event_sports,
+                                     participating_nations, nation_tiers)
+    return ''.join(get_template('schedule/page.html').stream(**context))
+
+def generate_interactive_schedule(profiler: Optional[StageProfiler] = None,
+                                  base_path: Optional[Path] = None):
+    """Generate interactive daily schedule HTML page (under base_path, default: repo root)."""
+    
+    profiler = profiler or StageProfiler('schedule')
+    base_path = Path(base_path) if base_path else Path(__file__).parent.parent
+    
+    # Load data
+    with profiler.stage('load_data'):
+        data = load_schedule_data(base_path)
+    
+    print("Generating interactive schedule page...")
     
-    # Save HTML file
-    output_file = base_path / 'schedule.html'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+    with profiler.stage('render'):
+        shards = build_day_shards(data['daily_schedule'], data['nation_tiers'])
+        context = build_schedule_context(shards=shards, **data)
     
+    # Write the day shards, then stream the page shell straight to disk
+    with profiler.stage('save'):
+        written = write_day_shards(base_path / SHARD_DIR, shards)
+        output_file = base_path / 'schedule.html'
+        write_stream(output_file, get_template('schedule/page.html').stream(**context))
+    
+    daily_schedule = data['daily_schedule']
     print(f"[OK] Generated interactive schedule: {output_file}")
-    print(f"     {len(dates)} days, {sum(len(events) for events in daily_schedule.values())} events")
+    print(f"     {len(daily_schedule)} days, {sum(len(events) for events in daily_schedule.values())} events")
+    print(f"     {written} of {len(shards)} day shards updated in {base_path / SHARD_DIR}")
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Generate the interactive schedule HTML page')
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+    
+    profiler = profiler_from_args(args, 'schedule')
+    generate_interactive_schedule(profiler)
+    finish_profiling(profiler, args)
 
 if __name__ == '__main__':
-    generate_interactive_schedule()
+    main()
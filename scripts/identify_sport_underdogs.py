@@ -1,5 +1,12 @@
 import json
 import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.nation_table import NationTable
+from src.underdog_criteria import evaluate as evaluate_criteria
 
 # Define underdog criteria
 UNDERDOG_CRITERIA = {
@@ -12,12 +19,6 @@ UNDERDOG_CRITERIA = {
     "southern_hemisphere": {"label": "Southern Hemisphere", "key": "southern_hemisphere"},
 }
 
-# Southern Hemisphere nations
-SOUTHERN_HEMISPHERE = {
-    "AUS", "ARG", "BRA", "CHI", "NZL", "RSA", "URU", "ECU",  # main ones
-    "FIJ", "MAS", "SIN", "THA", "PNG", "VUT"  # others
-}
-
 # Load data files
 base_path = r"c:\Users\emf48\OneDrive\Documents\Olympic Underdogs and GOATs\data"
 
@@ -42,47 +43,34 @@ def get_total_athletes(nation_data):
     return total
 
 
-def is_underdog(nation_code, nation_data):
+def is_underdog(nation_code, criteria_result):
     """Check if a nation meets any underdog criteria"""
-    criteria_met = []
-
-    # 1. Minimal team (< 5 athletes)
-    total_athletes = get_total_athletes(nation_data)
-    if total_athletes < 5:
-        criteria_met.append("minimal_team")
-
-    # 2. No Olympic Gold Medals
-    if nation_code not in all_time_medals or all_time_medals[nation_code].get("gold", 0) == 0:
-        criteria_met.append("no_olympic_gold")
-
-    # 3. No Olympic Medals
-    if nation_code not in all_time_medals or all_time_medals[nation_code].get("total", 0) == 0:
-        criteria_met.append("no_olympic_medals")
-
-    # 4. Population Under 1M
-    population = population_data.get(nation_code, float('inf'))
-    if population < 1_000_000:
-        criteria_met.append("small_population")
-
-    # 5. No Winter Olympic Gold
-    if nation_code not in winter_medals or winter_medals[nation_code].get("gold", 0) == 0:
-        criteria_met.append("no_winter_gold")
-
-    # 6. No Winter Olympic Medals
-    if nation_code not in winter_medals or winter_medals[nation_code].get("total", 0) == 0:
-        criteria_met.append("no_winter_medals")
-
-    # 7. Southern Hemisphere
-    if nation_code in SOUTHERN_HEMISPHERE:
-        criteria_met.append("southern_hemisphere")
-
-    return criteria_met
+    # "< 5 Athletes" is reported under this script's own key
+    return [
+        "minimal_team" if key == "small_athletes" else key
+        for key in criteria_result.criteria_keys(nation_code)
+    ]
+
+
+# Classify every nation once with the shared criteria engine
+criteria_result = evaluate_criteria(
+    NationTable.from_sources(
+        medals=all_time_medals,
+        winter_medals=winter_medals,
+        population=population_data,
+        athletes={code: get_total_athletes(data) for code, data in sports_data["nations"].items()},
+        nations=sports_data["nations"].keys(),
+    ),
+    sports_data["nations"].keys(),
+    # A nation listed without any athletes still counts as a minimal team
+    min_athletes=0,
+)
 
 
 # Identify all underdogs
 underdog_nations = {}
 for nation_code, nation_data in sports_data["nations"].items():
-    criteria = is_underdog(nation_code, nation_data)
+    criteria = is_underdog(nation_code, criteria_result)
     if criteria:
         underdog_nations[nation_code] = {
             "name": nation_data.get("name", nation_code),
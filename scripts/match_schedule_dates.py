@@ -90,10 +90,10 @@ def match_event_to_schedule(sport, event, schedule_data, nation=None):
     
     return matches
 
-def create_nation_schedule_mapping():
+def create_nation_schedule_mapping(base_path=None):
     """Create comprehensive mapping of nations to their competition dates."""
     
-    base_path = Path(__file__).parent.parent
+    base_path = Path(base_path) if base_path else Path(__file__).parent.parent
     
     # Load data files
     with open(base_path / 'data' / 'nation_events_2026.json', 'r', encoding='utf-8') as f:
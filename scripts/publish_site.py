@@ -0,0 +1,373 @@
+"""
+Publish the generated site into a static-hosting directory (default: dist/).
+
+Run after generate_html_overview.py, generate_schedule_html.py and
+generate_nation_pages.py. For each page (nation pages included) the inline
+<style> blocks are minified into a shared, content-hashed stylesheet under
+assets/, the HTML is minified, and .gz (plus .br when the brotli package is
+installed) siblings are written next to every file. The
+schedule day shards, search.js and search_index.json are copied and
+compressed the same way.
+
+dist/manifest.json records each file's source hash, sizes and SRI integrity
+hash; files whose source is unchanged since the last publish are skipped.
+Everything under assets/ and schedule_data/ is content-addressed and can be
+served with long-lived cache headers.
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.profiling import StageProfiler, add_profiling_arguments, profiler_from_args, finish_profiling
+from src.templates import write_stream
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+PAGES = ('index.html', 'schedule.html', 'olympics_overview.html', 'about.html')
+PAGE_DIRS = ('nations',)
+DATA_DIRS = ('schedule_data',)
+STATIC_FILES = ('search.js', 'search_index.json')
+ASSET_DIR = 'assets'
+DEFAULT_OUTPUT_DIR = 'dist'
+MANIFEST_FILE = 'manifest.json'
+
+# Bump whenever minification or the output layout changes (forces a republish)
+PUBLISH_VERSION = 1
+
+_STYLE_BLOCK = re.compile(r'<style\b([^>]*)>(.*?)</style>\s*', re.S | re.I)
+_ATTRIBUTE = re.compile(r'([\w-]+)\s*(?:=\s*("[^"]*"|\'[^\']*\'|[^\s>]+))?')
+_RAW_BLOCK = re.compile(r'(<(script|style|pre|textarea)\b.*?</\2\s*>)', re.S | re.I)
+_HTML_COMMENT = re.compile(r'<!--(?!\[if).*?-->', re.S)
+_WHITESPACE = re.compile(r'\s+')
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = _CSS_COMMENT.sub('', css)
+    css = _WHITESPACE.sub(' ', css)
+    css = _CSS_PUNCTUATION.sub(r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+def _collapse(match) -> str:
+    return '\n' if '\n' in match.group() else ' '
+
+
+def minify_html(html: str) -> str:
+    """
+    Drop comments and collapse whitespace runs outside script/style/pre/textarea.
+    
+    A run containing a newline becomes one newline, any other run one space,
+    so the rendered page is unchanged.
+    """
+    parts = _RAW_BLOCK.split(html)
+    out = []
+    # split() yields [text, block, tag name, text, block, tag name, ...]
+    for i in range(0, len(parts), 3):
+        text = _HTML_COMMENT.sub('', parts[i])
+        out.append(_WHITESPACE.sub(_collapse, text))
+        if i + 1 < len(parts):
+            out.append(parts[i + 1])
+    return ''.join(out).strip() + '\n'
+
+
+def integrity(data: bytes) -> str:
+    """Subresource Integrity value (sha384) for data."""
+    return 'sha384-' + base64.b64encode(hashlib.sha384(data).digest()).decode('ascii')
+
+
+def _style_css(attributes: str) -> Optional[str]:
+    """
+    Return a format string wrapping a <style> block's CSS so it keeps its
+    meaning in a shared stylesheet, or None if the block must stay inline.
+    
+    type="text/css" is dropped and media="..." becomes an @media rule; any
+    other attribute (id, nonce, a non-CSS type...) keeps the block inline.
+    """
+    wrapper = '{}'
+    for name, value in _ATTRIBUTE.findall(attributes):
+        name = name.lower()
+        value = value.strip('\'"').strip()
+        if name == 'type' and value.lower() in ('', 'text/css'):
+            continue
+        if name == 'media':
+            if value and value.lower() != 'all':
+                wrapper = '@media ' + value.replace('{', '{{').replace('}', '}}') + '{{{}}}'
+            continue
+        return None
+    return wrapper
+
+
+def extract_styles(html: str, root: str = '') -> Tuple[str, Optional[Tuple[str, bytes]]]:
+    """
+    Move a page's inline <style> blocks into one minified stylesheet.
+    
+    The blocks are concatenated in document order and replaced by a single
+    <link> where the first one was. root is the page's relative path back
+    to the site root (e.g. '../' for pages in a subdirectory). Blocks with
+    attributes other than type and media stay inline (see _style_css).
+    
+    Returns:
+        (page HTML, (asset path, stylesheet bytes) or None if it had no styles)
+    """
+    blocks = []
+    for attributes, css in _STYLE_BLOCK.findall(html):
+        wrapper = _style_css(attributes)
+        if wrapper is not None:
+            blocks.append(wrapper.format(css))
+    if not blocks:
+        return html, None
+    
+    css = minify_css('\n'.join(blocks)).encode('utf-8')
+    asset = f"{ASSET_DIR}/style.{hashlib.sha256(css).hexdigest()[:12]}.css"
+    link = f'<link rel="stylesheet" href="{root}{asset}" integrity="{integrity(css)}">\n'
+    
+    first = [True]
+    
+    def replace(match) -> str:
+        if _style_css(match.group(1)) is None:
+            return match.group()
+        if first[0]:
+            first[0] = False
+            return link
+        return ''
+    
+    return _STYLE_BLOCK.sub(replace, html), (asset, css)
+
+
+def write_compressed(output_dir: Path, relative: str, data: bytes, use_brotli: bool) -> Dict:
+    """
+    Write a file plus its .gz (and .br) siblings.
+    
+    Returns:
+        Manifest entry with the sizes and integrity hash
+    """
+    path = output_dir / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    br = brotli.compress(data, quality=11) if use_brotli else None
+    for suffix, payload in (('', data), ('.gz', gz), ('.br', br)):
+        if payload is None:
+            continue
+        tmp_path = path.with_name(f".{path.name}{suffix}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path.with_name(path.name + suffix))
+    
+    return {
+        'integrity': integrity(data),
+        'bytes': len(data),
+        'gzip_bytes': len(gz),
+        'br_bytes': len(br) if br is not None else None
+    }
+
+
+def _publish_page(job: Tuple) -> Dict:
+    """Minify and compress one page (runs in a worker process)."""
+    relative, source, output_dir, use_brotli = job
+    with open(source, 'rb') as f:
+        raw = f.read()
+    
+    html, stylesheet = extract_styles(raw.decode('utf-8'), '../' * relative.count('/'))
+    entry = write_compressed(Path(output_dir), relative,
+                             minify_html(html).encode('utf-8'), use_brotli)
+    entry['source_sha256'] = hashlib.sha256(raw).hexdigest()
+    entry['assets'] = []
+    
+    result = {'entry': entry, 'stylesheet': None}
+    if stylesheet is not None:
+        entry['assets'].append(stylesheet[0])
+        result['stylesheet'] = stylesheet
+    return result
+
+
+def _publish_asset(job: Tuple) -> Dict:
+    """Compress one stylesheet or data file (runs in a worker process)."""
+    relative, data, output_dir, use_brotli = job
+    entry = write_compressed(Path(output_dir), relative, data, use_brotli)
+    entry['source_sha256'] = hashlib.sha256(data).hexdigest()
+    return entry
+
+
+def _map(func, jobs: List, workers: int) -> List:
+    """Run jobs in a process pool (or inline for a single worker/job)."""
+    if workers > 1 and len(jobs) > 1:
+        with multiprocessing.Pool(processes=min(workers, len(jobs))) as pool:
+            return pool.map(func, jobs)
+    return [func(job) for job in jobs]
+
+
+def _sha256_file(path: Path) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _outputs_exist(output_dir: Path, relative: str, entry: Dict, use_brotli: bool) -> bool:
+    """Whether a previously published file and its compressed siblings are all present."""
+    path = output_dir / relative
+    if (entry.get('br_bytes') is not None) != use_brotli:
+        return False
+    return path.exists() and path.with_name(path.name + '.gz').exists() and \
+        (not use_brotli or path.with_name(path.name + '.br').exists())
+
+
+def load_manifest(output_dir: Path) -> Dict:
+    """Read the previous publish manifest (empty if missing or outdated)."""
+    try:
+        with open(output_dir / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if manifest.get('version') != PUBLISH_VERSION:
+        return {}
+    return manifest.get('files', {})
+
+
+def publish_site(base_path: Optional[Path] = None, output_dir: Optional[Path] = None,
+                 workers: int = 1, force: bool = False, use_brotli: bool = True,
+                 profiler: Optional[StageProfiler] = None) -> Dict:
+    """
+    Publish the pages and data shards under base_path into output_dir.
+    
+    Args:
+        base_path: Directory holding the generated pages (default: repo root)
+        output_dir: Publish directory (default: base_path/dist)
+        workers: Processes used to minify and compress files
+        force: Republish every file even if its source is unchanged
+        use_brotli: Write .br files (needs the brotli package)
+        profiler: Optional StageProfiler for per-stage timings
+    
+    Returns:
+        Dict with the manifest 'files' and the 'published'/'skipped' counts
+    """
+    profiler = profiler or StageProfiler('publish')
+    base_path = Path(base_path) if base_path else Path(__file__).parent.parent
+    output_dir = Path(output_dir) if output_dir else base_path / DEFAULT_OUTPUT_DIR
+    use_brotli = use_brotli and brotli is not None
+    
+    with profiler.stage('scan'):
+        previous = {} if force else load_manifest(output_dir)
+        files: Dict[str, Dict] = {}
+        page_jobs = []
+        pages = list(PAGES)
+        for page_dir in PAGE_DIRS:
+            pages.extend(f"{page_dir}/{path.name}" for path in sorted((base_path / page_dir).glob('*.html')))
+        for relative in pages:
+            source = base_path / relative
+            if not source.exists():
+                continue
+            entry = previous.get(relative)
+            if entry and entry['source_sha256'] == _sha256_file(source) and \
+                    _outputs_exist(output_dir, relative, entry, use_brotli) and \
+                    all(asset in previous and _outputs_exist(output_dir, asset, previous[asset], use_brotli)
+                        for asset in entry['assets']):
+                files[relative] = entry
+                for asset in entry['assets']:
+                    files[asset] = previous[asset]
+            else:
+                page_jobs.append((relative, str(source), str(output_dir), use_brotli))
+        
+        # Data shards are already minified and named by content hash;
+        # the search script and index are copied as they are
+        asset_jobs = []
+        sources = [base_path / relative for relative in STATIC_FILES]
+        for data_dir in DATA_DIRS:
+            sources.extend(sorted((base_path / data_dir).glob('*.json')))
+        for source in sources:
+            if source.exists():
+                relative = source.relative_to(base_path).as_posix()
+                entry = previous.get(relative)
+                data = source.read_bytes()
+                if entry and entry['source_sha256'] == hashlib.sha256(data).hexdigest() and \
+                        _outputs_exist(output_dir, relative, entry, use_brotli):
+                    files[relative] = entry
+                else:
+                    asset_jobs.append((relative, data, str(output_dir), use_brotli))
+    
+    with profiler.stage('pages'):
+        for job, result in zip(page_jobs, _map(_publish_page, page_jobs, workers)):
+            files[job[0]] = result['entry']
+            if result['stylesheet'] is not None:
+                asset, css = result['stylesheet']
+                if asset in files:
+                    continue
+                entry = previous.get(asset)
+                if entry and _outputs_exist(output_dir, asset, entry, use_brotli):
+                    files[asset] = entry
+                elif not any(queued[0] == asset for queued in asset_jobs):
+                    asset_jobs.append((asset, css, str(output_dir), use_brotli))
+    
+    with profiler.stage('assets'):
+        for job, entry in zip(asset_jobs, _map(_publish_asset, asset_jobs, workers)):
+            files[job[0]] = entry
+    
+    with profiler.stage('manifest'):
+        # Remove files that are no longer published
+        for relative in set(previous) - set(files):
+            path = output_dir / relative
+            for suffix in ('', '.gz', '.br'):
+                target = path.with_name(path.name + suffix)
+                if target.exists():
+                    target.unlink()
+        
+        output_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {'version': PUBLISH_VERSION, 'files': dict(sorted(files.items()))}
+        write_stream(output_dir / MANIFEST_FILE, [json.dumps(manifest, indent=2)])
+    
+    return {
+        'files': manifest['files'],
+        'published': len(page_jobs) + len(asset_jobs),
+        'skipped': len(files) - len(page_jobs) - len(asset_jobs)
+    }
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Minify, fingerprint and pre-compress the site')
+    parser.add_argument('--output', type=Path, default=None,
+                        help=f'Publish directory (default: {DEFAULT_OUTPUT_DIR}/)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Processes used to minify and compress (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='Republish every file even if its source is unchanged')
+    parser.add_argument('--no-brotli', action='store_true', help="Don't write .br files")
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+    
+    if brotli is None and not args.no_brotli:
+        print("Note: brotli is not installed; writing .gz files only (pip install brotli)")
+    
+    profiler = profiler_from_args(args, 'publish')
+    result = publish_site(output_dir=args.output, workers=args.workers, force=args.force,
+                          use_brotli=not args.no_brotli, profiler=profiler)
+    
+    files = result['files']
+    total = sum(entry['bytes'] for entry in files.values())
+    gzipped = sum(entry['gzip_bytes'] for entry in files.values())
+    print(f"[OK] Published {result['published']} file(s), {result['skipped']} unchanged")
+    print(f"     {len(files)} files, {total / 1024:.0f} KB ({gzipped / 1024:.0f} KB gzipped)")
+    
+    finish_profiling(profiler, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,14 +8,14 @@ import json
 import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-import requests
-from bs4 import BeautifulSoup
 import sys
 import os
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from src.http_cache import fetch_url
+
 # Discipline codes and IOC URLs
 DISCIPLINES = {
     'alp': 'Alpine Skiing',
@@ -41,12 +41,7 @@ def get_ioc_schedule_page(discipline_code: str) -> Optional[str]:
     """Fetch IOC schedule page HTML for a discipline."""
     url = f"{BASE_URL}/{discipline_code}"
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        html = response.text
+        html = fetch_url(url, timeout=10).raise_for_status().text
         # Save first fetch for debugging
         if discipline_code == 'skn':
             with open('debug_skeleton.html', 'w') as f:
@@ -1,14 +1,27 @@
 """
 Scrape competitor data by sport for each nation from their 2026 Winter Olympics Wikipedia pages.
+
+Pages are fetched concurrently by src.fetch.FetchEngine (bounded overall and
+per host) and parsed in a process pool. Use --base-url to scrape from a
+local HTTP server serving saved pages instead of Wikipedia.
 """
 
+import argparse
 import json
 import pandas as pd
-import time
-import requests
-from bs4 import BeautifulSoup
+import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.fetch import FetchEngine, FetchResult, default_parse_workers
+from src.html_tables import Table, iter_tables, to_int
+from src.http_cache import scraper_transport
+
+
+WIKIPEDIA_URL = 'https://en.wikipedia.org/wiki'
 
 
 class NationCompetitorsScraper:
@@ -40,6 +53,9 @@ class NationCompetitorsScraper:
         'SGP': 'Singapore', 'URU': 'Uruguay', 'VEN': 'Venezuela'
     }
     
+    # Header terms of the competitors table (each tuple: any one of)
+    COMPETITORS_SIGNATURE = (('sport', 'discipline'), ('men', 'women'))
+    
     # Sport name normalization
     SPORT_ALIASES = {
         'alpine skiing': 'Alpine Skiing',
@@ -63,11 +79,33 @@ class NationCompetitorsScraper:
         'speed skating': 'Speed Skating',
     }
     
-    def __init__(self):
-        """Initialize scraper."""
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+    def __init__(self, base_url: str = WIKIPEDIA_URL, concurrency: int = 8, per_host: int = 2,
+                 host_interval: float = 0.5, parse_workers: Optional[int] = None,
+                 use_cache: bool = True):
+        """
+        Initialize scraper.
+        
+        Args:
+            base_url: Wiki base URL (point at a local server to replay saved pages)
+            concurrency: Maximum page requests in flight
+            per_host: Maximum requests in flight to one host
+            host_interval: Minimum seconds between request starts to one host
+            parse_workers: Processes to parse pages in (default: CPU count - 1)
+            use_cache: Fetch through the shared HTTP cache (src/http_cache.py)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.parse_workers = default_parse_workers() if parse_workers is None else parse_workers
+        self.engine = FetchEngine(concurrency=concurrency, per_host=per_host,
+                                  host_interval=host_interval,
+                                  transport=scraper_transport(use_cache))
+        self.headers = self.engine.headers
+    
+    def nation_url(self, ioc_code: str) -> Optional[str]:
+        """Wikipedia URL of a nation's 2026 page (None if the code isn't mapped)."""
+        country_name = self.IOC_TO_COUNTRY.get(ioc_code)
+        if not country_name:
+            return None
+        return f"{self.base_url}/{country_name}_at_the_2026_Winter_Olympics"
     
     def scrape_all_nations(self, nation_codes: List[str]) -> Dict[str, Dict]:
         """
@@ -75,7 +113,7 @@ class NationCompetitorsScraper:
         
         Args:
             nation_codes: List of IOC codes to scrape
-            
+        
         Returns:
             Dict mapping IOC code to their sport participation data
         """
@@ -85,28 +123,37 @@ class NationCompetitorsScraper:
         print(f"Scraping competitor data for {total} nations...")
         print("=" * 70)
         
-        for i, ioc_code in enumerate(nation_codes, 1):
-            print(f"\n[{i}/{total}] {ioc_code}...", end=" ")
-            
-            try:
-                sports_data = self.scrape_nation(ioc_code, debug=False)
-                if sports_data:
-                    results[ioc_code] = sports_data
-                    print(f"✓ {len(sports_data)} sports")
-                else:
-                    print("✗ No data found")
-                    
-                # Be polite to Wikipedia
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"✗ Error: {e}")
-                continue
+        urls = {}
+        for ioc_code in nation_codes:
+            url = self.nation_url(ioc_code)
+            if url:
+                urls[url] = ioc_code
+            else:
+                print(f"[{ioc_code}] ✗ No country name mapping")
+        
+        done = [0]
+        
+        def report(result: FetchResult, sports_data: Optional[Dict], error: Optional[BaseException]):
+            done[0] += 1
+            ioc_code = urls[result.url]
+            prefix = f"[{done[0]}/{len(urls)}] {ioc_code}..."
+            if not result.ok:
+                print(f"{prefix} ✗ Error: {result.error or result.status}")
+            elif error is not None:
+                print(f"{prefix} ✗ Error: {error}")
+            elif sports_data:
+                results[ioc_code] = sports_data
+                print(f"{prefix} ✓ {len(sports_data)} sports")
+            else:
+                print(f"{prefix} ✗ No data found")
+        
+        self.engine.run(urls, parse=_parse_page, parse_workers=self.parse_workers, on_result=report)
         
         print("\n" + "=" * 70)
         print(f"✓ Successfully scraped {len(results)}/{total} nations")
         
-        return results
+        # Keep the input order regardless of completion order
+        return {code: results[code] for code in nation_codes if code in results}
     
     def scrape_nation(self, ioc_code: str, debug: bool = False) -> Dict[str, Dict]:
         """
@@ -115,133 +162,142 @@ class NationCompetitorsScraper:
         Args:
             ioc_code: IOC code (e.g., 'USA', 'CAN')
             debug: If True, print debugging information
-            
+        
         Returns:
             Dict mapping sport name to competitor counts
         """
-        # Get country name for URL
-        country_name = self.IOC_TO_COUNTRY.get(ioc_code)
-        if not country_name:
+        url = self.nation_url(ioc_code)
+        if not url:
             if debug:
                 print(f"\n  ✗ No country name mapping for {ioc_code}")
             return {}
         
-        # Build Wikipedia URL
-        url = f"https://en.wikipedia.org/wiki/{country_name}_at_the_2026_Winter_Olympics"
-        
-        try:
-            # Fetch and clean the HTML with BeautifulSoup first
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            # Parse with BeautifulSoup and extract just the tables
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find all tables
-            html_tables = soup.find_all('table', class_='wikitable')
-            
+        result, _ = self.engine.run([url])[url]
+        if not result.ok:
             if debug:
-                print(f"\n  Found {len(html_tables)} wikitables")
-            
-            # Try each table
-            for i, html_table in enumerate(html_tables):
-                try:
-                    # Convert to pandas DataFrame
-                    df = pd.read_html(str(html_table))[0]
-                    
-                    cols_str = str(df.columns).lower()
-                    
-                    if debug:
-                        print(f"  Table {i}: {df.columns.tolist()}")
-                    
-                    # Look for table with sport and men/women columns
-                    if ('sport' in cols_str or 'discipline' in cols_str) and ('men' in cols_str or 'women' in cols_str):
-                        if debug:
-                            print(f"  → Attempting to parse table {i}")
-                        result = self._parse_competitors_table(df)
-                        if result:
-                            return result
-                except Exception as e:
-                    if debug:
-                        print(f"  ✗ Error parsing table {i}: {e}")
-                    continue
-            
-            if debug:
-                print(f"  ✗ No matching competitor table found")
+                print(f"\n  ✗ Fetch failed: {result.error or result.status}")
             return {}
-            
+        
+        try:
+            return self.parse_nation_page(result.body, debug=debug)
         except Exception as e:
             if debug:
                 print(f"\n  ✗ Exception: {e}")
             return {}
     
-    def _parse_competitors_table(self, df: pd.DataFrame) -> Dict[str, Dict]:
+    def parse_nation_page(self, html: bytes, debug: bool = False) -> Dict[str, Dict]:
+        """
+        Find and parse the competitors table of a nation's page.
+        
+        Returns:
+            Dict mapping sport name to competitor counts (empty if not found)
+        """
+        # One streaming pass over the page; tables are checked as they close
+        for i, table in enumerate(iter_tables(html, classes=('wikitable',))):
+            try:
+                if debug:
+                    print(f"  Table {i}: {table.columns}")
+                
+                # Look for table with sport and men/women columns
+                if table.matches(self.COMPETITORS_SIGNATURE):
+                    if debug:
+                        print(f"  → Attempting to parse table {i}")
+                    result = self._parse_competitors_rows(table)
+                    if result:
+                        return result
+            except Exception as e:
+                if debug:
+                    print(f"  ✗ Error parsing table {i}: {e}")
+                continue
+        
+        if debug:
+            print(f"  ✗ No matching competitor table found")
+        return {}
+    
+    def _find_competitor_columns(self, columns) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """Positions of the sport, men and women columns (labels can repeat)."""
+        sport_col = None
+        men_col = None
+        women_col = None
+        
+        for i, col in enumerate(columns):
+            col_str = str(col).lower()
+            if 'sport' in col_str or 'discipline' in col_str:
+                if sport_col is None:
+                    sport_col = i
+            if 'men' in col_str and 'women' not in col_str:
+                men_col = i
+            if 'women' in col_str:
+                women_col = i
+        
+        return sport_col, men_col, women_col
+    
+    def _parse_competitors_rows(self, table: Table) -> Dict[str, Dict]:
         """
-        Parse the competitors table.
+        Parse the competitors table straight from its typed rows.
         
         Returns:
             Dict mapping sport name to {men: int, women: int, total: int}
         """
-        sports_data = {}
+        sport_col, men_col, women_col = self._find_competitor_columns(table.columns)
+        if sport_col is None:
+            return {}
         
+        rows = table.typed_rows([col for col in (men_col, women_col) if col is not None])
+        return self._collect_competitors(
+            [row[sport_col].strip() for row in rows],
+            [row[men_col] for row in rows] if men_col is not None else [0] * len(rows),
+            [row[women_col] for row in rows] if women_col is not None else [0] * len(rows)
+        )
+    
+    def _parse_competitors_table(self, df: pd.DataFrame) -> Dict[str, Dict]:
+        """
+        Parse the competitors table from a DataFrame (as read_html returns it).
+        
+        Returns:
+            Dict mapping sport name to {men: int, women: int, total: int}
+        """
         try:
-            # Find sport, men, women columns
-            sport_col = None
-            men_col = None
-            women_col = None
-            
-            for col in df.columns:
-                col_str = str(col).lower()
-                if 'sport' in col_str or 'discipline' in col_str:
-                    if sport_col is None:
-                        sport_col = col
-                if 'men' in col_str and 'women' not in col_str:
-                    men_col = col
-                if 'women' in col_str:
-                    women_col = col
-            
+            sport_col, men_col, women_col = self._find_competitor_columns(df.columns)
             if sport_col is None:
                 return {}
             
-            # Process each row
-            for idx, row in df.iterrows():
-                try:
-                    sport = str(row[sport_col]).strip()
-                    
-                    # Skip invalid rows
-                    if not sport or sport.lower() in ['sport', 'discipline', 'total', 'nan']:
-                        continue
-                    
-                    # Normalize sport name
-                    sport_normalized = self._normalize_sport_name(sport)
-                    if not sport_normalized:
-                        continue
-                    
-                    # Get counts
-                    men = 0
-                    women = 0
-                    
-                    if men_col is not None:
-                        men = self._safe_int(row[men_col])
-                    
-                    if women_col is not None:
-                        women = self._safe_int(row[women_col])
-                    
-                    total = men + women
-                    
-                    if total > 0:
-                        sports_data[sport_normalized] = {
-                            'men': men,
-                            'women': women,
-                            'total': total
-                        }
-                        
-                except Exception as e:
-                    # Skip rows that cause errors
-                    continue
-                    
+            # Each column is read once as a list, then one pass over the rows:
+            # these tables have a few dozen rows at most, too few for pandas
+            # column operations to beat their per-call overhead
+            rows = len(df)
+            sports = [str(value).strip() for value in df.iloc[:, sport_col].tolist()]
+            men = [self._safe_int(value) for value in df.iloc[:, men_col].tolist()] \
+                if men_col is not None else [0] * rows
+            women = [self._safe_int(value) for value in df.iloc[:, women_col].tolist()] \
+                if women_col is not None else [0] * rows
+            return self._collect_competitors(sports, men, women)
         except Exception as e:
             return {}
+    
+    def _collect_competitors(self, sports: List[str], men: List[int],
+                             women: List[int]) -> Dict[str, Dict]:
+        """Build the sport -> counts dict from the table's three columns."""
+        sports_data = {}
+        normalized_names = {}
+        for sport, men_count, women_count in zip(sports, men, women):
+            # Skip invalid rows
+            if not sport or sport.lower() in ['sport', 'discipline', 'total', 'nan']:
+                continue
+            
+            # Normalize each distinct sport name once
+            if sport not in normalized_names:
+                normalized_names[sport] = self._normalize_sport_name(sport)
+            sport_normalized = normalized_names[sport]
+            
+            total = men_count + women_count
+            if sport_normalized and total > 0:
+                # Later rows win for repeated sports
+                sports_data[sport_normalized] = {
+                    'men': men_count,
+                    'women': women_count,
+                    'total': total
+                }
         
         return sports_data
     
@@ -261,23 +317,11 @@ class NationCompetitorsScraper:
         return None
     
     def _safe_int(self, value) -> int:
-        """Safely convert value to int."""
+        """Safely convert value to int (0 where there is no number)."""
         try:
             if pd.notna(value):
-                s = str(value).strip()
-                
-                # Handle malformed data like '4data-sort-value=""'
-                # Extract just the leading digits
-                import re
-                match = re.match(r'^(\d+)', s)
-                if match:
-                    return int(match.group(1))
-                
-                # Try normal conversion
-                s = s.replace(',', '')
-                if s and s not in ['—', '-', '']:
-                    return int(float(s))
-        except:
+                return to_int(str(value))
+        except (TypeError, ValueError):
             pass
         return 0
     
@@ -291,8 +335,28 @@ class NationCompetitorsScraper:
         print(f"✓ Saved to {filepath}")
 
 
+def _parse_page(result: FetchResult) -> Dict[str, Dict]:
+    """Parse one fetched page (runs in a worker process)."""
+    return NationCompetitorsScraper(parse_workers=0, use_cache=False).parse_nation_page(result.body)
+
+
 def main():
     """Main function."""
+    parser = argparse.ArgumentParser(description='Scrape competitors by sport for each nation')
+    parser.add_argument('--base-url', default=WIKIPEDIA_URL,
+                        help='Wiki base URL, e.g. a local server with saved pages (default: Wikipedia)')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Maximum page requests in flight (default: 8)')
+    parser.add_argument('--per-host', type=int, default=2,
+                        help='Maximum requests in flight to one host (default: 2)')
+    parser.add_argument('--host-interval', type=float, default=0.5,
+                        help='Minimum seconds between requests to one host (default: 0.5)')
+    parser.add_argument('--parse-workers', type=int, default=None,
+                        help='Processes to parse pages in (default: CPU count - 1, 0 = in-process)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the shared HTTP cache')
+    args = parser.parse_args()
+    
     print("=" * 70)
     print("Nation Competitors by Sport Scraper")
     print("=" * 70)
@@ -304,7 +368,11 @@ def main():
     
     print(f"Loaded {len(nations)} participating nations")
     
-    scraper = NationCompetitorsScraper()
+    scraper = NationCompetitorsScraper(
+        base_url=args.base_url, concurrency=args.concurrency, per_host=args.per_host,
+        host_interval=args.host_interval, parse_workers=args.parse_workers,
+        use_cache=not args.no_cache
+    )
     
     # Scrape all nations
     results = scraper.scrape_all_nations(nations)
@@ -333,7 +401,7 @@ def main():
         avg_sports = total_sports / len(results) if results else 0
         print(f"\nTotal sport participations: {total_sports}")
         print(f"Average sports per nation: {avg_sports:.1f}")
-        
+    
     else:
         print("\n✗ No data scraped")
 
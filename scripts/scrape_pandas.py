@@ -5,12 +5,19 @@ Scrapes both Winter and All-Time Olympic medal data from Wikipedia.
 
 import json
 import pandas as pd
+import sys
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.html_tables import find_table
+from src.http_cache import fetch_url
 
 
 class PandasOlympicScraper:
-    """Scrapes Olympic data using pandas.read_html()."""
+    """Scrapes Olympic data from Wikipedia medal tables into pandas DataFrames."""
     
     # IOC code mapping for nations where code isn't in parentheses
     NATION_TO_IOC = {
@@ -63,26 +70,20 @@ class PandasOlympicScraper:
         url = "https://en.wikipedia.org/wiki/All-time_Olympic_Games_medal_table"
         
         try:
-            # Read all tables from the page with headers to avoid 403
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            tables = pd.read_html(url, storage_options=headers)
-            
-            print(f"\nFound {len(tables)} tables on page")
+            # Fetch through the shared cache (sends a browser User-Agent to avoid 403)
+            html = fetch_url(url).raise_for_status().body
             
-            # Look for the table with both Summer and Winter columns
-            for i, table in enumerate(tables):
-                cols_str = str(table.columns).lower()
+            # Single pass over the page, stopping at the table with Summer,
+            # Winter and Combined column groups (multi-level header)
+            table = find_table(html, ('summer', 'winter', 'combined'), classes=None)
+            if table is not None:
+                df = table.to_frame()
+                print("\n✓ Found combined medal table")
+                print(f"Shape: {df.shape}")
                 
-                # This table has multi-level columns with Summer, Winter, and Combined
-                if 'summer' in cols_str and 'winter' in cols_str and 'combined' in cols_str:
-                    print(f"\n✓ Found combined medal table (Table {i})")
-                    print(f"Shape: {table.shape}")
-                    
-                    # Parse both winter and all-time from this table
-                    winter_medals, all_time_medals = self._parse_combined_table(table)
-                    return winter_medals, all_time_medals
+                # Parse both winter and all-time from this table
+                winter_medals, all_time_medals = self._parse_combined_table(df)
+                return winter_medals, all_time_medals
             
             print("Could not find combined medal table")
             return {}, {}
@@ -149,87 +150,66 @@ class PandasOlympicScraper:
         if len(winter_cols) >= 5:
             print(f"Winter columns being used: {[df.columns[i] for i in winter_cols[:5]]}")
         
-        # Process each row
-        for idx, row in df.iterrows():
-            try:
-                # Get nation name
-                nation = str(row[team_col])
-                
-                # Skip header rows
-                if pd.isna(nation) or 'team' in nation.lower() or nation.strip() == '':
-                    continue
-                
-                # Extract IOC code
-                ioc_code = self._extract_ioc_code(nation)
-                if not ioc_code:
-                    continue
-                
-                # Get winter medals (typically columns 6-10: No, Gold, Silver, Bronze, Total)
-                if len(winter_cols) >= 5:
-                    winter_gold = self._safe_int(row.iloc[winter_cols[1]])  # Skip "No." column
-                    winter_silver = self._safe_int(row.iloc[winter_cols[2]])
-                    winter_bronze = self._safe_int(row.iloc[winter_cols[3]])
-                    winter_total = self._safe_int(row.iloc[winter_cols[4]])
-                    
-                    if winter_total and winter_total > 0:
-                        winter_medals[ioc_code] = {
-                            'gold': winter_gold or 0,
-                            'silver': winter_silver or 0,
-                            'bronze': winter_bronze or 0,
-                            'total': winter_total
-                        }
-                
-                # Get all-time medals (combined total)
-                if len(combined_cols) >= 5:
-                    all_gold = self._safe_int(row.iloc[combined_cols[1]])
-                    all_silver = self._safe_int(row.iloc[combined_cols[2]])
-                    all_bronze = self._safe_int(row.iloc[combined_cols[3]])
-                    all_total = self._safe_int(row.iloc[combined_cols[4]])
-                    
-                    # Debug specific nations
-                    if ioc_code in ['HUN', 'EST', 'USA']:
-                        print(f"  DEBUG {ioc_code}: Gold={all_gold}, Silver={all_silver}, Bronze={all_bronze}, Total={all_total}")
-                    
-                    if all_total and all_total > 0:
-                        all_time_medals[ioc_code] = {
-                            'gold': all_gold or 0,
-                            'silver': all_silver or 0,
-                            'bronze': all_bronze or 0,
-                            'total': all_total
-                        }
+        # Whole-column operations: one pass per column instead of per row
+        # map(str) like str(cell): missing cells become 'nan'/'None', not NaN
+        nations = df[team_col].map(str)
+        ioc_codes = self._extract_ioc_codes(nations)
+        keep = ioc_codes.notna() & nations.str.strip().ne('') & \
+            ~nations.str.lower().str.contains('team', regex=False)
+        ioc_codes = ioc_codes[keep]
+        
+        def medal_frame(cols: List[int]) -> pd.DataFrame:
+            # Columns after "No.": Gold, Silver, Bronze, Total
+            frame = pd.DataFrame({
+                name: self._to_int_column(df.iloc[:, cols[i]][keep])
+                for i, name in enumerate(('gold', 'silver', 'bronze', 'total'), 1)
+            })
+            return frame[frame['total'] > 0].fillna(0).astype(int)
+        
+        def to_dict(frame: pd.DataFrame) -> Dict[str, Dict]:
+            # Later rows win for repeated codes, as with per-row assignment
+            return dict(zip(ioc_codes.loc[frame.index].tolist(), frame.to_dict('records')))
+        
+        if len(winter_cols) >= 5:
+            winter_medals = to_dict(medal_frame(winter_cols))
+        
+        if len(combined_cols) >= 5:
+            all_time_medals = to_dict(medal_frame(combined_cols))
             
-            except Exception as e:
-                continue
+            # Debug specific nations
+            for ioc_code in ('HUN', 'EST', 'USA'):
+                medals = all_time_medals.get(ioc_code)
+                if medals:
+                    print(f"  DEBUG {ioc_code}: Gold={medals['gold']}, Silver={medals['silver']}, "
+                          f"Bronze={medals['bronze']}, Total={medals['total']}")
         
         print(f"\n✓ Parsed {len(winter_medals)} nations with Winter medals")
         print(f"✓ Parsed {len(all_time_medals)} nations with All-Time medals")
         
         return winter_medals, all_time_medals
     
-    def _extract_ioc_code(self, nation: str) -> str:
-        """Extract IOC code from nation string."""
-        # Clean nation name
-        nation_clean = nation.split('[')[0].strip()
-        
-        # Method 1: From parentheses like "United States (USA)"
-        if '(' in nation and ')' in nation:
-            code = nation.split('(')[1].split(')')[0].strip()
-            if len(code) == 3 and code.isupper():
-                return code
+    def _extract_ioc_codes(self, nations: pd.Series) -> pd.Series:
+        """
+        IOC code of every nation string (NaN where unknown).
         
-        # Method 2: From manual mapping
-        return self.NATION_TO_IOC.get(nation_clean)
+        Uses a three-letter code in parentheses like "United States (USA)",
+        otherwise looks the name (without [notes]) up in NATION_TO_IOC.
+        """
+        has_parens = nations.str.contains('(', regex=False) & nations.str.contains(')', regex=False)
+        # Text after the first '(' up to the next ')'
+        in_parens = nations.str.split('(', n=2).str[1].str.split(')', n=1).str[0].str.strip()
+        in_parens = in_parens.where(has_parens)
+        valid = in_parens.str.len().eq(3) & in_parens.str.isupper().eq(True)
+        by_name = nations.str.split('[', n=1).str[0].str.strip().map(self.NATION_TO_IOC)
+        return in_parens.where(valid, by_name)
     
-    def _safe_int(self, value) -> int:
-        """Safely convert value to int, return None if not possible."""
-        try:
-            if pd.notna(value):
-                s = str(value).strip().replace(',', '')
-                if s and s not in ['—', '-', '']:
-                    return int(float(s))
-        except:
-            pass
-        return None
+    def _to_int_column(self, values: pd.Series) -> pd.Series:
+        """Bulk numeric coercion: '1,234' -> 1234; NaN for blanks, dashes and text."""
+        text = values.map(str).str.strip().str.replace(',', '', regex=False)
+        numbers = pd.to_numeric(text, errors='coerce')
+        # int64 casts truncate like int(float(s)); infinities count as missing
+        in_range = numbers.abs().lt(2 ** 63)
+        return numbers.where(in_range, 0).astype('int64').where(in_range)
     
     def save_to_json(self, data: Dict, filepath: str):
         """Save data to JSON file."""
@@ -315,7 +295,7 @@ def main():
         else:
             print("⚠ SOME TESTS FAILED - Review the data")
         print("=" * 70)
-        
+    
     else:
         print("\n✗ No data scraped")
 
@@ -4,9 +4,16 @@ Scrape the list of participating NOCs for 2026 Winter Olympics.
 
 import json
 import pandas as pd
+import sys
+from io import StringIO
 from pathlib import Path
 from typing import List, Dict
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.http_cache import fetch_url
+
 
 class ParticipatingNationsScraper:
     """Scrapes list of participating nations from 2026 Winter Olympics Wikipedia page."""
@@ -62,11 +69,9 @@ class ParticipatingNationsScraper:
         url = "https://en.wikipedia.org/wiki/2026_Winter_Olympics"
         
         try:
-            # Read all tables from the page with headers to avoid 403
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            tables = pd.read_html(url, storage_options=headers)
+            # Fetch through the shared cache (sends a browser User-Agent to avoid 403)
+            html = fetch_url(url).raise_for_status().text
+            tables = pd.read_html(StringIO(html))
             
             print(f"\nFound {len(tables)} tables on page")
             
@@ -4,10 +4,16 @@ More reliable than Wikipedia for population data.
 """
 
 import json
-import requests
+import sys
 from pathlib import Path
 from typing import Dict
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.fetch import FetchError
+from src.http_cache import fetch_url
+
 
 class PopulationScraper:
     """Scrapes population data from REST Countries API."""
@@ -110,9 +116,7 @@ class PopulationScraper:
         print("Fetching population data from REST Countries API...")
         
         try:
-            response = requests.get(self.API_URL)
-            response.raise_for_status()
-            countries = response.json()
+            countries = fetch_url(self.API_URL).raise_for_status().json()
             
             population_data = {}
             
@@ -135,7 +139,7 @@ class PopulationScraper:
             print(f"\n✓ Scraped population for {len(population_data)} nations")
             return population_data
         
-        except requests.RequestException as e:
+        except (FetchError, ValueError) as e:
             print(f"Error fetching data: {e}")
             return {}
     
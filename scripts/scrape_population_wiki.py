@@ -4,9 +4,16 @@ Scrape population data for countries from Wikipedia.
 
 import json
 import pandas as pd
+import sys
+from io import StringIO
 from pathlib import Path
 from typing import Dict
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.http_cache import fetch_url
+
 
 class PopulationScraper:
     """Scrapes population data from Wikipedia."""
@@ -63,11 +70,9 @@ class PopulationScraper:
         url = "https://en.wikipedia.org/wiki/List_of_countries_and_dependencies_by_population"
         
         try:
-            # Read all tables from the page with headers to avoid 403
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            tables = pd.read_html(url, storage_options=headers)
+            # Fetch through the shared cache (sends a browser User-Agent to avoid 403)
+            html = fetch_url(url).raise_for_status().text
+            tables = pd.read_html(StringIO(html))
             
             print(f"\nFound {len(tables)} tables on page")
             
@@ -3,12 +3,18 @@ Data scraper for Olympic medals and population from Wikipedia.
 """
 
 import json
-import requests
+import sys
 from bs4 import BeautifulSoup
 import pandas as pd
 from pathlib import Path
 from typing import Dict, Optional
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.fetch import FetchError
+from src.http_cache import fetch_url
+
 
 class WikipediaOlympicScraper:
     """Scrapes Olympic medal data from Wikipedia."""
@@ -18,12 +24,6 @@ class WikipediaOlympicScraper:
     WINTER_MEDALS_URL = "https://en.wikipedia.org/wiki/All-time_Winter_Olympic_Games_medal_table"
     POPULATION_URL = "https://en.wikipedia.org/wiki/List_of_countries_by_population_(United_Nations)"
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-    
     def scrape_all_time_medals(self) -> Dict[str, Dict]:
         """
         Scrape all-time Olympic medal counts (Summer + Winter combined).
@@ -34,9 +34,8 @@ class WikipediaOlympicScraper:
         print("Scraping all-time Olympic medals from Wikipedia...")
         
         try:
-            response = self.session.get(self.ALL_TIME_MEDALS_URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = fetch_url(self.ALL_TIME_MEDALS_URL).raise_for_status()
+            soup = BeautifulSoup(response.body, 'html.parser')
             
             # Find the medal table (usually the first wikitable)
             table = soup.find('table', {'class': 'wikitable'})
@@ -109,7 +108,7 @@ class WikipediaOlympicScraper:
             print(f"\n✓ Scraped {len(medals_data)} nations")
             return medals_data
         
-        except requests.RequestException as e:
+        except FetchError as e:
             print(f"Error fetching data: {e}")
             return {}
     
@@ -123,9 +122,8 @@ class WikipediaOlympicScraper:
         print("Scraping Winter Olympic medals from Wikipedia...")
         
         try:
-            response = self.session.get(self.WINTER_MEDALS_URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = fetch_url(self.WINTER_MEDALS_URL).raise_for_status()
+            soup = BeautifulSoup(response.body, 'html.parser')
             
             # Find the medal table
             table = soup.find('table', {'class': 'wikitable'})
@@ -183,7 +181,7 @@ class WikipediaOlympicScraper:
             print(f"\n✓ Scraped {len(medals_data)} nations")
             return medals_data
         
-        except requests.RequestException as e:
+        except FetchError as e:
             print(f"Error fetching data: {e}")
             return {}
     
@@ -197,9 +195,8 @@ class WikipediaOlympicScraper:
         print("Scraping population data from Wikipedia...")
         
         try:
-            response = self.session.get(self.POPULATION_URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = fetch_url(self.POPULATION_URL).raise_for_status()
+            soup = BeautifulSoup(response.body, 'html.parser')
             
             # Find the population table
             table = soup.find('table', {'class': 'wikitable'})
@@ -217,7 +214,7 @@ class WikipediaOlympicScraper:
             
             return population_data
         
-        except requests.RequestException as e:
+        except FetchError as e:
             print(f"Error fetching data: {e}")
             return {}
     
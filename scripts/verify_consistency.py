@@ -6,21 +6,24 @@ Verify cross-page data consistency for Overview and Schedule.
 - Ensure name mapping covers schedule names
 - Check sports/athletes presence for participating nations
 """
-import json
+import sys
 from pathlib import Path
 
 BASE = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE))
+
+from src.snapshot import load_json
 
 # Load files
-participating = json.loads((BASE / 'data' / 'participating_nations_2026.json').read_text(encoding='utf-8'))
-nation_schedules = json.loads((BASE / 'data' / 'nation_schedules_2026.json').read_text(encoding='utf-8'))
-daily_schedule = json.loads((BASE / 'data' / 'daily_underdog_schedule_2026.json').read_text(encoding='utf-8'))
+participating = load_json(BASE / 'data' / 'participating_nations_2026.json')
+nation_schedules = load_json(BASE / 'data' / 'nation_schedules_2026.json')
+daily_schedule = load_json(BASE / 'data' / 'daily_underdog_schedule_2026.json')
 try:
-    event_nations = json.loads((BASE / 'data' / 'event_nations_2026.json').read_text(encoding='utf-8'))
+    event_nations = load_json(BASE / 'data' / 'event_nations_2026.json')
 except FileNotFoundError:
     event_nations = {}
-athletes = json.loads((BASE / 'data' / 'athlete_counts_2026.json').read_text(encoding='utf-8'))
-nation_sports = json.loads((BASE / 'data' / 'nation_sports_participation_2026.json').read_text(encoding='utf-8'))
+athletes = load_json(BASE / 'data' / 'athlete_counts_2026.json')
+nation_sports = load_json(BASE / 'data' / 'nation_sports_participation_2026.json')
 gen = (BASE / 'scripts' / 'generate_html_overview.py').read_text(encoding='utf-8')
 
 # Build mapping IOC->Full Name
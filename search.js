@@ -0,0 +1,124 @@
+/*
+ * Site search box. Fills every <div data-site-search></div> with an input
+ * that queries search_index.json (built by scripts/build_search_index.py)
+ * in memory. The index is fetched on first focus and holds:
+ *   docs:     [type, label, detail, url]  (type 0 nation, 1 sport, 2 event)
+ *   tokens:   sorted, accent-folded tokens
+ *   postings: doc ids per token
+ * Every query word is matched as a token prefix; results match all words.
+ */
+(function () {
+    const indexUrl = new URL('search_index.json', document.currentScript.src);
+    const TYPE_LABELS = ['Nation', 'Sport', 'Event'];
+    const MAX_RESULTS = 8;
+    let index = null;
+    let loading = null;
+
+    const style = document.createElement('style');
+    style.textContent = `
+        .site-search { position: relative; max-width: 420px; margin: 15px auto 0; text-align: left; }
+        .site-search input { width: 100%; padding: 10px 14px; border-radius: 8px; border: none; font-size: 15px; }
+        .site-search ul { position: absolute; left: 0; right: 0; z-index: 10; list-style: none; margin: 4px 0 0;
+            padding: 0; background: #16213e; border-radius: 8px; box-shadow: 0 8px 20px rgba(0,0,0,0.5); }
+        .site-search li a { display: flex; justify-content: space-between; gap: 10px; padding: 8px 14px;
+            color: #e0e0e0; text-decoration: none; }
+        .site-search li a:hover, .site-search li a.active { background: #0f3460; }
+        .site-search .search-detail { opacity: 0.7; font-size: 0.85em; white-space: nowrap; }
+    `;
+    document.head.appendChild(style);
+
+    function tokenize(text) {
+        // Must match tokenize() in scripts/build_search_index.py
+        return text.normalize('NFKD').replace(/[\u0300-\u036f]/g, '').toLowerCase()
+            .split(/[^a-z0-9]+/).filter(Boolean);
+    }
+
+    function loadIndex() {
+        if (!loading) {
+            loading = fetch(indexUrl)
+                .then(response => {
+                    if (!response.ok) throw new Error(response.status);
+                    return response.json();
+                })
+                .then(data => { index = data; })
+                .catch(error => { loading = null; throw error; });
+        }
+        return loading;
+    }
+
+    function lowerBound(tokens, prefix) {
+        let low = 0;
+        let high = tokens.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (tokens[mid] < prefix) low = mid + 1; else high = mid;
+        }
+        return low;
+    }
+
+    function matchPrefix(prefix) {
+        const ids = new Set();
+        for (let i = lowerBound(index.tokens, prefix);
+             i < index.tokens.length && index.tokens[i].startsWith(prefix); i++) {
+            index.postings[i].forEach(id => ids.add(id));
+        }
+        return ids;
+    }
+
+    function search(query) {
+        let matches = null;
+        for (const word of tokenize(query)) {
+            const ids = matchPrefix(word);
+            matches = matches === null ? ids : new Set([...matches].filter(id => ids.has(id)));
+            if (!matches.size) break;
+        }
+        if (!matches) return [];
+        return [...matches]
+            .map(id => index.docs[id])
+            .sort((a, b) => a[0] - b[0] || a[1].localeCompare(b[1]))
+            .slice(0, MAX_RESULTS);
+    }
+
+    function escapeHtml(text) {
+        return String(text).replace(/[&<>"']/g, c => ({
+            '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+        })[c]);
+    }
+
+    function attach(container) {
+        container.classList.add('site-search');
+        container.innerHTML = '<input type="search" placeholder="🔍 Search nations, sports, events..." ' +
+            'aria-label="Search the site" autocomplete="off"><ul hidden></ul>';
+        const input = container.querySelector('input');
+        const list = container.querySelector('ul');
+
+        function render() {
+            const results = index ? search(input.value) : [];
+            list.innerHTML = results.map(([type, label, detail, url], i) =>
+                `<li><a href="${escapeHtml(new URL(url, indexUrl).href)}"${i === 0 ? ' class="active"' : ''}>` +
+                `<span>${escapeHtml(label)}</span>` +
+                `<span class="search-detail">${TYPE_LABELS[type]} · ${escapeHtml(detail)}</span></a></li>`
+            ).join('');
+            list.hidden = results.length === 0;
+        }
+
+        input.addEventListener('focus', () => loadIndex().then(render, () => {}));
+        input.addEventListener('input', () => {
+            if (index) render(); else loadIndex().then(render, () => {});
+        });
+        input.addEventListener('keydown', event => {
+            if (event.key === 'Enter') {
+                const first = list.querySelector('a');
+                if (first) window.location.href = first.href;
+            } else if (event.key === 'Escape') {
+                input.value = '';
+                list.hidden = true;
+            }
+        });
+        document.addEventListener('click', event => {
+            if (!container.contains(event.target)) list.hidden = true;
+        });
+    }
+
+    document.querySelectorAll('[data-site-search]').forEach(attach);
+})();
@@ -2,11 +2,15 @@
 Data loader for Olympic schedule, medals, and population data.
 """
 
-import json
 from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
 
+from src.snapshot import load_json
+from src.nation_table import (
+    NationTable, HAS_MEDALS, HAS_WINTER_MEDALS, HAS_POPULATION, HAS_ATHLETES
+)
+
 
 class DataLoader:
     """Handles loading and parsing of all data sources."""
@@ -14,8 +18,16 @@ class DataLoader:
     def __init__(self, config: Dict):
         self.config = config
         self.schedule_data = None
-        self.medals_data = None
-        self.population_data = None
+        self.date_nations: Dict[str, frozenset] = {}
+        self.date_sport_events: Dict[str, Dict[str, List[Dict]]] = {}
+        self.nation_dates: Dict[str, List[str]] = {}
+        self.nations = NationTable()
+        self.medals_loaded = False
+        self.winter_medals_loaded = False
+        self.population_loaded = False
+        self.athlete_counts_loaded = False
+        # Bumped on every (re)load so dependents can invalidate their caches
+        self.version = 0
     
     def load_schedule(self, schedule_path: Optional[str] = None) -> Dict:
         """
@@ -38,16 +50,49 @@ class DataLoader:
         }
         """
         path = schedule_path or self.config['data_paths']['schedule']
+        self.version += 1
         
         if not Path(path).exists():
             print(f"Warning: Schedule file not found at {path}. Using empty schedule.")
+            self.schedule_data = {}
+            self._build_schedule_index()
             return {}
         
-        with open(path, 'r') as f:
-            self.schedule_data = json.load(f)
+        self.schedule_data = load_json(path)
         
+        self._build_schedule_index()
         return self.schedule_data
     
+    def _build_schedule_index(self):
+        """
+        Index the schedule once: date -> nations, date -> sport -> events,
+        and nation -> sorted dates.
+        """
+        date_nations = {}
+        date_sport_events = {}
+        nation_dates = {}
+        
+        for date, events in self.schedule_data.items():
+            nations = set()
+            by_sport = {}
+            
+            for event in events:
+                if 'nations' in event:
+                    nations.update(event['nations'])
+                by_sport.setdefault(event.get('sport', 'Unknown'), []).append(event)
+            
+            date_nations[date] = frozenset(nations)
+            date_sport_events[date] = by_sport
+            for nation in nations:
+                nation_dates.setdefault(nation, []).append(date)
+        
+        for dates in nation_dates.values():
+            dates.sort()
+        
+        self.date_nations = date_nations
+        self.date_sport_events = date_sport_events
+        self.nation_dates = nation_dates
+    
     def load_medals(self, medals_path: Optional[str] = None) -> Dict:
         """
         Load historical Olympic medal data.
@@ -62,15 +107,36 @@ class DataLoader:
         }
         """
         path = medals_path or self.config['data_paths']['medals']
+        self.medals_loaded = True
+        self.version += 1
         
         if not Path(path).exists():
             print(f"Warning: Medals file not found at {path}. Using empty medals data.")
             return {}
         
-        with open(path, 'r') as f:
-            self.medals_data = json.load(f)
+        medals_data = load_json(path)
         
-        return self.medals_data
+        self.nations.load_medals(medals_data)
+        return medals_data
+    
+    def load_winter_medals(self, winter_medals_path: Optional[str] = None) -> Dict:
+        """
+        Load Winter Olympic medal data (same format as load_medals).
+        """
+        path = winter_medals_path or self.config['data_paths'].get(
+            'winter_medals', 'data/medals/winter_medals.json'
+        )
+        self.winter_medals_loaded = True
+        self.version += 1
+        
+        if not Path(path).exists():
+            print(f"Warning: Winter medals file not found at {path}. Using empty winter medals data.")
+            return {}
+        
+        winter_medals_data = load_json(path)
+        
+        self.nations.load_medals(winter_medals_data, prefix='winter_', flag=HAS_WINTER_MEDALS)
+        return winter_medals_data
     
     def load_population(self, population_path: Optional[str] = None) -> Dict:
         """
@@ -86,21 +152,51 @@ class DataLoader:
         }
         """
         path = population_path or self.config['data_paths']['population']
+        self.population_loaded = True
+        self.version += 1
         
         if not Path(path).exists():
             print(f"Warning: Population file not found at {path}. Using empty population data.")
             return {}
         
-        with open(path, 'r') as f:
-            self.population_data = json.load(f)
+        population_data = load_json(path)
         
-        return self.population_data
+        self.nations.load_counts('population', population_data, HAS_POPULATION)
+        return population_data
+    
+    def load_athlete_counts(self, athlete_counts_path: Optional[str] = None) -> Dict:
+        """
+        Load 2026 athlete counts by nation.
+        
+        Expected format:
+        {
+            "USA": 237,
+            "LIE": 9,
+            ...
+        }
+        """
+        path = athlete_counts_path or self.config['data_paths'].get(
+            'athlete_counts', 'data/athlete_counts_2026.json'
+        )
+        self.athlete_counts_loaded = True
+        self.version += 1
+        
+        if not Path(path).exists():
+            print(f"Warning: Athlete counts file not found at {path}. Using empty athlete counts.")
+            return {}
+        
+        athlete_counts = load_json(path)
+        
+        self.nations.load_counts('athletes', athlete_counts, HAS_ATHLETES)
+        return athlete_counts
     
     def load_all(self):
         """Load all data sources."""
         self.load_schedule()
         self.load_medals()
+        self.load_winter_medals()
         self.load_population()
+        self.load_athlete_counts()
     
     def get_events_for_date(self, date: str) -> List[Dict]:
         """Get all events for a specific date."""
@@ -109,32 +205,62 @@ class DataLoader:
         
         return self.schedule_data.get(date, [])
     
-    def get_competing_nations_for_date(self, date: str) -> set:
+    def get_competing_nations_for_date(self, date: str) -> frozenset:
         """Get all nations competing on a specific date."""
-        events = self.get_events_for_date(date)
-        nations = set()
+        if self.schedule_data is None:
+            self.load_schedule()
+        
+        return self.date_nations.get(date, frozenset())
+    
+    def get_events_by_sport(self, date: str) -> Dict[str, List[Dict]]:
+        """Get events for a specific date grouped by sport."""
+        if self.schedule_data is None:
+            self.load_schedule()
         
-        for event in events:
-            if 'nations' in event:
-                nations.update(event['nations'])
+        return self.date_sport_events.get(date, {})
+    
+    def get_dates_for_nation(self, ioc_code: str) -> List[str]:
+        """Get all dates (sorted) on which a nation competes."""
+        if self.schedule_data is None:
+            self.load_schedule()
         
-        return nations
+        return self.nation_dates.get(ioc_code, [])
     
     def get_nation_medals(self, ioc_code: str) -> Dict:
         """Get medal count for a nation."""
-        if self.medals_data is None:
+        if not self.medals_loaded:
             self.load_medals()
         
-        return self.medals_data.get(ioc_code, {
-            "gold": 0,
-            "silver": 0,
-            "bronze": 0,
-            "total": 0
-        })
+        return self.nations.medals(ioc_code)
+    
+    def get_nation_winter_medals(self, ioc_code: str) -> Dict:
+        """Get Winter Olympic medal count for a nation."""
+        if not self.winter_medals_loaded:
+            self.load_winter_medals()
+        
+        return self.nations.medals(ioc_code, prefix='winter_')
     
     def get_nation_population(self, ioc_code: str) -> int:
         """Get population for a nation."""
-        if self.population_data is None:
+        if not self.population_loaded:
             self.load_population()
         
-        return self.population_data.get(ioc_code, 0)
+        return self.nations.get(ioc_code, 'population')
+    
+    def get_nation_athlete_count(self, ioc_code: str) -> int:
+        """Get number of 2026 athletes for a nation."""
+        if not self.athlete_counts_loaded:
+            self.load_athlete_counts()
+        
+        return self.nations.get(ioc_code, 'athletes')
+    
+    def is_southern_hemisphere(self, ioc_code: str) -> bool:
+        """Check whether a nation lies in the Southern Hemisphere."""
+        return self.nations.is_southern(ioc_code)
+    
+    def get_medal_nations(self) -> List[str]:
+        """Get all nations present in the medals data."""
+        if not self.medals_loaded:
+            self.load_medals()
+        
+        return self.nations.codes_with(HAS_MEDALS)
@@ -6,10 +6,15 @@ Used by watchlist generator to show only events where underdogs are present.
 """
 
 import json
+from bisect import bisect_left, insort
 from pathlib import Path
 from typing import Dict, List, Set
 from datetime import datetime
 
+from src.snapshot import load_json
+from src.nation_table import NationTable
+from src.underdog_criteria import evaluate as evaluate_criteria
+
 
 class EventUnderdogMapper:
     """Maps underdog nations to specific events and competition dates."""
@@ -20,61 +25,48 @@ class EventUnderdogMapper:
         self.underdog_nations = set()
         self.event_mappings = {}
         
+        # Secondary indexes, kept in sync by add_event_mapping/load_mappings.
+        # Entries are (sort_key, insertion_seq, event_key) so each list stays
+        # sorted exactly like a stable sort over event_mappings would be.
+        self._event_seq = {}
+        self._date_index = {}
+        self._nation_index = {}
+        self._discipline_index = {}
+        
     def load_schedule(self, schedule_file: str = "schedules/ioc_schedule_authoritative.json"):
         """Load the authoritative IOC schedule."""
         schedule_path = self.data_dir / schedule_file
-        with open(schedule_path, 'r', encoding='utf-8') as f:
-            self.schedule_data = json.load(f)
+        self.schedule_data = load_json(schedule_path)
         print(f"✓ Loaded schedule from {schedule_file}")
         
     def load_underdog_nations(self):
         """Load the list of underdog nations from participating nations."""
         # Load participating nations
         nations_path = self.data_dir / "participating_nations_2026.json"
-        with open(nations_path, 'r', encoding='utf-8') as f:
-            nations = json.load(f)
+        nations = load_json(nations_path)
         
         # Load medal and population data
         medals_path = self.data_dir / "medals" / "all_time_medals.json"
-        with open(medals_path, 'r', encoding='utf-8') as f:
-            all_time_medals = json.load(f)
+        all_time_medals = load_json(medals_path)
             
         winter_medals_path = self.data_dir / "medals" / "winter_medals.json"
-        with open(winter_medals_path, 'r', encoding='utf-8') as f:
-            winter_medals = json.load(f)
+        winter_medals = load_json(winter_medals_path)
             
         population_path = self.data_dir / "population" / "population.json"
-        with open(population_path, 'r', encoding='utf-8') as f:
-            population = json.load(f)
+        population = load_json(population_path)
         
-        # Identify underdogs based on criteria
-        southern_hemisphere = {"AUS", "ARG", "BRA", "CHI", "NZL", "RSA", "URU", "ECU"}
+        athlete_counts_path = self.data_dir / "athlete_counts_2026.json"
+        athlete_counts = load_json(athlete_counts_path) if athlete_counts_path.exists() else {}
         
-        for nation in nations:
-            criteria_met = []
-            
-            # Check criteria
-            if nation not in all_time_medals or all_time_medals[nation].get('gold', 0) == 0:
-                criteria_met.append("no_olympic_gold")
-            
-            if nation not in all_time_medals or all_time_medals[nation].get('total', 0) == 0:
-                criteria_met.append("no_olympic_medals")
-            
-            pop = population.get(nation, float('inf'))
-            if 0 < pop < 1_000_000:
-                criteria_met.append("population_under_1m")
-            
-            if nation not in winter_medals or winter_medals[nation].get('gold', 0) == 0:
-                criteria_met.append("no_winter_gold")
-            
-            if nation not in winter_medals or winter_medals[nation].get('total', 0) == 0:
-                criteria_met.append("no_winter_medals")
-            
-            if nation in southern_hemisphere:
-                criteria_met.append("southern_hemisphere")
-            
-            if len(criteria_met) > 0:
-                self.underdog_nations.add(nation)
+        # Identify underdogs with the shared criteria engine
+        table = NationTable.from_sources(
+            medals=all_time_medals,
+            winter_medals=winter_medals,
+            population=population,
+            athletes=athlete_counts,
+            nations=nations
+        )
+        self.underdog_nations.update(evaluate_criteria(table, nations).underdogs())
         
         print(f"✓ Loaded {len(self.underdog_nations)} underdog nations")
         
@@ -99,7 +91,7 @@ class EventUnderdogMapper:
         valid_underdogs = [n for n in underdog_nations if n in self.underdog_nations]
         
         if valid_underdogs:
-            self.event_mappings[event_key] = {
+            mapping = {
                 "discipline": discipline,
                 "event": event,
                 "date": date,
@@ -107,45 +99,76 @@ class EventUnderdogMapper:
                 "underdog_nations": sorted(valid_underdogs),
                 "underdog_count": len(valid_underdogs)
             }
+            previous = self.event_mappings.get(event_key)
+            self.event_mappings[event_key] = mapping
+            self._index_mapping(event_key, mapping, previous)
+    
+    def _index_mapping(self, event_key: str, mapping: Dict, previous: Dict = None):
+        """Add (or re-index a replaced) mapping in the date/nation/discipline indexes."""
+        discipline = mapping["discipline"]
+        date = mapping["date"]
+        
+        if previous is None:
+            seq = len(self._event_seq)
+            self._event_seq[event_key] = seq
+            insort(self._date_index.setdefault(date, []), (discipline, seq, event_key))
+            
+            info = self._discipline_index.setdefault(discipline, {
+                "events": [],
+                "dates": {},
+                "underdogs": {}
+            })
+            info["events"].append(mapping["event"])
+            info["dates"][date] = info["dates"].get(date, 0) + 1
+            old_nations = set()
+        else:
+            # Same key means same discipline/event/date; only nations can change
+            seq = self._event_seq[event_key]
+            info = self._discipline_index[discipline]
+            old_nations = set(previous["underdog_nations"])
+        
+        new_nations = set(mapping["underdog_nations"])
+        entry = (date, seq, event_key)
+        
+        for nation in old_nations - new_nations:
+            entries = self._nation_index[nation]
+            del entries[bisect_left(entries, entry)]
+            info["underdogs"][nation] -= 1
+            if not info["underdogs"][nation]:
+                del info["underdogs"][nation]
+        
+        for nation in new_nations - old_nations:
+            insort(self._nation_index.setdefault(nation, []), entry)
+            info["underdogs"][nation] = info["underdogs"].get(nation, 0) + 1
+    
+    def _rebuild_indexes(self):
+        """Rebuild all secondary indexes from event_mappings."""
+        self._event_seq = {}
+        self._date_index = {}
+        self._nation_index = {}
+        self._discipline_index = {}
+        for event_key, mapping in self.event_mappings.items():
+            self._index_mapping(event_key, mapping)
             
     def get_events_for_date(self, date: str) -> List[Dict]:
         """Get all events with underdogs on a specific date."""
-        events = []
-        for key, mapping in self.event_mappings.items():
-            if mapping["date"] == date:
-                events.append(mapping)
-        return sorted(events, key=lambda x: x["discipline"])
+        return [self.event_mappings[key] for _, _, key in self._date_index.get(date, [])]
     
     def get_events_for_nation(self, ioc_code: str) -> List[Dict]:
         """Get all events where a specific nation is competing."""
-        events = []
-        for key, mapping in self.event_mappings.items():
-            if ioc_code in mapping["underdog_nations"]:
-                events.append(mapping)
-        return sorted(events, key=lambda x: x["date"])
+        return [self.event_mappings[key] for _, _, key in self._nation_index.get(ioc_code, [])]
     
     def get_discipline_summary(self) -> Dict[str, Dict]:
         """Get summary of underdog participation by discipline."""
         summary = {}
-        for key, mapping in self.event_mappings.items():
-            discipline = mapping["discipline"]
-            if discipline not in summary:
-                summary[discipline] = {
-                    "events": [],
-                    "dates": set(),
-                    "underdogs": set(),
-                    "event_count": 0
-                }
-            
-            summary[discipline]["events"].append(mapping["event"])
-            summary[discipline]["dates"].add(mapping["date"])
-            summary[discipline]["underdogs"].update(mapping["underdog_nations"])
-            summary[discipline]["event_count"] += 1
-        
-        # Convert sets to sorted lists for JSON serialization
-        for discipline in summary:
-            summary[discipline]["dates"] = sorted(list(summary[discipline]["dates"]))
-            summary[discipline]["underdogs"] = sorted(list(summary[discipline]["underdogs"]))
+        for discipline, info in self._discipline_index.items():
+            # Sorted lists for JSON serialization
+            summary[discipline] = {
+                "events": list(info["events"]),
+                "dates": sorted(info["dates"]),
+                "underdogs": sorted(info["underdogs"]),
+                "event_count": len(info["events"])
+            }
         
         return summary
     
@@ -173,11 +196,11 @@ class EventUnderdogMapper:
     def load_mappings(self, input_file: str = "event_underdog_mappings.json"):
         """Load previously saved mappings."""
         input_path = self.data_dir / input_file
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(input_path)
         
         self.event_mappings = data["event_mappings"]
         self.underdog_nations = set(data["metadata"]["underdog_nations"])
+        self._rebuild_indexes()
         
         print(f"✓ Loaded {len(self.event_mappings)} event mappings")
         return data
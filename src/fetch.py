@@ -0,0 +1,217 @@
+"""
+Concurrent HTTP fetching for the scrapers.
+
+FetchEngine drives many requests from one asyncio event loop. Blocking
+transfers run on a thread pool, bounded by a global concurrency limit and a
+per-host politeness budget (requests in flight per host and a minimum gap
+between request starts). Response bodies can be handed to a process pool
+for parsing, so a refresh is limited by bandwidth rather than by serial
+round trips and parse time.
+
+The transport is a plain function (url, headers, timeout) -> FetchResult,
+so tests can point the engine at a local HTTP server or swap the transport.
+"""
+
+import asyncio
+import http.client
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Statuses worth retrying after a back-off
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """Raised by FetchResult.raise_for_status() for failed requests."""
+
+
+class FetchResult(NamedTuple):
+    """Outcome of one request (status 0 means the transfer itself failed)."""
+    url: str
+    status: int
+    body: bytes = b''
+    headers: Dict[str, str] = {}
+    error: Optional[str] = None
+    
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+    
+    @property
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+    
+    def json(self) -> Any:
+        return json.loads(self.body)
+    
+    def raise_for_status(self) -> 'FetchResult':
+        """Raise FetchError unless the request succeeded; returns self for chaining."""
+        if not self.ok:
+            raise FetchError(f"{self.url}: {self.error or f'HTTP {self.status}'}")
+        return self
+
+
+Transport = Callable[[str, Dict[str, str], float], FetchResult]
+
+
+def http_get(url: str, headers: Dict[str, str], timeout: float) -> FetchResult:
+    """Blocking GET with urllib; HTTP errors are returned, not raised."""
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return FetchResult(url, response.status, response.read(), dict(response.headers))
+    except urllib.error.HTTPError as e:
+        return FetchResult(url, e.code, e.read() or b'', dict(e.headers or {}), str(e))
+    except (urllib.error.URLError, OSError) as e:
+        return FetchResult(url, 0, error=str(getattr(e, 'reason', e)))
+    except (http.client.HTTPException, ValueError) as e:
+        # Truncated/garbled responses (e.g. IncompleteRead) and malformed URLs
+        return FetchResult(url, 0, error=f"{type(e).__name__}: {e}")
+
+
+class FetchEngine:
+    """Fetches URLs concurrently within global and per-host limits."""
+    
+    def __init__(self, concurrency: int = 8, per_host: int = 2, host_interval: float = 0.25,
+                 timeout: float = 30.0, retries: int = 2, headers: Optional[Dict[str, str]] = None,
+                 transport: Transport = http_get):
+        """
+        Args:
+            concurrency: Maximum requests in flight overall
+            per_host: Maximum requests in flight to any one host
+            host_interval: Minimum seconds between request starts to one host
+            timeout: Per-request timeout in seconds
+            retries: Extra attempts for connection errors and 429/5xx responses
+            headers: Request headers (a browser-like User-Agent by default)
+            transport: Blocking fetch function, e.g. http_get
+        """
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.host_interval = host_interval
+        self.timeout = timeout
+        self.retries = retries
+        self.headers = headers or {'User-Agent': DEFAULT_USER_AGENT}
+        self.transport = transport
+    
+    def run(self, urls: Iterable[str], parse: Optional[Callable[[FetchResult], Any]] = None,
+            parse_workers: int = 0,
+            on_result: Optional[Callable[[FetchResult, Any, Optional[BaseException]], None]] = None
+            ) -> Dict[str, Tuple[FetchResult, Any]]:
+        """
+        Fetch every URL and optionally parse each successful response.
+        
+        Args:
+            urls: URLs to fetch (duplicates are fetched once)
+            parse: Picklable function applied to each 2xx FetchResult
+            parse_workers: Processes to parse in (0 = a worker thread)
+            on_result: Called in completion order with (result, parsed, parse error)
+        
+        Returns:
+            Dict mapping URL -> (FetchResult, parsed value or None)
+        """
+        return asyncio.run(self.fetch_all(urls, parse, parse_workers, on_result))
+    
+    async def fetch_all(self, urls: Iterable[str], parse: Optional[Callable[[FetchResult], Any]] = None,
+                        parse_workers: int = 0,
+                        on_result: Optional[Callable[[FetchResult, Any, Optional[BaseException]], None]] = None
+                        ) -> Dict[str, Tuple[FetchResult, Any]]:
+        """Async version of run()."""
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        
+        io_pool = ThreadPoolExecutor(max_workers=min(self.concurrency, len(urls)))
+        parse_pool: Optional[Executor] = None
+        if parse is not None and parse_workers > 0:
+            parse_pool = ProcessPoolExecutor(max_workers=min(parse_workers, len(urls)))
+        
+        limit = asyncio.Semaphore(self.concurrency)
+        hosts: Dict[str, Dict] = {}
+        results: Dict[str, Tuple[FetchResult, Any]] = {}
+        
+        async def handle(url: str):
+            # Failures are recorded for their URL so one bad request (or a
+            # failing callback) never cancels the rest of the run
+            try:
+                result = await self._fetch(url, io_pool, limit, hosts)
+            except Exception as e:
+                result = FetchResult(url, 0, error=f"{type(e).__name__}: {e}")
+            parsed = None
+            error = None
+            if parse is not None and result.ok:
+                loop = asyncio.get_running_loop()
+                try:
+                    parsed = await loop.run_in_executor(parse_pool or io_pool, parse, result)
+                except Exception as e:
+                    error = e
+            results[url] = (result, parsed)
+            if on_result is not None:
+                try:
+                    on_result(result, parsed, error)
+                except Exception as e:
+                    print(f"Warning: result callback failed for {url} ({type(e).__name__}: {e})")
+        
+        try:
+            await asyncio.gather(*(handle(url) for url in urls))
+        finally:
+            io_pool.shutdown(wait=False)
+            if parse_pool is not None:
+                parse_pool.shutdown()
+        
+        return {url: results[url] for url in urls}
+    
+    async def _fetch(self, url: str, io_pool: Executor, limit: asyncio.Semaphore,
+                     hosts: Dict[str, Dict]) -> FetchResult:
+        """Fetch one URL within the limits, retrying transient failures."""
+        loop = asyncio.get_running_loop()
+        host = urlsplit(url).netloc
+        state = hosts.get(host)
+        if state is None:
+            state = hosts[host] = {
+                'slots': asyncio.Semaphore(self.per_host),
+                'lock': asyncio.Lock(),
+                'next_start': 0.0
+            }
+        
+        result = None
+        for attempt in range(self.retries + 1):
+            async with state['slots'], limit:
+                # Space out request starts to the same host
+                async with state['lock']:
+                    delay = state['next_start'] - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    state['next_start'] = time.monotonic() + self.host_interval
+                
+                result = await loop.run_in_executor(
+                    io_pool, self.transport, url, self.headers, self.timeout
+                )
+            
+            if result.status not in RETRY_STATUSES and result.status != 0:
+                return result
+            if attempt < self.retries:
+                await asyncio.sleep(_retry_delay(result, attempt))
+        
+        return result
+
+
+def _retry_delay(result: FetchResult, attempt: int) -> float:
+    """Back-off before a retry: Retry-After when given, else 1s, 2s, 4s..."""
+    retry_after = {key.lower(): value for key, value in result.headers.items()}.get('retry-after')
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), 60.0)
+    return float(2 ** attempt)
+
+
+def default_parse_workers() -> int:
+    """Parse processes to use by default (leave one CPU for the event loop)."""
+    return max(1, (os.cpu_count() or 2) - 1)
@@ -0,0 +1,403 @@
+"""
+Single-pass HTML table extraction for the scrapers.
+
+A regex scan (run in C) locates the top-level <table> elements of a page,
+skipping comments, scripts and styles; only tables with a wanted class (or
+containing nested tables) are fed to one streaming parse (lxml's when it is
+installed, html.parser otherwise) that keeps cell text, with rowspan/colspan
+expanded. find_table() matches tables by header signature as they close and
+stops at the first match, so a scraper no longer builds a BeautifulSoup
+tree, serializes each table and re-parses it with read_html.
+Table.typed_rows() hands back rows with count columns already converted to
+ints, so a matched table can be read without building a DataFrame.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+
+_WHITESPACE = re.compile(r'\s+')
+_LEADING_INT = re.compile(r'\s*(\d[\d,]*)')
+_LEADING_DIGITS = re.compile(r'^(\d+)')
+_NO_NUMBER = {'', '—', '-'}
+# Group 2 is '' for <table ...>, '/' for </table> and None for skipped blocks
+_TABLE_SCAN = re.compile(r'<!--.*?-->|<(script|style)\b.*?</\1\s*>|<(/?)table\b([^>]*)>', re.I | re.S)
+_CLASS_ATTR = re.compile(r'''\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''', re.I)
+
+# Elements whose text never ends up in a cell
+_SKIPPED = {'script', 'style', 'template'}
+_VOID = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+         'param', 'source', 'track', 'wbr'}
+
+Signature = Sequence[Union[str, Sequence[str]]]
+
+
+class Table:
+    """A parsed table: header rows and body rows of cell text."""
+    
+    def __init__(self, classes: List[str], caption: str,
+                 header_rows: List[List[str]], rows: List[List[str]]):
+        self.classes = classes
+        self.caption = caption
+        self.header_rows = header_rows
+        self.rows = rows
+    
+    @property
+    def columns(self) -> List[Union[str, Tuple[str, ...]]]:
+        """Column labels: strings for one header row, tuples for several (like read_html)."""
+        width = max((len(row) for row in self.header_rows + self.rows), default=0)
+        padded = [row + [''] * (width - len(row)) for row in self.header_rows]
+        if not padded:
+            return [str(i) for i in range(width)]
+        if len(padded) == 1:
+            return padded[0]
+        return list(zip(*padded))
+    
+    def header_text(self) -> str:
+        """Lowercased header text, for signature matching."""
+        return ' '.join(' '.join(row) for row in self.header_rows).lower()
+    
+    def matches(self, signature: Signature) -> bool:
+        """
+        Whether every signature term occurs in the header text.
+        
+        A term may be a tuple of alternatives, e.g. (('sport', 'discipline'), ('men', 'women')).
+        """
+        text = self.header_text()
+        return all(
+            any(word in text for word in ((term,) if isinstance(term, str) else term))
+            for term in signature
+        )
+    
+    def typed_rows(self, int_columns: Iterable[int] = ()) -> List[List[Union[str, int]]]:
+        """
+        Body rows padded to the column count, with the given columns as ints.
+        
+        Int cells are converted with to_int(); other cells stay text ('' where
+        a row is short).
+        """
+        width = len(self.columns)
+        int_columns = [i for i in int_columns if 0 <= i < width]
+        typed = []
+        for row in self.rows:
+            row = row + [''] * (width - len(row))
+            for i in int_columns:
+                row[i] = to_int(row[i])
+            typed.append(row)
+        return typed
+    
+    def to_frame(self):
+        """DataFrame of the body rows, labelled like pd.read_html (needs pandas)."""
+        import pandas as pd
+        
+        columns = self.columns
+        width = len(columns)
+        rows = [row + [None] * (width - len(row)) for row in self.rows]
+        if columns and isinstance(columns[0], tuple):
+            columns = pd.MultiIndex.from_tuples(columns)
+        return pd.DataFrame(rows, columns=columns)
+
+
+class _TableState:
+    """A table being parsed."""
+    
+    def __init__(self, classes: List[str]):
+        self.classes = classes
+        self.caption: List[str] = []
+        self.rows: List[Tuple[bool, List[str]]] = []    # (is header row, cells)
+        self.in_thead = False
+        self.row: Optional[List[Tuple[str, int, int]]] = None    # (text, rowspan, colspan)
+        self.row_header = True
+        self.cell: Optional[List[str]] = None
+        self.cell_spans = (1, 1)
+        self.in_caption = False
+        # column -> (rows left, text) for cells spanning down
+        self.pending: Dict[int, Tuple[int, str]] = {}
+    
+    def close_cell(self):
+        if self.cell is not None:
+            text = _WHITESPACE.sub(' ', ''.join(self.cell)).strip()
+            self.row.append((text, *self.cell_spans))
+            self.cell = None
+    
+    def close_row(self):
+        self.close_cell()
+        if self.row is None:
+            return
+        cells: List[str] = []
+        col = 0
+        
+        def fill_pending():
+            nonlocal col
+            while col in self.pending:
+                left, text = self.pending[col]
+                cells.append(text)
+                if left > 1:
+                    self.pending[col] = (left - 1, text)
+                else:
+                    del self.pending[col]
+                col += 1
+        
+        for text, rowspan, colspan in self.row:
+            fill_pending()
+            for _ in range(colspan):
+                cells.append(text)
+                if rowspan > 1:
+                    self.pending[col] = (rowspan - 1, text)
+                col += 1
+        fill_pending()
+        # Spans reaching past the last cell of this row
+        for pending_col in sorted(c for c in self.pending if c >= col):
+            left, text = self.pending[pending_col]
+            cells.extend([''] * (pending_col - len(cells)))
+            cells.append(text)
+            if left > 1:
+                self.pending[pending_col] = (left - 1, text)
+            else:
+                del self.pending[pending_col]
+        
+        if cells:
+            self.rows.append((self.in_thead or self.row_header, cells))
+        self.row = None
+    
+    def finish(self) -> Table:
+        self.close_row()
+        # Header rows: <thead> rows, then leading rows made only of <th> cells
+        header_count = 0
+        for is_header, _ in self.rows:
+            if not is_header:
+                break
+            header_count += 1
+        if header_count == len(self.rows):
+            header_count = min(header_count, 1)
+        cells = [row for _, row in self.rows]
+        return Table(self.classes, _WHITESPACE.sub(' ', ''.join(self.caption)).strip(),
+                     cells[:header_count], cells[header_count:])
+
+
+class TableBuilder:
+    """
+    Collects tables (optionally only those with given classes) from parse events.
+    
+    Implements the lxml parser-target interface (start/end/data/close);
+    _StdlibParser drives it from html.parser when lxml is not installed.
+    """
+    
+    def __init__(self, classes: Optional[Iterable[str]] = None):
+        self.wanted = set(classes) if classes else None
+        self.stack: List[Optional[_TableState]] = []    # None = table not collected
+        self.tables: List[Table] = []
+        self.skip_depth = 0
+        self.hidden: List[str] = []
+    
+    @property
+    def current(self) -> Optional[_TableState]:
+        return self.stack[-1] if self.stack else None
+    
+    def start(self, tag: str, attrs: Dict[str, Optional[str]]):
+        if tag in _SKIPPED:
+            self.skip_depth += 1
+            return
+        if tag == 'table':
+            classes = (attrs.get('class') or '').split()
+            wanted = self.wanted is None or bool(self.wanted.intersection(classes))
+            self.stack.append(_TableState(classes) if wanted else None)
+            return
+        
+        table = self.current
+        if table is None:
+            return
+        if self.hidden:
+            if tag not in _VOID:
+                self.hidden.append(tag)
+            return
+        if tag not in _VOID and 'display:none' in (attrs.get('style') or '').replace(' ', ''):
+            self.hidden.append(tag)
+        elif tag == 'tr':
+            table.close_row()
+            table.row = []
+            table.row_header = True
+        elif tag in ('td', 'th'):
+            if table.row is None:
+                table.row = []
+                table.row_header = True
+            table.close_cell()
+            table.cell = []
+            table.cell_spans = (_span(attrs.get('rowspan')), _span(attrs.get('colspan')))
+            if tag == 'td':
+                table.row_header = False
+        elif tag == 'thead':
+            table.in_thead = True
+        elif tag in ('tbody', 'tfoot'):
+            table.close_row()
+            table.in_thead = False
+        elif tag == 'caption':
+            table.in_caption = True
+        elif tag == 'br' and table.cell is not None:
+            table.cell.append(' ')
+    
+    def end(self, tag: str):
+        if tag in _SKIPPED:
+            self.skip_depth = max(0, self.skip_depth - 1)
+            return
+        if tag == 'table':
+            self.hidden.clear()
+            if self.stack:
+                table = self.stack.pop()
+                if table is not None:
+                    self.tables.append(table.finish())
+            return
+        if self.hidden:
+            if tag in self.hidden:
+                while self.hidden.pop() != tag:
+                    pass
+            return
+        
+        table = self.current
+        if table is None:
+            return
+        if tag == 'tr':
+            table.close_row()
+        elif tag in ('td', 'th'):
+            table.close_cell()
+        elif tag == 'thead':
+            table.close_row()
+            table.in_thead = False
+        elif tag == 'caption':
+            table.in_caption = False
+    
+    def data(self, data: str):
+        table = self.current
+        if table is None or self.skip_depth or self.hidden:
+            return
+        if table.cell is not None:
+            table.cell.append(data)
+        elif table.in_caption:
+            table.caption.append(data)
+    
+    def close(self):
+        """Finish tables left open at the end of the input."""
+        while self.stack:
+            self.end('table')
+
+
+class _StdlibParser(HTMLParser):
+    """html.parser front end for TableBuilder."""
+    
+    def __init__(self, builder: TableBuilder):
+        super().__init__(convert_charrefs=True)
+        self.builder = builder
+    
+    def handle_starttag(self, tag, attrs):
+        self.builder.start(tag, dict(attrs))
+    
+    def handle_startendtag(self, tag, attrs):
+        self.builder.start(tag, dict(attrs))
+        if tag not in _VOID:
+            self.builder.end(tag)
+    
+    def handle_endtag(self, tag):
+        self.builder.end(tag)
+    
+    def handle_data(self, data):
+        self.builder.data(data)
+
+
+def to_int(text: Optional[str]) -> int:
+    """
+    Cell text as an int, 0 where there is no number: leading digits win
+    ('4data-sort-value=""' -> 4), then '1,234' and '2.7' style numbers.
+    """
+    if text is None:
+        return 0
+    text = str(text).strip()
+    match = _LEADING_DIGITS.match(text)
+    if match:
+        return int(match.group(1))
+    text = text.replace(',', '')
+    if text in _NO_NUMBER:
+        return 0
+    try:
+        return int(float(text))
+    except (ValueError, OverflowError):
+        return 0
+
+
+def _span(value: Optional[str]) -> int:
+    match = _LEADING_INT.match(value or '')
+    return max(1, min(int(match.group(1).replace(',', '')), 1000)) if match else 1
+
+
+def _decode(html: Union[str, bytes]) -> str:
+    return html.decode('utf-8', errors='replace') if isinstance(html, bytes) else html
+
+
+def _table_segments(html: str, wanted: Optional[set]) -> Iterator[str]:
+    """Source of each top-level table that has a wanted class or nested tables."""
+    depth = 0
+    start = 0
+    keep = nested = False
+    for match in _TABLE_SCAN.finditer(html):
+        closing = match.group(2)
+        if closing is None:
+            continue
+        if not closing:
+            if depth == 0:
+                start = match.start()
+                nested = False
+                if wanted is None:
+                    keep = True
+                else:
+                    attr = _CLASS_ATTR.search(match.group(3))
+                    classes = next((value for value in attr.groups() if value is not None), '') if attr else ''
+                    keep = bool(wanted.intersection(classes.split()))
+            else:
+                nested = True
+            depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0 and (keep or nested):
+                yield html[start:match.end()]
+    if depth and (keep or nested):
+        yield html[start:]
+
+
+def iter_tables(html: Union[str, bytes], classes: Optional[Iterable[str]] = None) -> Iterator[Table]:
+    """Yield tables in document order (inner tables before the table holding them)."""
+    builder = TableBuilder(classes)
+    stdlib_parser = _StdlibParser(builder) if etree is None else None
+    for segment in _table_segments(_decode(html), builder.wanted):
+        if stdlib_parser is not None:
+            stdlib_parser.feed(segment)
+        else:
+            parser = etree.HTMLParser(target=builder)
+            parser.feed(segment)
+            parser.close()
+        if builder.tables:
+            yield from builder.tables
+            builder.tables.clear()
+    if stdlib_parser is not None:
+        stdlib_parser.close()
+    builder.close()
+    yield from builder.tables
+
+
+def extract_tables(html: Union[str, bytes], classes: Optional[Iterable[str]] = None) -> List[Table]:
+    """All tables on a page (only those with one of the given classes, if any)."""
+    return list(iter_tables(html, classes))
+
+
+def find_table(html: Union[str, bytes], signature: Signature,
+               classes: Optional[Iterable[str]] = ('wikitable',)) -> Optional[Table]:
+    """First table whose header matches the signature; parsing stops there."""
+    for table in iter_tables(html, classes):
+        if table.matches(signature):
+            return table
+    return None
+
@@ -0,0 +1,268 @@
+"""
+Shared on-disk HTTP response cache for the scrapers.
+
+Response bodies are stored gzip-compressed under .cache/http/bodies/, named
+by the SHA-256 of their content, and an index maps each URL to its body,
+ETag, Last-Modified and fetch time. A cached response younger than the
+freshness TTL is served without touching the network; an older one is
+revalidated with If-None-Match/If-Modified-Since, so an unchanged page costs
+a 304 instead of a full download.
+
+Scrapers call fetch_url() for single requests or pass scraper_transport()
+to a FetchEngine; both honour the record/replay mode of src.replay.
+Statistics are printed when the process exits; run
+`python -m src.http_cache [--prune | --clear]` to inspect the cache.
+"""
+
+import argparse
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from .fetch import DEFAULT_USER_AGENT, FetchResult, Transport, http_get
+from .replay import active_corpus
+
+
+CACHE_DIR = Path(__file__).parent.parent / '.cache' / 'http'
+INDEX_FILE = 'index.json'
+INDEX_VERSION = 1
+
+# Seconds a cached response is served without revalidation
+# (override with the HTTP_CACHE_TTL environment variable)
+DEFAULT_TTL = 15 * 60
+
+# Response headers kept in the index
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class HttpCache:
+    """Content-addressed response cache with conditional revalidation."""
+    
+    def __init__(self, cache_dir: Union[str, Path] = CACHE_DIR, ttl: float = DEFAULT_TTL):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.entries: Optional[Dict[str, Dict]] = None
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.stats = {
+            'fresh': 0,          # served from cache without a request
+            'revalidated': 0,    # 304 Not Modified
+            'downloaded': 0,     # full responses (new or changed)
+            'errors': 0,
+            'bytes_downloaded': 0,
+            'bytes_saved': 0
+        }
+    
+    def _load(self) -> Dict[str, Dict]:
+        """Load the URL index on first use."""
+        if self.entries is None:
+            try:
+                with open(self.cache_dir / INDEX_FILE, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                self.entries = index['urls'] if index.get('version') == INDEX_VERSION else {}
+            except (FileNotFoundError, ValueError, KeyError):
+                self.entries = {}
+        return self.entries
+    
+    def _body_path(self, digest: str) -> Path:
+        return self.cache_dir / 'bodies' / digest[:2] / f"{digest}.gz"
+    
+    def _read_body(self, digest: str) -> Optional[bytes]:
+        try:
+            with gzip.open(self._body_path(digest), 'rb') as f:
+                return f.read()
+        except (OSError, EOFError):
+            return None
+    
+    def _write_body(self, body: bytes) -> str:
+        """Store a body under its content hash (identical bodies are stored once)."""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._body_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(gzip.compress(body, mtime=0))
+            os.replace(tmp_path, path)
+        return digest
+    
+    def _count(self, key: str, amount: int = 1):
+        with self.lock:
+            self.stats[key] += amount
+    
+    def transport(self, inner: Transport = http_get) -> Transport:
+        """Wrap a transport (e.g. for a FetchEngine) with this cache."""
+        def cached_get(url: str, headers: Dict[str, str], timeout: float) -> FetchResult:
+            return self.get(url, headers, timeout, inner)
+        return cached_get
+    
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 30.0,
+            inner: Transport = http_get) -> FetchResult:
+        """
+        Fetch a URL through the cache.
+        
+        Fresh entries are returned directly; stale ones are revalidated and
+        served from disk on 304. Only 200 responses are stored.
+        """
+        with self.lock:
+            entry = self._load().get(url)
+        
+        body = None
+        if entry is not None:
+            body = self._read_body(entry['body'])
+            if body is None:
+                entry = None
+            elif time.time() - entry['fetched_at'] < self.ttl:
+                self._count('fresh')
+                self._count('bytes_saved', len(body))
+                return FetchResult(url, 200, body, entry['headers'])
+        
+        request_headers = dict(headers or {'User-Agent': DEFAULT_USER_AGENT})
+        if entry is not None:
+            if entry['headers'].get('ETag'):
+                request_headers['If-None-Match'] = entry['headers']['ETag']
+            if entry['headers'].get('Last-Modified'):
+                request_headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+        
+        result = inner(url, request_headers, timeout)
+        
+        if result.status == 304 and entry is not None:
+            self._count('revalidated')
+            self._count('bytes_saved', len(body))
+            with self.lock:
+                entry['fetched_at'] = time.time()
+                self.dirty = True
+            return FetchResult(url, 200, body, entry['headers'])
+        
+        if result.status != 200:
+            self._count('errors')
+            return result
+        
+        self._count('downloaded')
+        self._count('bytes_downloaded', len(result.body))
+        kept = {}
+        for name, value in result.headers.items():
+            for header in KEPT_HEADERS:
+                if name.lower() == header.lower():
+                    kept[header] = value
+        with self.lock:
+            self._load()[url] = {
+                'body': self._write_body(result.body),
+                'headers': kept,
+                'fetched_at': time.time()
+            }
+            self.dirty = True
+        return result
+    
+    def save(self):
+        """Write the URL index (atomically) if anything changed."""
+        with self.lock:
+            if not self.dirty or self.entries is None:
+                return
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_dir / f".{INDEX_FILE}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'version': INDEX_VERSION, 'urls': self.entries}, f, indent=2)
+                os.replace(tmp_path, self.cache_dir / INDEX_FILE)
+                self.dirty = False
+            except OSError as e:
+                print(f"Warning: Could not write HTTP cache index ({e})")
+    
+    def prune(self) -> int:
+        """Delete bodies no URL refers to any more; returns the number removed."""
+        referenced = {entry['body'] for entry in self._load().values()}
+        removed = 0
+        for path in (self.cache_dir / 'bodies').glob('*/*.gz'):
+            if path.name[:-3] not in referenced:
+                path.unlink()
+                removed += 1
+        return removed
+    
+    def clear(self):
+        """Remove every cached response."""
+        with self.lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self.entries = {}
+            self.dirty = False
+    
+    def format_stats(self) -> str:
+        """One-line summary of this process's cache activity."""
+        stats = self.stats
+        return (f"HTTP cache: {stats['fresh']} fresh, {stats['revalidated']} not modified, "
+                f"{stats['downloaded']} downloaded, {stats['errors']} failed; "
+                f"{stats['bytes_downloaded'] / 1024:.0f} KB transferred, "
+                f"{stats['bytes_saved'] / 1024:.0f} KB served from cache")
+
+
+_default_cache: Optional[HttpCache] = None
+
+
+def _finish(cache: HttpCache):
+    """Exit hook: persist the index and report activity."""
+    cache.save()
+    if any(cache.stats[key] for key in ('fresh', 'revalidated', 'downloaded', 'errors')):
+        print(cache.format_stats())
+
+
+def get_cache() -> HttpCache:
+    """Return the process-wide cache in .cache/http/."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = HttpCache(ttl=float(os.environ.get('HTTP_CACHE_TTL', DEFAULT_TTL)))
+        atexit.register(_finish, _default_cache)
+    return _default_cache
+
+
+def scraper_transport(use_cache: bool = True) -> Transport:
+    """
+    Transport for the scrapers: the shared cache (or plain HTTP), recorded
+    into a fixture corpus in SCRAPER_MODE=record, or served from the corpus
+    alone in SCRAPER_MODE=replay.
+    """
+    live = get_cache().transport() if use_cache else http_get
+    active = active_corpus()
+    if active is None:
+        return live
+    mode, corpus = active
+    return corpus.recording(live) if mode == 'record' else corpus.replaying()
+
+
+def fetch_url(url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 30.0) -> FetchResult:
+    """Fetch a URL through the shared cache (check .ok or call .raise_for_status())."""
+    return scraper_transport()(url, headers, timeout)
+
+
+def main():
+    """Show cache statistics, or prune/clear the cache."""
+    parser = argparse.ArgumentParser(description='Inspect the shared HTTP response cache')
+    parser.add_argument('--prune', action='store_true', help='Delete unreferenced bodies')
+    parser.add_argument('--clear', action='store_true', help='Delete every cached response')
+    args = parser.parse_args()
+    
+    cache = get_cache()
+    if args.clear:
+        cache.clear()
+        print(f"✓ Cleared {cache.cache_dir}")
+        return
+    if args.prune:
+        print(f"✓ Removed {cache.prune()} unreferenced bodies")
+    
+    entries = cache._load()
+    bodies = list((cache.cache_dir / 'bodies').glob('*/*.gz'))
+    size = sum(path.stat().st_size for path in bodies)
+    now = time.time()
+    fresh = sum(1 for entry in entries.values() if now - entry['fetched_at'] < cache.ttl)
+    print(f"{len(entries)} URLs ({fresh} fresh), {len(bodies)} bodies, "
+          f"{size / 1024:.0f} KB on disk in {cache.cache_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,39 +2,127 @@
 Medals per capita calculator and leaderboard generator.
 """
 
-from typing import Dict, List, Tuple
+import heapq
+from typing import Dict, List, Optional, Tuple
 from src.data_loader import DataLoader
 from src.utils import calculate_per_capita, format_population
 
 
+# Leaderboard sort keys: sort_by -> (stats key, path in the stats to the
+# medal count a nation needs above zero to be ranked)
+SORT_KEYS = {
+    'total': ('total_per_capita', ('medals', 'total')),
+    'gold': ('gold_per_capita', ('medals', 'total')),
+    'winter': ('winter_per_capita', ('winter_total',)),
+    'per_athlete': ('medals_per_athlete', ('medals', 'total')),
+}
+
+# Any other sort_by ranks by gold per capita, as the original leaderboard did
+FALLBACK_SORT_KEY = 'gold'
+
+
+def _sort_key(sort_by: str) -> str:
+    """Return sort_by if it is a known sort key, else the fallback."""
+    return sort_by if sort_by in SORT_KEYS else FALLBACK_SORT_KEY
+
+
+def _lookup(stats: Dict, path: Tuple[str, ...]):
+    """Follow a key path into a nation's stats dict."""
+    for key in path:
+        stats = stats[key]
+    return stats
+
+
+class MedalsRanking:
+    """
+    Per-capita rankings for a fixed set of nations.
+    
+    Stats are computed once; top-k queries use a heap and are cached per
+    (sort_by, k), and full orderings are built lazily for rank lookups.
+    """
+    
+    def __init__(self, stats: Dict[str, Dict]):
+        self.stats = stats
+        self._eligible = {}
+        self._top = {}
+        self._ranks = {}
+    
+    def eligible(self, sort_by: str) -> List[str]:
+        """Nations that can appear in the ranking for a sort key."""
+        sort_by = _sort_key(sort_by)
+        if sort_by not in self._eligible:
+            count_path = SORT_KEYS[sort_by][1]
+            self._eligible[sort_by] = [
+                nation for nation, stats in self.stats.items()
+                if stats['population'] > 0 and _lookup(stats, count_path) > 0
+                and (sort_by != 'per_athlete' or stats['athletes'] > 0)
+            ]
+        return self._eligible[sort_by]
+    
+    def top(self, k: int, sort_by: str = 'total') -> List[Tuple[str, Dict]]:
+        """Return the top k nations for a sort key, best first (a new list each call)."""
+        sort_by = _sort_key(sort_by)
+        cache_key = (sort_by, k)
+        if cache_key not in self._top:
+            stat_key = SORT_KEYS[sort_by][0]
+            stats = self.stats
+            nations = heapq.nlargest(k, self.eligible(sort_by), key=lambda n: stats[n][stat_key])
+            self._top[cache_key] = [(nation, stats[nation]) for nation in nations]
+        return list(self._top[cache_key])
+    
+    def rank(self, ioc_code: str, sort_by: str = 'total') -> Optional[int]:
+        """Return the 1-based rank of a nation, or None if it is not ranked."""
+        sort_by = _sort_key(sort_by)
+        if sort_by not in self._ranks:
+            stat_key = SORT_KEYS[sort_by][0]
+            ordered = sorted(self.eligible(sort_by), key=lambda n: self.stats[n][stat_key], reverse=True)
+            self._ranks[sort_by] = {nation: i for i, nation in enumerate(ordered, 1)}
+        return self._ranks[sort_by].get(ioc_code)
+
+
 class MedalsPerCapitaCalculator:
     """Calculate and rank nations by medals per capita."""
     
     def __init__(self, data_loader: DataLoader):
         self.data_loader = data_loader
+        self._ranking = None
+        self._ranking_version = None
     
     def calculate_for_nation(self, ioc_code: str) -> Dict:
         """
         Calculate medals per capita for a single nation.
         
-        Returns dict with total and gold medals per capita.
+        Returns dict with total, gold and Winter medals per capita, the
+        Winter medal total and medals per 2026 athlete.
         """
         medals = self.data_loader.get_nation_medals(ioc_code)
+        winter_medals = self.data_loader.get_nation_winter_medals(ioc_code)
         population = self.data_loader.get_nation_population(ioc_code)
+        athletes = self.data_loader.get_nation_athlete_count(ioc_code)
+        
+        per_athlete = medals['total'] / athletes if athletes else 0.0
         
         if population == 0:
             return {
                 'total_per_capita': 0.0,
                 'gold_per_capita': 0.0,
+                'winter_per_capita': 0.0,
+                'winter_total': winter_medals['total'],
+                'medals_per_athlete': per_athlete,
                 'medals': medals,
-                'population': population
+                'population': population,
+                'athletes': athletes
             }
         
         return {
             'total_per_capita': calculate_per_capita(medals['total'], population),
             'gold_per_capita': calculate_per_capita(medals['gold'], population),
+            'winter_per_capita': calculate_per_capita(winter_medals['total'], population),
+            'winter_total': winter_medals['total'],
+            'medals_per_athlete': per_athlete,
             'medals': medals,
-            'population': population
+            'population': population,
+            'athletes': athletes
         }
     
     def calculate_all(self, nations: List[str]) -> Dict[str, Dict]:
@@ -46,6 +134,16 @@ class MedalsPerCapitaCalculator:
         
         return results
     
+    def get_ranking(self) -> MedalsRanking:
+        """Return the ranking over all nations with medal data, rebuilt only on reload."""
+        if self._ranking is None or self._ranking_version != self.data_loader.version:
+            nations = self.data_loader.get_medal_nations()
+            stats = self.calculate_all(nations)
+            # Loading data on first access bumps the version; record it afterwards
+            self._ranking = MedalsRanking(stats)
+            self._ranking_version = self.data_loader.version
+        return self._ranking
+    
     def get_leaderboard(self, 
                         nations: List[str] = None, 
                         top_n: int = 20,
@@ -56,36 +154,23 @@ class MedalsPerCapitaCalculator:
         Args:
             nations: List of nations to include. If None, uses all nations with data.
             top_n: Number of top nations to return
-            sort_by: 'total' or 'gold' - which medals per capita to sort by
+            sort_by: 'total', 'gold', 'winter' or 'per_athlete' - which rate to sort by
+                (anything else sorts by gold)
         
         Returns:
             List of tuples (ioc_code, stats_dict) sorted by per capita rate
         """
-        # If no nations specified, get all from medals data
+        # If no nations specified, use the cached ranking over all nations
         if nations is None:
-            if self.data_loader.medals_data is None:
-                self.data_loader.load_medals()
-            nations = list(self.data_loader.medals_data.keys())
+            ranking = self.get_ranking()
+        else:
+            ranking = MedalsRanking(self.calculate_all(nations))
         
-        # Calculate for all nations
-        results = self.calculate_all(nations)
-        
-        # Sort by specified metric
-        sort_key = 'total_per_capita' if sort_by == 'total' else 'gold_per_capita'
-        
-        leaderboard = sorted(
-            results.items(),
-            key=lambda x: x[1][sort_key],
-            reverse=True
-        )
-        
-        # Filter out nations with 0 population or 0 medals
-        leaderboard = [
-            (nation, stats) for nation, stats in leaderboard
-            if stats['population'] > 0 and stats['medals']['total'] > 0
-        ]
-        
-        return leaderboard[:top_n]
+        return ranking.top(top_n, sort_by)
+    
+    def get_rank(self, ioc_code: str, sort_by: str = 'total') -> Optional[int]:
+        """Get a nation's 1-based leaderboard rank, or None if unranked."""
+        return self.get_ranking().rank(ioc_code, sort_by)
     
     def format_leaderboard(self, leaderboard: List[Tuple[str, Dict]], 
                           nation_names: Dict[str, str]) -> str:
@@ -0,0 +1,157 @@
+"""
+Columnar nation table - compact in-memory store for per-nation statistics.
+
+IOC codes are interned to dense integer ids and every statistic lives in a
+typed array indexed by that id, so lookups are a dict hit plus an array read.
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+# Nations below the equator (Southern Hemisphere): the union of the lists the
+# scripts used to keep, without MAS, SIN and THA, which lie north of it
+SOUTHERN_HEMISPHERE = frozenset({
+    'AUS', 'NZL', 'RSA', 'BRA', 'CHI', 'ARG', 'URU', 'ECU', 'MAD', 'BOL', 'PAR',
+    'FIJ', 'PNG', 'VUT'
+})
+
+# Row flags recording which sources provided data for a nation
+HAS_MEDALS = 1
+HAS_WINTER_MEDALS = 2
+HAS_POPULATION = 4
+HAS_ATHLETES = 8
+SOUTHERN = 16
+
+MEDAL_KEYS = ('gold', 'silver', 'bronze', 'total')
+
+
+class NationTable:
+    """Dense, array-backed table of nation statistics keyed by IOC code."""
+    
+    # Integer columns; population needs 64 bits, counts fit comfortably too
+    COLUMNS = (
+        'gold', 'silver', 'bronze', 'total',
+        'winter_gold', 'winter_silver', 'winter_bronze', 'winter_total',
+        'population', 'athletes'
+    )
+    
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.codes: List[str] = []
+        self.columns: Dict[str, array] = {name: array('q') for name in self.COLUMNS}
+        self.flags = array('B')
+    
+    @classmethod
+    def from_sources(cls, medals: Optional[Dict[str, Dict]] = None,
+                     winter_medals: Optional[Dict[str, Dict]] = None,
+                     population: Optional[Dict[str, int]] = None,
+                     athletes: Optional[Dict[str, int]] = None,
+                     nations: Optional[Iterable[str]] = None) -> 'NationTable':
+        """Build a table from already-loaded source dicts."""
+        table = cls()
+        if nations is not None:
+            table.extend(nations)
+        if medals is not None:
+            table.load_medals(medals)
+        if winter_medals is not None:
+            table.load_medals(winter_medals, prefix='winter_', flag=HAS_WINTER_MEDALS)
+        if population is not None:
+            table.load_counts('population', population, HAS_POPULATION)
+        if athletes is not None:
+            table.load_counts('athletes', athletes, HAS_ATHLETES)
+        return table
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def __contains__(self, ioc_code: str) -> bool:
+        return ioc_code in self.ids
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.codes)
+    
+    def intern(self, ioc_code: str) -> int:
+        """Return the id for a nation, adding an empty row if it is new."""
+        nation_id = self.ids.get(ioc_code)
+        if nation_id is not None:
+            return nation_id
+        
+        nation_id = len(self.codes)
+        self.ids[ioc_code] = nation_id
+        self.codes.append(ioc_code)
+        for column in self.columns.values():
+            column.append(0)
+        self.flags.append(SOUTHERN if ioc_code in SOUTHERN_HEMISPHERE else 0)
+        return nation_id
+    
+    def id_of(self, ioc_code: str) -> Optional[int]:
+        """Return the id for a nation, or None if it is unknown."""
+        return self.ids.get(ioc_code)
+    
+    def get(self, ioc_code: str, column: str, default: int = 0) -> int:
+        """Read a single value for a nation."""
+        nation_id = self.ids.get(ioc_code)
+        if nation_id is None:
+            return default
+        return self.columns[column][nation_id]
+    
+    def has(self, ioc_code: str, flag: int) -> bool:
+        """Check whether a nation has the given row flag set."""
+        nation_id = self.ids.get(ioc_code)
+        return nation_id is not None and bool(self.flags[nation_id] & flag)
+    
+    def codes_with(self, flag: int) -> List[str]:
+        """Return IOC codes (in load order) whose rows have the given flag."""
+        flags = self.flags
+        return [code for i, code in enumerate(self.codes) if flags[i] & flag]
+    
+    def clear_column(self, column: str, flag: int = 0):
+        """Zero a column (and drop a flag) before reloading its source."""
+        values = self.columns[column]
+        for i in range(len(values)):
+            values[i] = 0
+        if flag:
+            for i in range(len(self.flags)):
+                self.flags[i] &= ~flag
+    
+    def load_medals(self, medals: Dict[str, Dict], prefix: str = '', flag: int = HAS_MEDALS):
+        """Fill the medal columns from a {ioc: {gold, silver, bronze, total}} mapping."""
+        for key in MEDAL_KEYS:
+            self.clear_column(prefix + key, flag)
+        
+        columns = [self.columns[prefix + key] for key in MEDAL_KEYS]
+        for ioc_code, counts in medals.items():
+            nation_id = self.intern(ioc_code)
+            for key, column in zip(MEDAL_KEYS, columns):
+                column[nation_id] = int(counts.get(key, 0) or 0)
+            self.flags[nation_id] |= flag
+    
+    def load_counts(self, column: str, values: Dict[str, int], flag: int):
+        """Fill a single integer column from a {ioc: value} mapping."""
+        self.clear_column(column, flag)
+        
+        target = self.columns[column]
+        for ioc_code, value in values.items():
+            nation_id = self.intern(ioc_code)
+            target[nation_id] = int(value or 0)
+            self.flags[nation_id] |= flag
+    
+    def medals(self, ioc_code: str, prefix: str = '') -> Dict[str, int]:
+        """Return medal counts for a nation as a dict (zeros if unknown)."""
+        nation_id = self.ids.get(ioc_code)
+        if nation_id is None:
+            return {key: 0 for key in MEDAL_KEYS}
+        return {key: self.columns[prefix + key][nation_id] for key in MEDAL_KEYS}
+    
+    def is_southern(self, ioc_code: str) -> bool:
+        """Check whether a nation lies in the Southern Hemisphere."""
+        nation_id = self.ids.get(ioc_code)
+        if nation_id is None:
+            return ioc_code in SOUTHERN_HEMISPHERE
+        return bool(self.flags[nation_id] & SOUTHERN)
+    
+    def extend(self, codes: Iterable[str]):
+        """Intern a batch of IOC codes."""
+        for code in codes:
+            self.intern(code)
@@ -0,0 +1,227 @@
+"""
+Per-stage timing and profiling for the build scripts.
+
+A StageProfiler wraps each pipeline stage in a context manager and records
+wall time, CPU time and peak traced memory. Optionally every stage also gets
+its own cProfile dump (.pstats) so regressions can be narrowed down with
+pstats/snakeviz. When disabled, stage() is a no-op.
+"""
+
+import cProfile
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+
+DEFAULT_PROFILE_DIR = 'profiles'
+
+
+class StageProfiler:
+    """Collects wall/CPU/peak-memory figures and optional cProfile dumps per stage."""
+    
+    def __init__(self, label: str = 'main', enabled: bool = False,
+                 profile_dir: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            label: Name of the script being measured (used in file names)
+            enabled: Record timings; when False every stage() is a no-op
+            profile_dir: Directory for per-stage .pstats dumps (None = no cProfile)
+        """
+        self.label = label
+        self.enabled = enabled or profile_dir is not None
+        self.profile_dir = Path(profile_dir) if profile_dir is not None else None
+        self.stages: Dict[str, Dict] = {}
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._stack: List[Dict] = []
+        self._started_at = datetime.now().isoformat(timespec='seconds')
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Measure a stage. Re-entering a stage name accumulates into it.
+        
+        Nested stages are measured exclusively for cProfile (the outer
+        stage's profiler is paused while the inner one runs) and inclusively
+        for wall/CPU time and memory.
+        """
+        if not self.enabled:
+            yield
+            return
+        
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            parent = self._stack[-1]
+            parent['peak'] = max(parent['peak'], peak)
+            if parent['profile'] is not None:
+                parent['profile'].disable()
+        tracemalloc.reset_peak()
+        
+        profile = None
+        if self.profile_dir is not None:
+            profile = self._profiles.setdefault(name, cProfile.Profile())
+        
+        frame = {'profile': profile, 'peak': current}
+        self._stack.append(frame)
+        
+        children_start = _children_cpu()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            children_cpu = _children_cpu() - children_start
+            end_current, peak = tracemalloc.get_traced_memory()
+            
+            self._stack.pop()
+            frame['peak'] = max(frame['peak'], peak)
+            if self._stack:
+                parent = self._stack[-1]
+                parent['peak'] = max(parent['peak'], frame['peak'])
+                if parent['profile'] is not None:
+                    parent['profile'].enable()
+            
+            record = self.stages.setdefault(name, {
+                'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0, 'children_cpu_s': 0.0,
+                'peak_mem_bytes': 0, 'mem_delta_bytes': 0
+            })
+            record['calls'] += 1
+            record['wall_s'] += wall
+            record['cpu_s'] += cpu
+            record['children_cpu_s'] += children_cpu
+            record['peak_mem_bytes'] = max(record['peak_mem_bytes'], frame['peak'])
+            record['mem_delta_bytes'] += end_current - current
+    
+    def report(self) -> Dict:
+        """Return the collected figures as a JSON-serializable dict."""
+        stages = []
+        for name, record in self.stages.items():
+            entry = {'name': name}
+            entry.update(record)
+            entry['wall_s'] = round(record['wall_s'], 6)
+            entry['cpu_s'] = round(record['cpu_s'], 6)
+            entry['children_cpu_s'] = round(record['children_cpu_s'], 6)
+            entry['pstats'] = str(self._pstats_path(name)) if name in self._profiles else None
+            stages.append(entry)
+        
+        return {
+            'label': self.label,
+            'started_at': self._started_at,
+            'argv': sys.argv[1:],
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'total': {
+                'wall_s': round(time.perf_counter() - self._wall_start, 6),
+                'cpu_s': round(time.process_time() - self._cpu_start, 6),
+                'peak_mem_bytes': max((s['peak_mem_bytes'] for s in stages), default=0)
+            },
+            'stages': stages
+        }
+    
+    def _pstats_path(self, name: str) -> Path:
+        safe_name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in name)
+        return self.profile_dir / f"{self.label}_{safe_name}.pstats"
+    
+    def write(self, filepath: Union[str, Path]) -> Dict:
+        """
+        Write the timings JSON (and any .pstats dumps).
+        
+        A path ending in .jsonl gets one report appended per run, so a
+        history can be kept across builds; any other path is overwritten.
+        """
+        report = self.report()
+        
+        for name, profile in self._profiles.items():
+            path = self._pstats_path(name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(str(path))
+        
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        if filepath.suffix == '.jsonl':
+            with open(filepath, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(report) + '\n')
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        
+        return report
+    
+    def print_summary(self):
+        """Print a per-stage table to stdout."""
+        report = self.report()
+        print(f"\n{'Stage':<20} {'Calls':>5} {'Wall (s)':>10} {'CPU (s)':>10} {'Peak MB':>9}")
+        for stage in report['stages']:
+            print(f"{stage['name']:<20} {stage['calls']:>5} {stage['wall_s']:>10.3f} "
+                  f"{stage['cpu_s'] + stage['children_cpu_s']:>10.3f} "
+                  f"{stage['peak_mem_bytes'] / 1_000_000:>9.1f}")
+        total = report['total']
+        print(f"{'total':<20} {'':>5} {total['wall_s']:>10.3f} {total['cpu_s']:>10.3f}")
+
+
+def _children_cpu() -> float:
+    """CPU seconds used by reaped child processes (worker pools)."""
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+def add_profiling_arguments(parser):
+    """Add the shared --timings/--profile options to an argparse parser."""
+    parser.add_argument(
+        '--timings',
+        nargs='?',
+        const='',
+        default=None,
+        metavar='FILE',
+        help=f'Write per-stage wall/CPU/peak-memory figures as JSON '
+             f'(default: {DEFAULT_PROFILE_DIR}/<script>_timings.json; '
+             f'a .jsonl path appends one line per run)'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const=DEFAULT_PROFILE_DIR,
+        default=None,
+        metavar='DIR',
+        help=f'Also dump a cProfile .pstats file per stage into DIR '
+             f'(default: {DEFAULT_PROFILE_DIR}); implies --timings'
+    )
+
+
+def profiler_from_args(args, label: str) -> StageProfiler:
+    """Build a StageProfiler from parsed --timings/--profile options."""
+    enabled = args.timings is not None or args.profile is not None
+    return StageProfiler(label, enabled=enabled, profile_dir=args.profile)
+
+
+def finish_profiling(profiler: StageProfiler, args):
+    """Write and summarize the timings if profiling was requested."""
+    if not profiler.enabled:
+        return
+    
+    if args.timings:
+        filepath = Path(args.timings)
+    else:
+        directory = Path(args.profile) if args.profile else Path(DEFAULT_PROFILE_DIR)
+        filepath = directory / f"{profiler.label}_timings.json"
+    
+    profiler.write(filepath)
+    profiler.print_summary()
+    print(f"\nTimings written to: {filepath}")
@@ -0,0 +1,248 @@
+"""
+Record-and-replay fixtures for the scrapers.
+
+Every scraper fetches through src.http_cache.scraper_transport(), which
+honours two environment variables:
+    
+    SCRAPER_MODE=record   archive every response a scraper receives
+    SCRAPER_MODE=replay   serve responses from the archive only (no network)
+    SCRAPER_CORPUS=path   the archive (default: fixtures/scrapers.corpus.gz)
+
+The corpus is one gzip-compressed JSON file mapping URL -> status, headers
+and body, so replayed runs are deterministic, offline and fast. A corpus
+can also be served over HTTP by a local stand-in server, which answers
+GET /<host>/<path> with the response recorded for https://<host>/<path>
+(ETag revalidation included).
+
+Usage (from the repository root):
+    python -m src.replay record scripts/scrape_nation_sports.py
+    python -m src.replay replay scripts/scrape_pandas.py
+    python -m src.replay serve --port 8765
+    python -m src.replay list
+"""
+
+import argparse
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import os
+import runpy
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from .fetch import FetchResult, Transport
+
+
+DEFAULT_CORPUS = Path(__file__).parent.parent / 'fixtures' / 'scrapers.corpus.gz'
+CORPUS_VERSION = 1
+
+MODES = ('record', 'replay')
+
+# Response headers kept in the corpus
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class Corpus:
+    """Archive of recorded responses, keyed by URL."""
+    
+    def __init__(self, path: Union[str, Path] = DEFAULT_CORPUS):
+        self.path = Path(path)
+        self.responses: Optional[Dict[str, Dict]] = None
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.recorded = 0
+        self.misses = 0
+    
+    def _load(self) -> Dict[str, Dict]:
+        if self.responses is None:
+            try:
+                with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                    corpus = json.load(f)
+                self.responses = corpus['responses'] if corpus.get('version') == CORPUS_VERSION else {}
+            except (FileNotFoundError, ValueError, KeyError, EOFError, OSError):
+                self.responses = {}
+        return self.responses
+    
+    def __len__(self) -> int:
+        return len(self._load())
+    
+    def record(self, result: FetchResult):
+        """Archive a response (status 0 transfer failures are not recorded)."""
+        if result.status == 0:
+            return
+        try:
+            body = {'text': result.body.decode('utf-8')}
+        except UnicodeDecodeError:
+            body = {'base64': base64.b64encode(result.body).decode('ascii')}
+        with self.lock:
+            self._load()[result.url] = {
+                'status': result.status,
+                'headers': {header: value for name, value in result.headers.items()
+                            for header in KEPT_HEADERS if name.lower() == header.lower()},
+                **body
+            }
+            self.dirty = True
+            self.recorded += 1
+    
+    def lookup(self, url: str) -> Optional[FetchResult]:
+        """The recorded response for a URL, or None."""
+        with self.lock:
+            entry = self._load().get(url)
+        if entry is None:
+            return None
+        body = entry['text'].encode('utf-8') if 'text' in entry else base64.b64decode(entry['base64'])
+        return FetchResult(url, entry['status'], body, dict(entry['headers']))
+    
+    def pages(self) -> Iterator[Tuple[str, FetchResult]]:
+        """Every recorded (URL, response), sorted by URL."""
+        for url in sorted(self._load()):
+            yield url, self.lookup(url)
+    
+    def recording(self, inner: Transport) -> Transport:
+        """Transport that fetches with inner and archives each response."""
+        def record_get(url: str, headers: Dict[str, str], timeout: float) -> FetchResult:
+            result = inner(url, headers, timeout)
+            self.record(result)
+            return result
+        return record_get
+    
+    def replaying(self) -> Transport:
+        """Transport that answers from the corpus only (404 for unrecorded URLs)."""
+        def replay_get(url: str, headers: Dict[str, str], timeout: float) -> FetchResult:
+            result = self.lookup(url)
+            if result is None:
+                with self.lock:
+                    self.misses += 1
+                # 404 rather than 0, so the engine does not back off and retry
+                return FetchResult(url, 404, error=f"not recorded in {self.path.name}")
+            return result
+        return replay_get
+    
+    def save(self):
+        """Write the corpus (atomically) if anything was recorded."""
+        with self.lock:
+            if not self.dirty or self.responses is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+            payload = json.dumps({'version': CORPUS_VERSION, 'responses': self.responses},
+                                 ensure_ascii=False, sort_keys=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(gzip.compress(payload.encode('utf-8'), mtime=0))
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+
+
+_active: Optional[Tuple[str, Corpus]] = None
+
+
+def active_corpus() -> Optional[Tuple[str, Corpus]]:
+    """(mode, corpus) selected by SCRAPER_MODE/SCRAPER_CORPUS, or None."""
+    global _active
+    mode = os.environ.get('SCRAPER_MODE', '').lower()
+    if mode not in MODES:
+        return None
+    if _active is None or _active[0] != mode:
+        corpus = Corpus(os.environ.get('SCRAPER_CORPUS') or DEFAULT_CORPUS)
+        _active = (mode, corpus)
+        atexit.register(_finish, mode, corpus)
+    return _active
+
+
+def _finish(mode: str, corpus: Corpus):
+    """Exit hook: save a recording and report."""
+    if mode == 'record' and corpus.recorded:
+        corpus.save()
+        print(f"Recorded {corpus.recorded} response(s); corpus: {len(corpus)} in {corpus.path}")
+    elif corpus.misses:
+        print(f"Replay: {corpus.misses} request(s) not in {corpus.path}")
+
+
+def stand_in_server(corpus: Corpus, host: str = '127.0.0.1', port: int = 0) -> ThreadingHTTPServer:
+    """
+    HTTP server replaying a corpus: GET /<host>/<path> answers with the
+    response recorded for https://<host>/<path>. Call serve_forever() on it.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+        
+        def do_GET(self):
+            result = corpus.lookup('https:/' + self.path) or corpus.lookup('http:/' + self.path)
+            if result is None:
+                self.send_error(404, 'Not recorded')
+                return
+            etag = result.headers.get('ETag') or \
+                '"%s"' % hashlib.sha256(result.body).hexdigest()[:16]
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            self.send_response(result.status)
+            for name, value in result.headers.items():
+                if name.lower() != 'etag':
+                    self.send_header(name, value)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', str(len(result.body)))
+            self.end_headers()
+            self.wfile.write(result.body)
+    
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def stand_in_url(server: ThreadingHTTPServer, url: str) -> str:
+    """Address of a recorded URL on a stand-in server."""
+    parts = urlsplit(url)
+    address = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    return f"{address}/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else '')
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Record or replay scraper HTTP traffic')
+    parser.add_argument('--corpus', type=Path, default=DEFAULT_CORPUS,
+                        help='Corpus file (default: fixtures/scrapers.corpus.gz)')
+    commands = parser.add_subparsers(dest='command', required=True)
+    for mode in MODES:
+        command = commands.add_parser(mode, help=f'Run a scraper script in {mode} mode')
+        command.add_argument('script', help='Scraper script, e.g. scripts/scrape_pandas.py')
+        command.add_argument('args', nargs=argparse.REMAINDER, help='Arguments for the script')
+    serve = commands.add_parser('serve', help='Serve the corpus over HTTP')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    commands.add_parser('list', help='List the recorded URLs')
+    args = parser.parse_args()
+    
+    if args.command in MODES:
+        os.environ['SCRAPER_MODE'] = args.command
+        os.environ['SCRAPER_CORPUS'] = str(args.corpus.resolve())
+        sys.argv = [args.script] + args.args
+        sys.path.insert(0, str(Path(args.script).resolve().parent))
+        runpy.run_path(args.script, run_name='__main__')
+        return
+    
+    corpus = Corpus(args.corpus)
+    if args.command == 'list':
+        for url, result in corpus.pages():
+            print(f"{result.status}  {len(result.body) / 1024:8.1f} KB  {url}")
+        print(f"{len(corpus)} responses in {corpus.path}")
+        return
+    
+    server = stand_in_server(corpus, args.host, args.port)
+    print(f"Serving {len(corpus)} recorded responses on http://{args.host}:{args.port}/<host>/<path>")
+    print(f"  e.g. scrape_nation_sports.py --base-url http://{args.host}:{args.port}/en.wikipedia.org/wiki")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+Binary snapshot cache for the JSON files under data/.
+
+Every JSON file in data/ is compiled into a single pickle file holding each
+file's mtime, size, SHA-256 and pre-parsed payload. load_json() serves reads
+from that snapshot and only re-parses a file when its mtime/size changed and
+its content hash no longer matches.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+SNAPSHOT_FILE = '.snapshot.pickle'
+SNAPSHOT_VERSION = 1
+
+
+class DataSnapshot:
+    """Pre-parsed, invalidating cache of all JSON files under a data directory."""
+    
+    def __init__(self, data_dir: Union[str, Path] = DATA_DIR,
+                 snapshot_path: Optional[Union[str, Path]] = None):
+        self.data_dir = Path(data_dir).resolve()
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else self.data_dir / SNAPSHOT_FILE
+        self.entries: Optional[Dict[str, Dict]] = None
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+    
+    def _key(self, path: Union[str, Path]) -> Optional[str]:
+        """Return the snapshot key for a path, or None if it is outside data_dir."""
+        try:
+            return Path(path).resolve().relative_to(self.data_dir).as_posix()
+        except ValueError:
+            return None
+    
+    def _read_snapshot(self):
+        """Load the snapshot file, compiling a fresh one if it is missing or stale."""
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                snapshot = pickle.load(f)
+            if snapshot.get('version') == SNAPSHOT_VERSION:
+                self.entries = snapshot['files']
+                return
+        except Exception:
+            # A truncated, foreign or incompatible pickle can raise almost
+            # anything while loading; treat every failure as a cache miss
+            pass
+        
+        self.compile()
+    
+    def _parse_entry(self, path: Path, stat: os.stat_result,
+                     previous: Optional[Dict] = None) -> Dict:
+        """Build a snapshot entry for a file, reusing the payload if the hash matches."""
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        
+        if previous is not None and previous['sha256'] == digest:
+            payload = previous['payload']
+        else:
+            payload = pickle.dumps(json.loads(raw), protocol=pickle.HIGHEST_PROTOCOL)
+        
+        return {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': digest,
+            'payload': payload
+        }
+    
+    def compile(self) -> int:
+        """Parse every JSON file under data_dir into the snapshot and save it."""
+        previous_entries = self.entries or {}
+        self.entries = {}
+        
+        for path in sorted(self.data_dir.rglob('*.json')):
+            key = path.relative_to(self.data_dir).as_posix()
+            try:
+                self.entries[key] = self._parse_entry(path, path.stat(), previous_entries.get(key))
+            except (OSError, ValueError) as e:
+                print(f"Warning: Skipping {key} in data snapshot ({e})")
+        
+        self.dirty = True
+        self.save()
+        return len(self.entries)
+    
+    def save(self):
+        """Write the snapshot to disk (atomically) if anything changed."""
+        if not self.dirty or self.entries is None:
+            return
+        
+        # Unique per process and thread so concurrent builds never share a temp file
+        tmp_path = self.snapshot_path.with_name(
+            f"{self.snapshot_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'version': SNAPSHOT_VERSION, 'files': self.entries},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.snapshot_path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: Could not write data snapshot ({e})")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    def load_json(self, path: Union[str, Path]) -> Any:
+        """
+        Load a JSON file through the snapshot.
+        
+        Files outside data_dir are read directly. Raises FileNotFoundError
+        like open() so existing fallbacks keep working. Each call returns a
+        fresh object, so callers may mutate the result freely.
+        """
+        key = self._key(path)
+        if key is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        
+        path = self.data_dir / key
+        stat = path.stat()
+        
+        if self.entries is None:
+            self._read_snapshot()
+        
+        entry = self.entries.get(key)
+        if entry is None or entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            self.misses += 1
+            entry = self._parse_entry(path, stat, entry)
+            self.entries[key] = entry
+            self.dirty = True
+        else:
+            self.hits += 1
+        
+        return pickle.loads(entry['payload'])
+
+
+_default_snapshot: Optional[DataSnapshot] = None
+
+
+def get_snapshot() -> DataSnapshot:
+    """Return the process-wide snapshot for the repository's data/ directory."""
+    global _default_snapshot
+    if _default_snapshot is None:
+        _default_snapshot = DataSnapshot()
+        atexit.register(_default_snapshot.save)
+    return _default_snapshot
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Load a JSON file, served from the shared data snapshot when possible."""
+    return get_snapshot().load_json(path)
+
+
+def main():
+    """Compile data/ into a fresh snapshot."""
+    snapshot = get_snapshot()
+    count = snapshot.compile()
+    print(f"✓ Compiled {count} JSON files into {snapshot.snapshot_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Precompiled HTML templates for the page generators.
+
+Templates live under templates/ and use {{ name }} placeholders; everything
+else (CSS and JavaScript braces included) is literal markup. Each template is
+compiled once into a str.format pattern and cached per process, and is
+recompiled only when its file changes. Values are inserted as-is, so callers
+pass ready-made HTML fragments.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+
+TEMPLATE_DIR = Path(__file__).parent.parent / 'templates'
+
+_PLACEHOLDER = re.compile(r'\{\{\s*([A-Za-z_]\w*)\s*\}\}')
+
+
+class Template:
+    """A compiled template: literal chunks interleaved with named fields."""
+    
+    def __init__(self, source: str, name: str = '<string>'):
+        self.name = name
+        self.digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        
+        parts = _PLACEHOLDER.split(source)
+        self.literals = parts[0::2]
+        self.fields = tuple(parts[1::2])
+        
+        pattern = [self.literals[0].replace('{', '{{').replace('}', '}}')]
+        for field, literal in zip(self.fields, self.literals[1:]):
+            pattern.append('{' + field + '}')
+            pattern.append(literal.replace('{', '{{').replace('}', '}}'))
+        self._pattern = ''.join(pattern)
+    
+    def render(self, **context) -> str:
+        """Render to a string; every field must be supplied."""
+        return self._pattern.format_map(context)
+    
+    def render_each(self, rows: Iterable[Dict]) -> str:
+        """Render the template once per context dict and join the results."""
+        pattern = self._pattern
+        return ''.join([pattern.format_map(row) for row in rows])
+    
+    def render_list(self, values: Iterable) -> str:
+        """Render a single-field template once per value (e.g. tags, pills)."""
+        if len(self.fields) != 1:
+            raise ValueError(f"render_list needs a single-field template, {self.name} has {len(self.fields)}")
+        values = [str(value) for value in values]
+        if not values:
+            return ''
+        prefix, suffix = self.literals
+        return prefix + (suffix + prefix).join(values) + suffix
+    
+    def stream(self, **context) -> Iterator[str]:
+        """
+        Yield the rendered template in chunks without building one string.
+        
+        Field values may be strings, iterables of strings (streamed through)
+        or anything else (converted with str()).
+        """
+        yield self.literals[0]
+        for field, literal in zip(self.fields, self.literals[1:]):
+            value = context[field]
+            if isinstance(value, str):
+                yield value
+            elif hasattr(value, '__iter__'):
+                yield from value
+            else:
+                yield str(value)
+            yield literal
+
+
+_cache: Dict[str, Tuple[int, Template]] = {}
+
+
+def get_template(name: str) -> Template:
+    """Return the compiled template templates/<name>, compiling it on first use."""
+    path = os.path.join(TEMPLATE_DIR, name)
+    mtime_ns = os.stat(path).st_mtime_ns
+    
+    cached = _cache.get(name)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        template = Template(f.read(), name)
+    _cache[name] = (mtime_ns, template)
+    return template
+
+
+def templates_digest(subdir: str = '') -> str:
+    """Hash every template file under templates/<subdir> (for render caches)."""
+    digest = hashlib.sha256()
+    for path in sorted((TEMPLATE_DIR / subdir).rglob('*.html')):
+        digest.update(path.relative_to(TEMPLATE_DIR).as_posix().encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def write_stream(filepath: Union[str, Path], chunks: Iterable[str]):
+    """Stream chunks to a file via a temporary sibling and an atomic rename."""
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = filepath.with_name(f".{filepath.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.writelines(chunks)
+    os.replace(tmp_path, filepath)
+
+
+def link_output(source: Union[str, Path], target: Union[str, Path]):
+    """
+    Publish source under a second name without writing it twice.
+    
+    Uses a hard link where the filesystem allows it and falls back to a copy.
+    """
+    source = Path(source)
+    target = Path(target)
+    if target.exists() and os.path.samefile(source, target):
+        return
+    
+    tmp_path = target.with_name(f".{target.name}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+    try:
+        os.link(source, tmp_path)
+    except OSError:
+        shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, target)
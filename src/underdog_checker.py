@@ -2,10 +2,27 @@
 Underdog checker - determines if a nation meets underdog criteria.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Tuple
 from src.data_loader import DataLoader
 
 
+# Criteria bit flags
+NEVER_MEDALED = 1
+NEVER_WON_GOLD = 2
+SMALL_POPULATION = 4
+
+
+class UnderdogResult(NamedTuple):
+    """Immutable underdog classification for one nation."""
+    ioc_code: str
+    flags: int
+    criteria: Tuple[str, ...]
+    
+    @property
+    def is_underdog(self) -> bool:
+        return self.flags != 0
+
+
 class UnderdogChecker:
     """Checks if nations meet underdog criteria."""
     
@@ -13,6 +30,27 @@ class UnderdogChecker:
         self.data_loader = data_loader
         self.config = config
         self.criteria_config = config['criteria']
+        self._labels = self._build_labels()
+        self._results: Dict[str, UnderdogResult] = {}
+        self._results_version = None
+    
+    def _build_labels(self) -> Dict[int, Tuple[str, ...]]:
+        """Precompute the criteria label tuple for every flag combination."""
+        labels = {}
+        threshold = self.criteria_config.get('population_threshold')
+        
+        for flags in range(8):
+            criteria_met = []
+            if flags & NEVER_MEDALED:
+                criteria_met.append("Never won any Olympic medal")
+            # Only add if not already flagged for never medaling
+            elif flags & NEVER_WON_GOLD:
+                criteria_met.append("Never won Olympic gold")
+            if flags & SMALL_POPULATION and threshold:
+                criteria_met.append(f"Population < {threshold / 1_000_000}M")
+            labels[flags] = tuple(criteria_met)
+        
+        return labels
     
     def check_never_medaled(self, ioc_code: str) -> bool:
         """Check if nation has never won any Olympic medal."""
@@ -30,45 +68,95 @@ class UnderdogChecker:
         threshold = self.criteria_config['population_threshold']
         return 0 < population < threshold
     
-    def is_underdog(self, ioc_code: str) -> Tuple[bool, List[str]]:
+    def _classify_values(self, ioc_code: str, gold: int, total: int,
+                         population: int) -> UnderdogResult:
+        """Build the result for a nation from its raw values."""
+        flags = 0
+        
+        # Check each enabled criterion
+        if self.criteria_config.get('never_medaled', False) and total == 0:
+            flags |= NEVER_MEDALED
+        
+        if self.criteria_config.get('never_won_gold', False) and gold == 0:
+            flags |= NEVER_WON_GOLD
+        
+        threshold = self.criteria_config.get('population_threshold')
+        if threshold and 0 < population < threshold:
+            flags |= SMALL_POPULATION
+        
+        return UnderdogResult(ioc_code, flags, self._labels[flags])
+    
+    def _check_cache(self):
+        """Drop memoized results if the data loader has reloaded since."""
+        if self._results_version != self.data_loader.version:
+            self._results = {}
+            self._results_version = self.data_loader.version
+    
+    def classify(self, ioc_code: str) -> UnderdogResult:
+        """Classify a single nation (memoized until the data loader reloads)."""
+        self._check_cache()
+        
+        result = self._results.get(ioc_code)
+        if result is None:
+            medals = self.data_loader.get_nation_medals(ioc_code)
+            population = self.data_loader.get_nation_population(ioc_code)
+            # Loading on first access bumps the version; re-sync before storing
+            self._check_cache()
+            result = self._classify_values(ioc_code, medals['gold'], medals['total'], population)
+            self._results[ioc_code] = result
+        
+        return result
+    
+    def classify_all(self) -> Dict[str, UnderdogResult]:
         """
-        Check if nation meets any underdog criteria.
+        Classify every nation known to the data loader in one pass.
         
         Returns:
-            Tuple of (is_underdog: bool, criteria_met: List[str])
+            Dict mapping IOC code to UnderdogResult
         """
-        criteria_met = []
+        loader = self.data_loader
+        if not loader.medals_loaded:
+            loader.load_medals()
+        if not loader.population_loaded:
+            loader.load_population()
+        self._check_cache()
         
-        # Check each enabled criterion
-        if self.criteria_config.get('never_medaled', False):
-            if self.check_never_medaled(ioc_code):
-                criteria_met.append("Never won any Olympic medal")
+        table = loader.nations
+        gold = table.columns['gold']
+        total = table.columns['total']
+        population = table.columns['population']
         
-        if self.criteria_config.get('never_won_gold', False):
-            if self.check_never_won_gold(ioc_code):
-                # Only add if not already flagged for never medaling
-                if "Never won any Olympic medal" not in criteria_met:
-                    criteria_met.append("Never won Olympic gold")
+        for nation_id, ioc_code in enumerate(table.codes):
+            if ioc_code not in self._results:
+                self._results[ioc_code] = self._classify_values(
+                    ioc_code, gold[nation_id], total[nation_id], population[nation_id]
+                )
         
-        if self.criteria_config.get('population_threshold'):
-            if self.check_small_population(ioc_code):
-                criteria_met.append(f"Population < {self.criteria_config['population_threshold'] / 1_000_000}M")
+        return dict(self._results)
+    
+    def is_underdog(self, ioc_code: str) -> Tuple[bool, Tuple[str, ...]]:
+        """
+        Check if nation meets any underdog criteria.
         
-        return (len(criteria_met) > 0, criteria_met)
+        Returns:
+            Tuple of (is_underdog: bool, criteria_met: Tuple[str, ...])
+        """
+        result = self.classify(ioc_code)
+        return (result.is_underdog, result.criteria)
     
-    def get_underdog_nations(self, nations: List[str]) -> Dict[str, List[str]]:
+    def get_underdog_nations(self, nations: List[str]) -> Dict[str, Tuple[str, ...]]:
         """
         Filter nations to only underdogs with their criteria.
         
         Returns:
-            Dict mapping IOC code to list of criteria met
+            Dict mapping IOC code to criteria met
         """
         underdogs = {}
         
         for nation in nations:
-            is_underdog, criteria = self.is_underdog(nation)
-            if is_underdog:
-                underdogs[nation] = criteria
+            result = self.classify(nation)
+            if result.is_underdog:
+                underdogs[nation] = result.criteria
         
         return underdogs
     
@@ -76,12 +164,12 @@ class UnderdogChecker:
         """Get detailed information about a nation."""
         medals = self.data_loader.get_nation_medals(ioc_code)
         population = self.data_loader.get_nation_population(ioc_code)
-        is_underdog, criteria = self.is_underdog(ioc_code)
+        result = self.classify(ioc_code)
         
         return {
             'ioc_code': ioc_code,
             'medals': medals,
             'population': population,
-            'is_underdog': is_underdog,
-            'criteria_met': criteria
+            'is_underdog': result.is_underdog,
+            'criteria_met': list(result.criteria)
         }
@@ -0,0 +1,162 @@
+"""
+Underdog criteria engine - evaluates the seven underdog criteria and tiers.
+
+All criteria are evaluated for every nation in one batched pass over the
+NationTable columns. Each criterion produces a boolean mask over the nation
+rows; the masks are folded into a per-nation criteria bitmask and a tier.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from src.nation_table import HAS_POPULATION, NationTable, SOUTHERN
+
+
+# Criterion bit flags
+SMALL_ATHLETES = 1 << 0
+NO_OLYMPIC_GOLD = 1 << 1
+NO_OLYMPIC_MEDALS = 1 << 2
+SMALL_POPULATION = 1 << 3
+NO_WINTER_GOLD = 1 << 4
+NO_WINTER_MEDALS = 1 << 5
+SOUTHERN_HEMISPHERE = 1 << 6
+
+# (flag, key, label) in display order
+CRITERIA = (
+    (SMALL_ATHLETES, 'small_athletes', '< 5 Athletes'),
+    (NO_OLYMPIC_GOLD, 'no_olympic_gold', 'No Olympic Gold Medals'),
+    (NO_OLYMPIC_MEDALS, 'no_olympic_medals', 'No Olympic Medals'),
+    (SMALL_POPULATION, 'small_population', 'Population Under 1M'),
+    (NO_WINTER_GOLD, 'no_winter_gold', 'No Winter Olympic Gold'),
+    (NO_WINTER_MEDALS, 'no_winter_medals', 'No Winter Olympic Medals'),
+    (SOUTHERN_HEMISPHERE, 'southern_hemisphere', 'Southern Hemisphere (Below Equator)'),
+)
+
+# Number of set bits for every possible 7-bit mask
+_POPCOUNT = bytes(bin(mask).count('1') for mask in range(1 << len(CRITERIA)))
+
+
+def tier_for_count(criteria_count: int) -> int:
+    """Map a criteria count to an underdog tier (0-5, where 5 is ultimate underdog)."""
+    if criteria_count >= 6:
+        return 5  # Ultimate underdog (6-7 criteria)
+    if criteria_count >= 4:
+        return 4  # Major underdogs (4-5 criteria)
+    return criteria_count  # 3 = strong, 2 = moderate, 1 = mild, 0 = not an underdog
+
+
+_TIERS = bytes(tier_for_count(_POPCOUNT[mask]) for mask in range(1 << len(CRITERIA)))
+
+
+class CriteriaResult:
+    """Criteria bitmasks and tiers for a set of nations, in evaluation order."""
+    
+    def __init__(self, codes: List[str], masks: array):
+        self.codes = codes
+        self.masks = masks
+        self.tiers = array('B', (_TIERS[mask] for mask in masks))
+        self.index = {code: i for i, code in enumerate(codes)}
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def __contains__(self, ioc_code: str) -> bool:
+        return ioc_code in self.index
+    
+    def mask(self, ioc_code: str) -> int:
+        """Return the criteria bitmask for a nation (0 if not evaluated)."""
+        i = self.index.get(ioc_code)
+        return 0 if i is None else self.masks[i]
+    
+    def tier(self, ioc_code: str) -> int:
+        """Return the underdog tier for a nation (0 if not evaluated)."""
+        i = self.index.get(ioc_code)
+        return 0 if i is None else self.tiers[i]
+    
+    def count(self, ioc_code: str) -> int:
+        """Return how many criteria a nation meets."""
+        return _POPCOUNT[self.mask(ioc_code)]
+    
+    def is_underdog(self, ioc_code: str) -> bool:
+        """Check whether a nation meets at least one criterion."""
+        return self.mask(ioc_code) != 0
+    
+    def criteria_keys(self, ioc_code: str) -> List[str]:
+        """Return the keys of the criteria a nation meets, in display order."""
+        mask = self.mask(ioc_code)
+        return [key for flag, key, _ in CRITERIA if mask & flag]
+    
+    def nations_meeting(self, flag: int) -> List[str]:
+        """Return nations (in evaluation order) meeting the given criterion."""
+        masks = self.masks
+        return [code for i, code in enumerate(self.codes) if masks[i] & flag]
+    
+    def underdogs(self) -> List[str]:
+        """Return nations meeting at least one criterion."""
+        masks = self.masks
+        return [code for i, code in enumerate(self.codes) if masks[i]]
+    
+    def counts_by_criteria(self) -> Dict[str, int]:
+        """Return the number of nations meeting each criterion."""
+        counts = {key: 0 for _, key, _ in CRITERIA}
+        for mask in self.masks:
+            for flag, key, _ in CRITERIA:
+                if mask & flag:
+                    counts[key] += 1
+        return counts
+
+
+def evaluate(table: NationTable, nations: Optional[Iterable[str]] = None,
+             population_threshold: int = 1_000_000,
+             athlete_threshold: int = 5, min_athletes: int = 1) -> CriteriaResult:
+    """
+    Evaluate all underdog criteria for the given nations in one pass.
+    
+    Args:
+        table: NationTable holding medals, winter medals, population and athletes
+        nations: IOC codes to evaluate (defaults to every nation in the table)
+        population_threshold: Known populations below this are small (a missing
+            population is not)
+        athlete_threshold: Teams below this many athletes are small
+        min_athletes: Smallest team size counted as small (0 counts empty teams)
+    
+    Returns:
+        CriteriaResult with per-nation bitmasks and tiers
+    """
+    codes = list(table.codes if nations is None else nations)
+    # Unknown nations read as zero rows; evaluation never adds rows to the table
+    ids = [table.id_of(code) for code in codes]
+    columns = table.columns
+    
+    def gather(name: str) -> List[int]:
+        column = columns[name]
+        return [0 if i is None else column[i] for i in ids]
+    
+    athletes = gather('athletes')
+    gold = gather('gold')
+    total = gather('total')
+    population = gather('population')
+    winter_gold = gather('winter_gold')
+    winter_total = gather('winter_total')
+    flags = [
+        (SOUTHERN if table.is_southern(code) else 0) if i is None else table.flags[i]
+        for code, i in zip(codes, ids)
+    ]
+    
+    # One boolean mask per criterion, combined column-wise into bitmasks
+    masks = [
+        (SMALL_ATHLETES, [min_athletes <= n < athlete_threshold for n in athletes]),
+        (NO_OLYMPIC_GOLD, [n == 0 for n in gold]),
+        (NO_OLYMPIC_MEDALS, [n == 0 for n in total]),
+        (SMALL_POPULATION, [bool(f & HAS_POPULATION) and n < population_threshold
+                            for n, f in zip(population, flags)]),
+        (NO_WINTER_GOLD, [n == 0 for n in winter_gold]),
+        (NO_WINTER_MEDALS, [n == 0 for n in winter_total]),
+        (SOUTHERN_HEMISPHERE, [bool(f & SOUTHERN) for f in flags]),
+    ]
+    
+    bits = [0] * len(codes)
+    for flag, mask in masks:
+        bits = [b | flag if hit else b for b, hit in zip(bits, mask)]
+    
+    return CriteriaResult(codes, array('B', bits))
@@ -0,0 +1,213 @@
+"""
+Watch mode - keeps data warm in memory and regenerates watchlists on data changes.
+
+Uses stat-based polling (no extra dependencies, works on Windows too): each
+poll compares mtimes/sizes of the watched files and only reloads the data
+sources whose files changed.
+
+Watchlists are rebuilt only from the files in config data_paths (schedule,
+medals, winter medals, population, athlete counts) and
+event_underdog_mappings.json. Every other file under data/ is reported but
+ignored; in particular the entry lists in data/daily updates/ feed the
+manual HTML update workflow (MANUAL_UPDATE_WORKFLOW.md), not the
+watchlists, so a changed entry list only prints the command that parses it.
+"""
+
+import copy
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.data_loader import DataLoader
+from src.event_underdog_mapper import EventUnderdogMapper
+from src.watchlist_generator import WatchlistGenerator
+
+
+# Attributes a reload rebinds, per owner type; saved by reference before an
+# update so a failed one can be rolled back without copying everything else
+RELOADED_ATTRIBUTES = {
+    DataLoader: (
+        'schedule_data', 'date_nations', 'date_sport_events', 'nation_dates',
+        'medals_loaded', 'winter_medals_loaded', 'population_loaded', 'athlete_counts_loaded',
+    ),
+    EventUnderdogMapper: (
+        'event_mappings', 'underdog_nations',
+        '_event_seq', '_date_index', '_nation_index', '_discipline_index',
+    ),
+}
+
+# Attributes a reload updates in place, so they have to be copied
+RELOADED_IN_PLACE = {
+    DataLoader: ('nations',),
+}
+
+# Entry lists for the manual update workflow (not watchlist inputs)
+DAILY_UPDATES_DIR = Path('data') / 'daily updates'
+
+
+class DataWatcher:
+    """Polls files and directories for added, modified or removed files."""
+    
+    def __init__(self, paths: Iterable[str], interval: float = 2.0):
+        self.paths = [Path(p) for p in paths]
+        self.interval = interval
+        self.state = self.scan()
+    
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        """Return {resolved path: (mtime_ns, size)} for every watched file."""
+        state = {}
+        for root in self.paths:
+            if root.is_dir():
+                for dirpath, dirnames, filenames in os.walk(root):
+                    # Skip hidden files/dirs (caches, temp files from atomic writes)
+                    dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+                    for name in filenames:
+                        if not name.startswith('.'):
+                            self._stat_into(state, Path(dirpath) / name)
+            else:
+                self._stat_into(state, root)
+        return state
+    
+    @staticmethod
+    def _stat_into(state: Dict[str, Tuple[int, int]], path: Path):
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        state[str(path.resolve())] = (stat.st_mtime_ns, stat.st_size)
+    
+    def poll(self) -> List[str]:
+        """Return paths that changed since the last poll."""
+        current = self.scan()
+        changed = [
+            path for path in current.keys() | self.state.keys()
+            if current.get(path) != self.state.get(path)
+        ]
+        self.state = current
+        return sorted(changed)
+    
+    def wait_for_changes(self) -> List[str]:
+        """Block until files change, then until they settle for one interval."""
+        changed = set()
+        while True:
+            time.sleep(self.interval)
+            new_changes = self.poll()
+            if new_changes:
+                changed.update(new_changes)
+            elif changed:
+                return sorted(changed)
+
+
+class WatchService:
+    """Maps changed data files to targeted reloads and regenerates watchlists."""
+    
+    def __init__(self, config: Dict, data_loader: DataLoader,
+                 watchlist_generator: WatchlistGenerator, event_mapper=None):
+        self.config = config
+        self.data_loader = data_loader
+        self.watchlist_generator = watchlist_generator
+        self.event_mapper = event_mapper
+        self.handlers = self._build_handlers()
+    
+    def _build_handlers(self) -> Dict[str, Callable[[], object]]:
+        """Map each known data file to the reload it requires."""
+        paths = self.config['data_paths']
+        loader = self.data_loader
+        handlers = {
+            paths['schedule']: loader.load_schedule,
+            paths['medals']: loader.load_medals,
+            paths['population']: loader.load_population,
+            paths.get('winter_medals', 'data/medals/winter_medals.json'): loader.load_winter_medals,
+            paths.get('athlete_counts', 'data/athlete_counts_2026.json'): loader.load_athlete_counts,
+        }
+        
+        if self.event_mapper is not None:
+            data_dir = self.event_mapper.data_dir
+            handlers[data_dir / 'event_underdog_mappings.json'] = self.event_mapper.load_mappings
+        
+        return {str(Path(path).resolve()): handler for path, handler in handlers.items()}
+    
+    def watch_paths(self) -> List[str]:
+        """Directories/files to watch: data/ plus any configured paths outside it."""
+        paths = {str(Path('data').resolve())}
+        for path in self.handlers:
+            if not any(path.startswith(root + os.sep) for root in paths):
+                paths.add(path)
+        return sorted(paths)
+    
+    def apply_changes(self, changed: List[str]) -> bool:
+        """Reload the sources behind changed files; return True if any were reloaded."""
+        daily_updates = DAILY_UPDATES_DIR.resolve()
+        reloaded = False
+        for path in changed:
+            handler = self.handlers.get(path)
+            if handler is None:
+                if Path(path).parent == daily_updates and path.endswith('.txt'):
+                    print(f"  Entry list changed (not a watchlist input): {path}\n"
+                          f"    Parse it with: python scripts/parse_entry_list_simple.py {Path(path).stem}")
+                else:
+                    print(f"  Changed (not a watchlist input, ignored): {path}")
+                continue
+            print(f"  Reloading: {path}")
+            handler()
+            reloaded = True
+        return reloaded
+    
+    def _snapshot(self) -> List[Tuple[object, Dict]]:
+        """Save the state a reload replaces, to roll back a failed update."""
+        owners = [self.data_loader] + ([self.event_mapper] if self.event_mapper is not None else [])
+        snapshot = []
+        for owner in owners:
+            state = vars(owner)
+            saved = {key: state[key] for key in RELOADED_ATTRIBUTES.get(type(owner), ()) if key in state}
+            for key in RELOADED_IN_PLACE.get(type(owner), ()):
+                if key in state:
+                    saved[key] = copy.deepcopy(state[key])
+            snapshot.append((owner, saved))
+        return snapshot
+    
+    def _restore(self, snapshot: List[Tuple[object, Dict]]):
+        """Put back a snapshot taken before a failed update."""
+        for owner, state in snapshot:
+            vars(owner).update(state)
+            if owner is self.data_loader:
+                # Keep counting up so caches built from the failed reload are dropped
+                owner.version += 1
+    
+    def run(self, interval: float = 2.0, max_cycles: Optional[int] = None, workers: int = 1):
+        """
+        Regenerate watchlists whenever their input files change.
+        
+        A failed reload or regeneration (e.g. a half-written JSON file) is
+        reported and rolled back to the previous data; watching continues.
+        
+        Args:
+            interval: Seconds between polls
+            max_cycles: Stop after this many change cycles (None = run until interrupted)
+            workers: Processes to render changed dates with
+        """
+        watcher = DataWatcher(self.watch_paths(), interval)
+        print(f"Watching {', '.join(str(p) for p in watcher.paths)} (every {interval}s, Ctrl+C to stop)...")
+        
+        cycles = 0
+        try:
+            while max_cycles is None or cycles < max_cycles:
+                changed = watcher.wait_for_changes()
+                cycles += 1
+                print(f"\nDetected {len(changed)} changed file(s) at {time.strftime('%H:%M:%S')}")
+                
+                snapshot = self._snapshot()
+                try:
+                    if self.apply_changes(changed):
+                        started = time.perf_counter()
+                        # Incremental: only dates whose inputs changed are rewritten
+                        counts = self.watchlist_generator.generate_all_dates(workers=workers)
+                        print(f"✓ Rebuilt {counts['rebuilt']} watchlist(s), {counts['skipped']} unchanged "
+                              f"in {time.perf_counter() - started:.2f}s")
+                except Exception as e:
+                    self._restore(snapshot)
+                    print(f"✗ Update failed ({type(e).__name__}: {e}); keeping the previous data. "
+                          f"Waiting for the next change...")
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
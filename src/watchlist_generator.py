@@ -3,12 +3,17 @@ Daily watchlist generator for Olympic underdogs.
 Uses event underdog mappings to show only events where underdogs are actually competing.
 """
 
+import hashlib
+import json
+import multiprocessing
+import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 from pathlib import Path
 from src.data_loader import DataLoader
 from src.underdog_checker import UnderdogChecker
 from src.medals_per_capita import MedalsPerCapitaCalculator
+from src.profiling import StageProfiler
 from src.utils import format_date_display, get_ioc_code_name_map
 
 try:
@@ -17,18 +22,28 @@ except ImportError:
     EventUnderdogMapper = None
 
 
+# Build manifest recording the input hash of every generated watchlist.
+# The hash covers this module's source, so layout changes rebuild on their own;
+# bump MANIFEST_VERSION when the manifest format itself changes.
+MANIFEST_FILE = '.manifest.json'
+MANIFEST_VERSION = 1
+
+
 class WatchlistGenerator:
     """Generates daily watchlists of underdog nations competing."""
     
     def __init__(self, data_loader: DataLoader, underdog_checker: UnderdogChecker,
                  medals_calculator: MedalsPerCapitaCalculator, config: Dict,
-                 event_mapper: Optional['EventUnderdogMapper'] = None):
+                 event_mapper: Optional['EventUnderdogMapper'] = None,
+                 profiler: Optional[StageProfiler] = None):
         self.data_loader = data_loader
         self.underdog_checker = underdog_checker
         self.medals_calculator = medals_calculator
         self.config = config
         self.nation_names = get_ioc_code_name_map()
         self.event_mapper = event_mapper
+        self._sidebar = None
+        self.profiler = profiler or StageProfiler()
     
     def generate_for_date(self, date: str) -> str:
         """
@@ -115,7 +130,7 @@ class WatchlistGenerator:
         return "\n".join(output)
     
     def _format_mapped_watchlist(self, date: str, mapped_events: List[Dict], 
-                                 underdogs: Dict[str, List[str]]) -> str:
+                                 underdogs: Dict[str, Sequence[str]]) -> str:
         """Format watchlist using refined event mappings."""
         date_obj = datetime.strptime(date, "%Y-%m-%d")
         output = [
@@ -125,28 +140,18 @@ class WatchlistGenerator:
             ""
         ]
         
-        # Group by discipline
-        disciplines = {}
-        for event in mapped_events:
-            disc = event['discipline']
-            if disc not in disciplines:
-                disciplines[disc] = []
-            disciplines[disc].append(event)
+        # Index discipline -> nation -> events in one pass
+        disciplines = self._index_events_by_nation(mapped_events, lambda e: e['discipline'])
         
         # Format each discipline
         for discipline in sorted(disciplines.keys()):
             output.append(f"## {discipline}")
             output.append("")
             
-            disc_events = disciplines[discipline]
-            
-            # Get all underdogs in this discipline
-            disc_underdogs = set()
-            for event in disc_events:
-                disc_underdogs.update(event['underdog_nations'])
+            disc_nation_events = disciplines[discipline]
             
             # Show each underdog
-            for nation in sorted(disc_underdogs):
+            for nation in sorted(disc_nation_events):
                 name = self.nation_names.get(nation, nation)
                 output.append(f"### {name} ({nation})")
                 
@@ -156,7 +161,7 @@ class WatchlistGenerator:
                         output.append(f"- _{criterion}_")
                 
                 # Show events for this nation
-                nation_events = [e for e in disc_events if nation in e['underdog_nations']]
+                nation_events = disc_nation_events[nation]
                 
                 if nation_events:
                     output.append("")
@@ -178,7 +183,7 @@ class WatchlistGenerator:
         return "\n".join(output)
     
     def _format_watchlist(self, date: str, events: List[Dict], 
-                         underdogs: Dict[str, List[str]]) -> str:
+                         underdogs: Dict[str, Sequence[str]]) -> str:
         """Format full watchlist with underdogs."""
         date_obj = datetime.strptime(date, "%Y-%m-%d")
         output = [
@@ -203,37 +208,24 @@ class WatchlistGenerator:
         
         return "\n".join(output)
     
-    def _format_by_sport(self, events: List[Dict], underdogs: Dict[str, List[str]]) -> List[str]:
+    def _format_by_sport(self, events: List[Dict], underdogs: Dict[str, Sequence[str]]) -> List[str]:
         """Format underdog entries grouped by sport."""
         output = []
         
-        # Group events by sport
-        sports_events = {}
-        for event in events:
-            sport = event.get('sport', 'Unknown')
-            if sport not in sports_events:
-                sports_events[sport] = []
-            sports_events[sport].append(event)
+        # Index sport -> underdog nation -> events in one pass
+        sports_events = self._index_events_by_nation(
+            events, lambda e: e.get('sport', 'Unknown'), underdogs
+        )
         
         # Process each sport
-        for sport, sport_events in sorted(sports_events.items()):
-            # Find underdogs in this sport
-            sport_underdogs = set()
-            for event in sport_events:
-                # Use underdog_nations field if available (for sports with specific competitor lists)
-                # Otherwise fall back to general nations field
-                competing_nations = event.get('underdog_nations', event.get('nations', []))
-                for nation in competing_nations:
-                    if nation in underdogs:
-                        sport_underdogs.add(nation)
-            
-            if not sport_underdogs:
+        for sport, sport_nation_events in sorted(sports_events.items()):
+            if not sport_nation_events:
                 continue
             
             output.append(f"## {sport}")
             output.append("")
             
-            for nation in sorted(sport_underdogs):
+            for nation in sorted(sport_nation_events):
                 name = self.nation_names.get(nation, nation)
                 output.append(f"### {name} ({nation})")
                 
@@ -242,12 +234,7 @@ class WatchlistGenerator:
                     output.append(f"- _{criterion}_")
                 
                 # Show events for this nation in this sport
-                nation_events = []
-                for e in sport_events:
-                    # Check if nation is in underdog_nations (preferred) or nations field
-                    competing_nations = e.get('underdog_nations', e.get('nations', []))
-                    if nation in competing_nations:
-                        nation_events.append(e)
+                nation_events = sport_nation_events[nation]
                 
                 if nation_events:
                     output.append("")
@@ -261,9 +248,10 @@ class WatchlistGenerator:
         return output
     
     def _format_chronologically(self, events: List[Dict], 
-                               underdogs: Dict[str, List[str]]) -> List[str]:
+                               underdogs: Dict[str, Sequence[str]]) -> List[str]:
         """Format underdog entries chronologically."""
         output = []
+        nation_index = self._index_events_by_nation(events, lambda e: None, underdogs).get(None, {})
         
         for nation in sorted(underdogs.keys()):
             name = self.nation_names.get(nation, nation)
@@ -274,12 +262,7 @@ class WatchlistGenerator:
                 output.append(f"- _{criterion}_")
             
             # Show events for this nation
-            nation_events = []
-            for e in events:
-                # Check if nation is in underdog_nations (preferred) or nations field
-                competing_nations = e.get('underdog_nations', e.get('nations', []))
-                if nation in competing_nations:
-                    nation_events.append(e)
+            nation_events = nation_index.get(nation, [])
             
             if nation_events:
                 output.append("")
@@ -292,6 +275,25 @@ class WatchlistGenerator:
         
         return output
     
+    def _index_events_by_nation(self, events: List[Dict], group_key: Callable[[Dict], str],
+                                underdogs: Optional[Dict[str, Sequence[str]]] = None
+                                ) -> Dict[str, Dict[str, List[Dict]]]:
+        """
+        Build group -> nation -> events (in schedule order) in one pass.
+        
+        Nations come from underdog_nations (preferred) or the general nations
+        field. If underdogs is given, only those nations are indexed.
+        """
+        index = {}
+        for event in events:
+            by_nation = index.setdefault(group_key(event), {})
+            competing_nations = set(event.get('underdog_nations', event.get('nations', [])))
+            if underdogs is not None:
+                competing_nations = competing_nations.intersection(underdogs)
+            for nation in competing_nations:
+                by_nation.setdefault(nation, []).append(event)
+        return index
+    
     def _format_event_line(self, event: Dict) -> str:
         """Format a single event line."""
         parts = []
@@ -315,36 +317,199 @@ class WatchlistGenerator:
     
     def _generate_sidebar(self) -> str:
         """Generate medals per capita leaderboard sidebar."""
-        max_nations = self.config['display'].get('max_nations_sidebar', 20)
-        leaderboard = self.medals_calculator.get_leaderboard(top_n=max_nations)
-        return self.medals_calculator.format_leaderboard(leaderboard, self.nation_names)
+        # The sidebar is the same for every date; render it once per data version
+        version = self.data_loader.version
+        if self._sidebar is None or self._sidebar[0] != version:
+            max_nations = self.config['display'].get('max_nations_sidebar', 20)
+            leaderboard = self.medals_calculator.get_leaderboard(top_n=max_nations)
+            sidebar = self.medals_calculator.format_leaderboard(leaderboard, self.nation_names)
+            self._sidebar = (self.data_loader.version, sidebar)
+        return self._sidebar[1]
     
     def save_watchlist(self, date: str, content: str):
         """Save watchlist to file."""
+        filepath = self._write_watchlist(date, content)
+        print(f"Watchlist saved to: {filepath}")
+    
+    def save_watchlists(self, contents: Dict[str, str]):
+        """Save several watchlists in one batch."""
+        for date, content in contents.items():
+            self._write_watchlist(date, content)
+        
+        output_dir = self.config['output']['directory']
+        print(f"Saved {len(contents)} watchlists to: {output_dir}")
+    
+    def _write_watchlist(self, date: str, content: str) -> Path:
+        """Write a single watchlist file and return its path."""
         output_dir = Path(self.config['output']['directory'])
         output_dir.mkdir(parents=True, exist_ok=True)
         
         filename = f"watchlist_{date}.md"
         filepath = output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _atomic_write(filepath, content)
+        return filepath
+    
+    def compute_input_hash(self, date: str) -> str:
+        """
+        Hash everything a date's watchlist depends on: its events, the
+        classification and display name of every nation in them, the
+        sidebar, the display settings and the source of this module.
+        """
+        if self.event_mapper:
+            events = self.event_mapper.get_events_for_date(date)
+        else:
+            events = self.data_loader.get_events_for_date(date)
         
-        print(f"Watchlist saved to: {filepath}")
+        nations = set()
+        for event in events:
+            nations.update(event.get('underdog_nations', []))
+            nations.update(event.get('nations', []))
+        
+        include_sidebar = self.config['output'].get('include_sidebar', True)
+        inputs = {
+            'manifest_version': MANIFEST_VERSION,
+            'source': _source_digest(),
+            'date': date,
+            'mapped': bool(self.event_mapper),
+            'events': events,
+            'nations': {
+                nation: [self.nation_names.get(nation, nation),
+                         list(self.underdog_checker.classify(nation).criteria)]
+                for nation in sorted(nations)
+            },
+            'sidebar': self._generate_sidebar() if include_sidebar else None,
+            'display': self.config['display']
+        }
+        
+        encoded = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+    
+    def _manifest_path(self) -> Path:
+        return Path(self.config['output']['directory']) / MANIFEST_FILE
+    
+    def load_manifest(self) -> Dict[str, str]:
+        """Load the date -> input hash manifest from the output directory."""
+        try:
+            with open(self._manifest_path(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
     
-    def generate_all_dates(self) -> List[str]:
-        """Generate watchlists for all dates in the Olympics."""
+    def save_manifest(self, manifest: Dict[str, str]):
+        """Save the date -> input hash manifest atomically."""
+        path = self._manifest_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(path, json.dumps(manifest, indent=2, sort_keys=True))
+    
+    def get_olympic_dates(self) -> List[str]:
+        """Get every date of the Olympics as YYYY-MM-DD strings."""
         start_date = datetime.strptime(self.config['olympics']['start_date'], "%Y-%m-%d")
         end_date = datetime.strptime(self.config['olympics']['end_date'], "%Y-%m-%d")
         
+        dates = []
         current_date = start_date
-        generated_files = []
-        
         while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            content = self.generate_for_date(date_str)
-            self.save_watchlist(date_str, content)
-            generated_files.append(date_str)
+            dates.append(current_date.strftime("%Y-%m-%d"))
             current_date += timedelta(days=1)
         
-        return generated_files
+        return dates
+    
+    def generate_all_dates(self, workers: int = 1, force: bool = False) -> Dict[str, int]:
+        """
+        Generate watchlists for all dates in the Olympics.
+        
+        Only dates whose inputs changed since the last run (per the build
+        manifest) are re-rendered and rewritten, unless force is set.
+        
+        Args:
+            workers: Number of processes to render dates with. With more than
+                one worker, dates are rendered in a forked process pool that
+                shares this generator's preloaded data, and all files are
+                written in one batch afterwards.
+            force: Rebuild every date regardless of the manifest
+        
+        Returns:
+            Counts of 'rebuilt' and 'skipped' (unchanged) dates
+        """
+        dates = self.get_olympic_dates()
+        profiler = self.profiler
+        
+        # Classify every nation once; per-date lookups then hit the memo
+        with profiler.stage('classification'):
+            self.underdog_checker.classify_all()
+        
+        with profiler.stage('input_hashing'):
+            manifest = {} if force else self.load_manifest()
+            output_dir = Path(self.config['output']['directory'])
+            input_hashes = {date: self.compute_input_hash(date) for date in dates}
+            stale_dates = [
+                date for date in dates
+                if manifest.get(date) != input_hashes[date]
+                or not (output_dir / f"watchlist_{date}.md").exists()
+            ]
+        
+        if stale_dates and workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            # Shared state (classification, sidebar) is already warm from hashing
+            with profiler.stage('render'):
+                contents = self._render_parallel(stale_dates, workers)
+            with profiler.stage('save'):
+                self.save_watchlists(contents)
+        else:
+            if workers > 1 and stale_dates:
+                print("Warning: Parallel generation needs the 'fork' start method; rendering serially.")
+            
+            for date_str in stale_dates:
+                with profiler.stage('render'):
+                    content = self.generate_for_date(date_str)
+                with profiler.stage('save'):
+                    self.save_watchlist(date_str, content)
+        
+        for date in stale_dates:
+            manifest[date] = input_hashes[date]
+        if stale_dates:
+            with profiler.stage('save'):
+                self.save_manifest(manifest)
+        
+        return {'rebuilt': len(stale_dates), 'skipped': len(dates) - len(stale_dates)}
+    
+    def _render_parallel(self, dates: List[str], workers: int) -> Dict[str, str]:
+        """Render dates across a forked process pool."""
+        global _fork_generator
+        _fork_generator = self
+        try:
+            context = multiprocessing.get_context('fork')
+            with context.Pool(processes=min(workers, len(dates))) as pool:
+                rendered = pool.map(_render_date, dates)
+        finally:
+            _fork_generator = None
+        
+        return dict(zip(dates, rendered))
+
+
+# Generator inherited by forked worker processes (read-only in the workers)
+_fork_generator: Optional[WatchlistGenerator] = None
+
+
+def _render_date(date: str) -> str:
+    """Render one date in a worker process."""
+    return _fork_generator.generate_for_date(date)
+
+
+_SOURCE_DIGEST: Optional[str] = None
+
+
+def _source_digest() -> str:
+    """Hash of this module's source (part of every input hash)."""
+    global _SOURCE_DIGEST
+    if _SOURCE_DIGEST is None:
+        _SOURCE_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    return _SOURCE_DIGEST
+
+
+def _atomic_write(filepath: Path, content: str):
+    """Write a file via a temporary sibling and an atomic rename."""
+    tmp_path = filepath.with_name(f".{filepath.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, filepath)
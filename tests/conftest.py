@@ -0,0 +1,10 @@
+"""Shared pytest setup: make the repository root and scripts/ importable."""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / 'scripts'))
+
+FIXTURES = Path(__file__).parent / 'fixtures'
@@ -0,0 +1,110 @@
+"""
+FetchEngine with the shared HTTP cache against a local stand-in server
+replaying a corpus, so fetching, parsing and revalidation run offline.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.fetch import FetchEngine, FetchResult
+from src.http_cache import HttpCache
+from src.replay import Corpus, stand_in_server, stand_in_url
+
+
+PAGES = {
+    f'https://en.wikipedia.org/wiki/Nation_{n}': f'<html><h1>Nation {n}</h1></html>'
+    for n in range(5)
+}
+
+
+def page_title(result: FetchResult) -> str:
+    return result.text.split('<h1>')[1].split('</h1>')[0]
+
+
+@pytest.fixture
+def server(tmp_path):
+    corpus = Corpus(tmp_path / 'pages.corpus.gz')
+    for url, html in PAGES.items():
+        corpus.record(FetchResult(url, 200, html.encode('utf-8'), {'Content-Type': 'text/html'}))
+    server = stand_in_server(corpus)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_engine_fetches_through_cache_and_revalidates(server, tmp_path):
+    urls = {stand_in_url(server, url): url for url in PAGES}
+    # ttl=0: every later request revalidates instead of being served fresh
+    cache = HttpCache(tmp_path / 'http', ttl=0)
+    engine = FetchEngine(concurrency=4, per_host=2, host_interval=0, retries=0,
+                         transport=cache.transport())
+    
+    first = engine.run(urls, parse=page_title)
+    assert {urls[url]: parsed for url, (_, parsed) in first.items()} == {
+        url: f'Nation {n}' for n, url in enumerate(PAGES)
+    }
+    assert cache.stats['downloaded'] == len(PAGES)
+    assert cache.stats['revalidated'] == 0
+    
+    second = engine.run(urls, parse=page_title)
+    assert {url: parsed for url, (_, parsed) in second.items()} == \
+        {url: parsed for url, (_, parsed) in first.items()}
+    assert all(result.status == 200 for result, _ in second.values())
+    assert cache.stats['downloaded'] == len(PAGES)
+    assert cache.stats['revalidated'] == len(PAGES)
+    assert cache.stats['errors'] == 0
+
+
+class TruncatingHandler(BaseHTTPRequestHandler):
+    """Answers /good normally and /bad with a body shorter than its Content-Length."""
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def do_GET(self):
+        body = b'<h1>Good</h1>' if self.path == '/good' else b'ok'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body) if self.path == '/good' else 1000))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def truncating_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), TruncatingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_bad_responses_fail_only_their_own_url(truncating_server):
+    good, bad = f"{truncating_server}/good", f"{truncating_server}/bad"
+    engine = FetchEngine(host_interval=0, retries=0)
+    
+    results = engine.run([good, bad, 'http://[bad-url'], parse=page_title)
+    assert results[good][1] == 'Good'
+    assert results[bad][0].status == 0 and 'IncompleteRead' in results[bad][0].error
+    assert results['http://[bad-url'][0].status == 0
+
+
+def test_failing_transport_and_callback_do_not_cancel_the_run():
+    def transport(url, headers, timeout):
+        if url.endswith('boom'):
+            raise RuntimeError('transport bug')
+        return FetchResult(url, 200, b'<h1>Fine</h1>')
+    
+    def on_result(result, parsed, error):
+        if parsed == 'Fine':
+            raise KeyError('callback bug')
+    
+    engine = FetchEngine(host_interval=0, retries=0, transport=transport)
+    results = engine.run(['http://a/fine', 'http://a/boom'], parse=page_title, on_result=on_result)
+    assert results['http://a/fine'][1] == 'Fine'
+    assert results['http://a/boom'][0].status == 0
+    assert 'transport bug' in results['http://a/boom'][0].error
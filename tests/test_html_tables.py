@@ -0,0 +1,89 @@
+"""src.html_tables against pd.read_html, and its lxml and html.parser front ends against each other."""
+
+from io import StringIO
+
+import pytest
+
+from benchmarks.synthetic import nation_codes, wiki_medal_table_page, wiki_nation_page
+from conftest import FIXTURES
+from src import html_tables
+from src.html_tables import Table, extract_tables, find_table, to_int
+
+
+def fixture_pages():
+    pages = [pytest.param((FIXTURES / name).read_text(encoding='utf-8'), id=name)
+             for name in ('spans_table.html', 'nation_page.html', 'medal_table_page.html')]
+    return pages + [
+        pytest.param(wiki_nation_page('XAAA'), id='synthetic-nation'),
+        pytest.param(wiki_medal_table_page(nation_codes(20)), id='synthetic-medals'),
+    ]
+
+
+def same_cell(text, value):
+    """Cell text against read_html's value (which may have been parsed as a number)."""
+    if isinstance(value, str):
+        return text == value
+    return float(text) == float(value)
+
+
+def as_lists(tables):
+    return [(table.classes, table.caption, table.header_rows, table.rows) for table in tables]
+
+
+@pytest.mark.parametrize('html', fixture_pages())
+def test_to_frame_matches_read_html(html):
+    pd = pytest.importorskip('pandas')
+    pytest.importorskip('lxml')
+    
+    tables = extract_tables(html, classes=('wikitable',))
+    # Cell text as read_html reads it (no thousands separators or NaN inferred)
+    frames = pd.read_html(StringIO(html), thousands=None, keep_default_na=False)
+    expected = [frame for frame, table in zip(frames, extract_tables(html))
+                if 'wikitable' in table.classes]
+    assert len(tables) == len(expected)
+    for table, reference in zip(tables, expected):
+        frame = table.to_frame()
+        assert frame.columns.tolist() == reference.columns.tolist()
+        assert frame.shape == reference.shape
+        for row, reference_row in zip(frame.values.tolist(), reference.values.tolist()):
+            assert all(same_cell(text, value) for text, value in zip(row, reference_row)), row
+
+
+@pytest.mark.parametrize('html', fixture_pages())
+def test_lxml_and_stdlib_parsers_agree(html, monkeypatch):
+    if html_tables.etree is None:
+        pytest.skip('lxml not installed')
+    with_lxml = as_lists(extract_tables(html))
+    monkeypatch.setattr(html_tables, 'etree', None)
+    assert as_lists(extract_tables(html)) == with_lxml
+
+
+def test_spans_and_hidden_cells():
+    html = (FIXTURES / 'spans_table.html').read_text(encoding='utf-8')
+    table = find_table(html, ('athlete', 'run 1'))
+    assert table.caption == "Men's events"
+    assert table.columns[2] == ('Run 1', 'Time')
+    assert table.rows[1] == ['Benjamin Alexander', 'Slalom'] + ['Did not finish'] * 4 + ['2:58.87']
+    assert table.rows[3] == ['Henri Rivers Jr.', 'Downhill', 'Single run', 'Single run',
+                             '1:55.02', '42', '1:55.02']
+
+
+def test_tables_in_comments_and_scripts_are_skipped():
+    html = (FIXTURES / 'nation_page.html').read_text(encoding='utf-8')
+    competitors = find_table(html, (('sport', 'discipline'), ('men', 'women')))
+    assert competitors.rows[0][0] == 'Alpine skiing'
+    assert not any(row[0] == 'Luge' for row in competitors.rows)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('12', 12), ('4data-sort-value=""', 4), ('1,234', 1), (' 7 ', 7), ('2.7', 2),
+    ('—', 0), ('-', 0), ('', 0), (None, 0), ('-1', -1), ('inf', 0), ('nan', 0), ('n/a', 0),
+])
+def test_to_int(text, expected):
+    assert to_int(text) == expected
+
+
+def test_typed_rows_convert_only_int_columns():
+    table = Table([], '', [['Sport', 'Men', 'Women']], [['Luge', '2', '1'], ['Biathlon', '—'], ['Total']])
+    assert table.typed_rows([1, 2]) == [['Luge', 2, 1], ['Biathlon', 0, 0], ['Total', 0, 0]]
+    assert table.typed_rows() == [['Luge', '2', '1'], ['Biathlon', '—', ''], ['Total', '', '']]
@@ -0,0 +1,48 @@
+"""
+Sort-key handling and caching in src.medals_per_capita.MedalsRanking.
+"""
+
+from src.medals_per_capita import MedalsRanking
+
+
+def nation_stats(total, gold, population):
+    return {
+        'total_per_capita': total / population * 1_000_000,
+        'gold_per_capita': gold / population * 1_000_000,
+        'winter_per_capita': 0.0,
+        'winter_total': 0,
+        'medals_per_athlete': 0.0,
+        'medals': {'gold': gold, 'silver': 0, 'bronze': total - gold, 'total': total},
+        'population': population,
+        'athletes': 0,
+    }
+
+
+STATS = {
+    'AAA': nation_stats(total=10, gold=0, population=1_000_000),
+    'BBB': nation_stats(total=4, gold=4, population=1_000_000),
+    'CCC': nation_stats(total=6, gold=2, population=1_000_000),
+}
+
+
+def test_unknown_sort_key_falls_back_to_gold():
+    ranking = MedalsRanking(STATS)
+    assert [nation for nation, _ in ranking.top(3, 'total')] == ['AAA', 'CCC', 'BBB']
+    assert ranking.top(3, 'nonsense') == ranking.top(3, 'gold')
+    assert [nation for nation, _ in ranking.top(3, 'nonsense')] == ['BBB', 'CCC', 'AAA']
+    assert ranking.rank('BBB', 'nonsense') == ranking.rank('BBB', 'gold') == 1
+
+
+def test_top_returns_a_copy_of_the_cached_list():
+    ranking = MedalsRanking(STATS)
+    leaders = ranking.top(2)
+    leaders.clear()
+    assert [nation for nation, _ in ranking.top(2)] == ['AAA', 'CCC']
+
+
+def test_winter_ranking_uses_winter_total():
+    stats = {nation: dict(values) for nation, values in STATS.items()}
+    stats['CCC'].update(winter_total=3, winter_per_capita=3.0)
+    ranking = MedalsRanking(stats)
+    assert [nation for nation, _ in ranking.top(3, 'winter')] == ['CCC']
+    assert set(stats['CCC']['medals']) == {'gold', 'silver', 'bronze', 'total'}
@@ -0,0 +1,111 @@
+"""
+Record-and-replay fixtures in src.replay: recording and replaying
+transports, the gzip corpus on disk and the SCRAPER_MODE switch.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src import replay
+from src.fetch import FetchEngine, FetchResult, http_get
+from src.http_cache import scraper_transport
+from src.replay import Corpus
+
+
+PAGE = '<html><h1>Sámi</h1></html>'.encode('utf-8')
+BINARY = bytes(range(256))
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves PAGE at /page and BINARY (not UTF-8) at /binary."""
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def do_GET(self):
+        body = PAGE if self.path == '/page' else BINARY
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html' if self.path == '/page' else 'image/png')
+        self.send_header('ETag', f'"{self.path[1:]}"')
+        self.send_header('X-Dropped', 'not kept')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def origin():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def scraper_mode(monkeypatch, tmp_path):
+    """Select a SCRAPER_MODE with a fresh corpus and no exit hook."""
+    monkeypatch.setattr(replay, '_active', None)
+    monkeypatch.setattr(replay.atexit, 'register', lambda *args: None)
+    monkeypatch.setenv('SCRAPER_CORPUS', str(tmp_path / 'scrapers.corpus.gz'))
+    
+    def select(mode):
+        monkeypatch.setenv('SCRAPER_MODE', mode)
+        return tmp_path / 'scrapers.corpus.gz'
+    return select
+
+
+def test_record_save_and_replay_round_trip(origin, tmp_path):
+    path = tmp_path / 'corpus.gz'
+    corpus = Corpus(path)
+    record_get = corpus.recording(http_get)
+    for name in ('page', 'binary'):
+        assert record_get(f"{origin}/{name}", {}, 5).status == 200
+    corpus.save()
+    
+    replayed = Corpus(path)
+    assert len(replayed) == 2
+    replay_get = replayed.replaying()
+    page = replay_get(f"{origin}/page", {}, 5)
+    binary = replay_get(f"{origin}/binary", {}, 5)
+    assert (page.status, page.body) == (200, PAGE)
+    assert binary.body == BINARY
+    assert page.headers == {'Content-Type': 'text/html', 'ETag': '"page"'}
+
+
+def test_transfer_failures_are_not_recorded(tmp_path):
+    corpus = Corpus(tmp_path / 'corpus.gz')
+    corpus.recording(lambda url, headers, timeout: FetchResult(url, 0, error='refused'))(
+        'http://example.invalid/', {}, 5)
+    assert len(corpus) == 0 and corpus.recorded == 0
+
+
+def test_replay_miss_is_a_fast_404(tmp_path):
+    corpus = Corpus(tmp_path / 'missing.corpus.gz')
+    engine = FetchEngine(host_interval=0, transport=corpus.replaying())
+    
+    started = time.perf_counter()
+    result, _ = engine.run(['https://en.wikipedia.org/wiki/Nowhere'])['https://en.wikipedia.org/wiki/Nowhere']
+    assert result.status == 404 and not result.ok
+    assert corpus.misses == 1
+    # 404 is not retried, so there is no back-off
+    assert time.perf_counter() - started < 1.0
+
+
+def test_scraper_mode_switch(origin, scraper_mode, monkeypatch):
+    monkeypatch.delenv('SCRAPER_MODE', raising=False)
+    assert scraper_transport(use_cache=False) is http_get
+    
+    corpus_path = scraper_mode('record')
+    assert scraper_transport(use_cache=False)(f"{origin}/page", {}, 5).body == PAGE
+    replay.active_corpus()[1].save()
+    assert corpus_path.exists()
+    
+    scraper_mode('replay')
+    replay_get = scraper_transport(use_cache=False)
+    assert replay_get(f"{origin}/page", {}, 5).body == PAGE
+    assert replay_get(f"{origin}/binary", {}, 5).status == 404
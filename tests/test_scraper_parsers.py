@@ -0,0 +1,231 @@
+"""
+The column-wise scraper parsers against the per-row parsers they replaced.
+
+The legacy classes below are the previous implementations (BeautifulSoup +
+read_html to find the table, iterrows to read it), kept here as the
+reference: both paths must produce identical dicts for the same page.
+"""
+
+import contextlib
+import io
+import re
+from io import StringIO
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+BeautifulSoup = pytest.importorskip('bs4').BeautifulSoup
+pytest.importorskip('lxml')
+
+from benchmarks.synthetic import nation_codes, wiki_medal_table_page, wiki_nation_page
+from conftest import FIXTURES
+from scrape_nation_sports import NationCompetitorsScraper
+from scrape_pandas import PandasOlympicScraper
+from src.html_tables import find_table
+
+
+class LegacyNationScraper(NationCompetitorsScraper):
+    """Previous competitors parser (per-row)."""
+    
+    def parse_nation_page(self, html, debug=False):
+        soup = BeautifulSoup(html, 'html.parser')
+        for html_table in soup.find_all('table', class_='wikitable'):
+            try:
+                df = pd.read_html(StringIO(str(html_table)))[0]
+                cols_str = str(df.columns).lower()
+                if ('sport' in cols_str or 'discipline' in cols_str) and ('men' in cols_str or 'women' in cols_str):
+                    result = self._parse_competitors_table(df)
+                    if result:
+                        return result
+            except Exception:
+                continue
+        return {}
+    
+    def _parse_competitors_table(self, df):
+        sports_data = {}
+        sport_col = men_col = women_col = None
+        for col in df.columns:
+            col_str = str(col).lower()
+            if 'sport' in col_str or 'discipline' in col_str:
+                if sport_col is None:
+                    sport_col = col
+            if 'men' in col_str and 'women' not in col_str:
+                men_col = col
+            if 'women' in col_str:
+                women_col = col
+        if sport_col is None:
+            return {}
+        for idx, row in df.iterrows():
+            try:
+                sport = str(row[sport_col]).strip()
+                if not sport or sport.lower() in ['sport', 'discipline', 'total', 'nan']:
+                    continue
+                sport_normalized = self._normalize_sport_name(sport)
+                if not sport_normalized:
+                    continue
+                men = self._safe_int(row[men_col]) if men_col is not None else 0
+                women = self._safe_int(row[women_col]) if women_col is not None else 0
+                total = men + women
+                if total > 0:
+                    sports_data[sport_normalized] = {'men': men, 'women': women, 'total': total}
+            except Exception:
+                continue
+        return sports_data
+    
+    def _safe_int(self, value):
+        try:
+            if pd.notna(value):
+                s = str(value).strip()
+                match = re.match(r'^(\d+)', s)
+                if match:
+                    return int(match.group(1))
+                s = s.replace(',', '')
+                if s and s not in ['—', '-', '']:
+                    return int(float(s))
+        except Exception:
+            pass
+        return 0
+
+
+class LegacyMedalScraper(PandasOlympicScraper):
+    """Previous medal table parser (per-row)."""
+    
+    def parse_page(self, html):
+        for table in pd.read_html(StringIO(html)):
+            cols_str = str(table.columns).lower()
+            if 'summer' in cols_str and 'winter' in cols_str and 'combined' in cols_str:
+                return self._parse_combined_table(table)
+        return {}, {}
+    
+    def _parse_combined_table(self, df):
+        winter_medals, all_time_medals = {}, {}
+        team_col = next((col for col in df.columns
+                         if 'team' in str(col).lower() or ('ioc' in str(col).lower() and len(str(col)) < 50)),
+                        df.columns[0])
+        winter_cols, combined_cols = [], []
+        for i, col in enumerate(df.columns):
+            level0 = str(col[0]).lower()
+            if 'summer' in level0:
+                continue
+            elif 'winter' in level0:
+                winter_cols.append(i)
+            elif 'combined' in level0:
+                combined_cols.append(i)
+        for idx, row in df.iterrows():
+            try:
+                nation = str(row[team_col])
+                if pd.isna(nation) or 'team' in nation.lower() or nation.strip() == '':
+                    continue
+                ioc_code = self._extract_ioc_code(nation)
+                if not ioc_code:
+                    continue
+                for cols, medals in ((winter_cols, winter_medals), (combined_cols, all_time_medals)):
+                    if len(cols) >= 5:
+                        gold, silver, bronze, total = (self._safe_int(row.iloc[cols[i]]) for i in range(1, 5))
+                        if total and total > 0:
+                            medals[ioc_code] = {'gold': gold or 0, 'silver': silver or 0,
+                                                'bronze': bronze or 0, 'total': total}
+            except Exception:
+                continue
+        return winter_medals, all_time_medals
+    
+    def _extract_ioc_code(self, nation):
+        nation_clean = nation.split('[')[0].strip()
+        if '(' in nation and ')' in nation:
+            code = nation.split('(')[1].split(')')[0].strip()
+            if len(code) == 3 and code.isupper():
+                return code
+        return self.NATION_TO_IOC.get(nation_clean)
+    
+    def _safe_int(self, value):
+        try:
+            if pd.notna(value):
+                s = str(value).strip().replace(',', '')
+                if s and s not in ['—', '-', '']:
+                    return int(float(s))
+        except Exception:
+            pass
+        return None
+
+
+def parse_medal_page(html):
+    """Current path: html_tables, then the column-wise parser."""
+    table = find_table(html, ('summer', 'winter', 'combined'), classes=None)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return PandasOlympicScraper()._parse_combined_table(table.to_frame())
+
+
+def nation_pages():
+    pages = [pytest.param((FIXTURES / 'nation_page.html').read_text(encoding='utf-8'), id='fixture')]
+    return pages + [pytest.param(wiki_nation_page(code), id=code) for code in nation_codes(20)]
+
+
+def medal_pages():
+    pages = [pytest.param((FIXTURES / 'medal_table_page.html').read_text(encoding='utf-8'), id='fixture')]
+    return pages + [pytest.param(wiki_medal_table_page([code[1:] for code in nation_codes(200)]), id='synthetic')]
+
+
+@pytest.mark.parametrize('html', nation_pages())
+def test_competitors_match_legacy(html):
+    current = NationCompetitorsScraper(parse_workers=0, use_cache=False).parse_nation_page(html)
+    legacy = LegacyNationScraper(parse_workers=0, use_cache=False).parse_nation_page(html)
+    assert current
+    assert current == legacy
+
+
+@pytest.mark.parametrize('html', medal_pages())
+def test_medals_match_legacy(html):
+    winter, all_time = parse_medal_page(html)
+    assert all_time
+    assert (winter, all_time) == LegacyMedalScraper().parse_page(html)
+
+
+def test_competitors_fixture():
+    html = (FIXTURES / 'nation_page.html').read_text(encoding='utf-8')
+    assert NationCompetitorsScraper(parse_workers=0, use_cache=False).parse_nation_page(html) == {
+        'Alpine Skiing': {'men': 1, 'women': 1, 'total': 2},
+        'Bobsleigh': {'men': 4, 'women': 2, 'total': 6},
+        'Cross-Country Skiing': {'men': 0, 'women': 1, 'total': 1},
+        'Skeleton': {'men': 1, 'women': 0, 'total': 1},
+    }
+
+
+def test_medals_fixture():
+    winter, all_time = parse_medal_page((FIXTURES / 'medal_table_page.html').read_text(encoding='utf-8'))
+    assert winter['USA'] == {'gold': 113, 'silver': 122, 'bronze': 95, 'total': 330}
+    assert all_time['USA'] == {'gold': 1218, 'silver': 1001, 'bronze': 875, 'total': 3094}
+    assert 'JAM' not in winter and all_time['JAM']['total'] == 89
+    assert winter['LIE']['total'] == 10 and 'LIE' in all_time
+    # Later rows win for repeated codes; "Unified Team" rows are skipped
+    assert all_time['NOR'] == {'gold': 0, 'silver': 1, 'bronze': 1, 'total': 2}
+    assert 'EUN' not in all_time
+
+
+@pytest.mark.parametrize('frame', [
+    pd.DataFrame({'Sport': ['Luge', None, 'Biathlon', 'Total'], 'Men': ['2', '1', None, '3'],
+                  'Women': ['1,000', '1', '2.7', '3']}),
+    pd.DataFrame({'Discipline': ['Ski jumping[a]', 'nan', 'Snowboarding'], 'Women': [3, 4, float('nan')]}),
+    pd.DataFrame({'Sport': ['Curling', 'Luge'], 'Men': ['-1', 'inf'], 'Women': ['12abc', ' 7 ']}),
+])
+def test_competitors_frames_match_legacy(frame):
+    current = NationCompetitorsScraper(parse_workers=0, use_cache=False)._parse_competitors_table(frame)
+    legacy = LegacyNationScraper(parse_workers=0, use_cache=False)._parse_competitors_table(frame)
+    assert current == legacy
+
+
+def test_medal_frame_matches_legacy():
+    groups = ['Summer Olympic Games', 'Winter Olympic Games', 'Combined total']
+    columns = [('Team', 'Team')] + [(group, label) for group in groups
+                                    for label in ('No.', 'Gold', 'Silver', 'Bronze', 'Total')]
+    cells = [
+        ['Chile (CHI)', '1', '2', '7', '4', '13', '2', '0', None, '—', '2.7', '3', '2', '7', '4', '15'],
+        ['France (FRA) (extra)', '1', '1', '0', '0', '1', '2', 'inf', '1', '1', '-1', '3', '1', '1', '1', '3'],
+        ['x) Peru (PER', '1', '1', '0', '0', '1', '2', '1', '1', '1', '3', '3', '1', '1', '1', '3'],
+        [None, '1', '1', '0', '0', '1', '2', '1', '1', '1', '3', '3', '1', '1', '1', '3'],
+        ['Sri Lanka[c]', '1', '1', '0', '0', '1', '2', '1', '1', '1', '1,003', '3', '1', '1', '1', '3'],
+    ]
+    df = pd.DataFrame(cells, columns=pd.MultiIndex.from_tuples(columns))
+    with contextlib.redirect_stdout(io.StringIO()):
+        current = PandasOlympicScraper()._parse_combined_table(df)
+    assert current == LegacyMedalScraper()._parse_combined_table(df)
+    assert current[0]['SRI']['total'] == 1003
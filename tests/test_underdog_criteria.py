@@ -0,0 +1,131 @@
+"""
+Per-nation criteria from src.underdog_criteria, pinned against the rules the
+scripts applied before they shared the engine.
+"""
+
+import pytest
+
+from src.nation_table import NationTable
+from src.underdog_criteria import evaluate
+
+
+MEDALS = {
+    'NOR': {'gold': 209, 'silver': 185, 'bronze': 173, 'total': 567},
+    'NZL': {'gold': 63, 'silver': 32, 'bronze': 45, 'total': 140},
+    'JAM': {'gold': 26, 'silver': 36, 'bronze': 27, 'total': 89},
+    'LIE': {'gold': 2, 'silver': 2, 'bronze': 6, 'total': 10},
+    'THA': {'gold': 10, 'silver': 8, 'bronze': 17, 'total': 35},
+    'FIJ': {'gold': 2, 'silver': 1, 'bronze': 1, 'total': 4},
+}
+WINTER_MEDALS = {
+    'NOR': {'gold': 148, 'silver': 133, 'bronze': 124, 'total': 405},
+    'NZL': {'gold': 3, 'silver': 2, 'bronze': 4, 'total': 9},
+    'LIE': {'gold': 2, 'silver': 2, 'bronze': 6, 'total': 10},
+}
+POPULATION = {'NOR': 5_500_000, 'NZL': 5_200_000, 'JAM': 2_800_000, 'LIE': 39_000,
+              'THA': 70_000_000, 'FIJ': 900_000, 'SMR': 0}
+ATHLETES = {'NOR': 80, 'NZL': 40, 'JAM': 9, 'LIE': 3, 'THA': 2, 'FIJ': 0, 'BOL': 1, 'SMR': 4}
+NATIONS = ['NOR', 'NZL', 'JAM', 'LIE', 'THA', 'FIJ', 'BOL', 'SMR']
+
+# Criteria met by each nation with the shared engine
+EXPECTED = {
+    'NOR': set(),
+    'NZL': {'southern_hemisphere'},
+    'JAM': {'no_winter_gold', 'no_winter_medals'},
+    'LIE': {'small_athletes', 'small_population'},
+    'THA': {'small_athletes', 'no_winter_gold', 'no_winter_medals'},
+    'FIJ': {'small_population', 'no_winter_gold', 'no_winter_medals', 'southern_hemisphere'},
+    'BOL': {'small_athletes', 'no_olympic_gold', 'no_olympic_medals', 'no_winter_gold',
+            'no_winter_medals', 'southern_hemisphere'},
+    'SMR': {'small_athletes', 'no_olympic_gold', 'no_olympic_medals', 'small_population',
+            'no_winter_gold', 'no_winter_medals'},
+}
+EXPECTED_TIERS = {'NOR': 0, 'NZL': 1, 'JAM': 2, 'LIE': 2, 'THA': 3, 'FIJ': 4, 'BOL': 5, 'SMR': 5}
+
+
+def legacy_criteria(nation, southern, small_team, small_population):
+    """The per-script rules before the shared engine."""
+    medals = MEDALS.get(nation, {})
+    winter = WINTER_MEDALS.get(nation, {})
+    met = set()
+    if small_team(ATHLETES.get(nation, 0)):
+        met.add('small_athletes')
+    if medals.get('gold', 0) == 0:
+        met.add('no_olympic_gold')
+    if medals.get('total', 0) == 0:
+        met.add('no_olympic_medals')
+    if small_population(POPULATION.get(nation, float('inf'))):
+        met.add('small_population')
+    if winter.get('gold', 0) == 0:
+        met.add('no_winter_gold')
+    if winter.get('total', 0) == 0:
+        met.add('no_winter_medals')
+    if nation in southern:
+        met.add('southern_hemisphere')
+    return met
+
+
+OVERVIEW_SOUTHERN = {'AUS', 'NZL', 'RSA', 'BRA', 'CHI', 'ARG', 'URU', 'ECU', 'MAD'}
+SPORT_SCRIPT_SOUTHERN = {'AUS', 'ARG', 'BRA', 'CHI', 'NZL', 'RSA', 'URU', 'ECU',
+                         'FIJ', 'MAS', 'SIN', 'THA', 'PNG', 'VUT'}
+
+# (legacy rules, engine options, nation -> criteria that changed on purpose)
+LEGACY = {
+    'overview': (
+        dict(southern=OVERVIEW_SOUTHERN, small_team=lambda n: 1 <= n < 5,
+             small_population=lambda p: p < 1_000_000),
+        {},
+        # BOL and FIJ are below the equator
+        {'BOL': {'southern_hemisphere'}, 'FIJ': {'southern_hemisphere'}},
+    ),
+    'identify_sport_underdogs': (
+        dict(southern=SPORT_SCRIPT_SOUTHERN, small_team=lambda n: n < 5,
+             small_population=lambda p: p < 1_000_000),
+        {'min_athletes': 0},
+        # BOL is below the equator, THA is not
+        {'BOL': {'southern_hemisphere'}, 'THA': {'southern_hemisphere'}},
+    ),
+}
+
+
+def evaluate_nations(**options):
+    table = NationTable.from_sources(medals=MEDALS, winter_medals=WINTER_MEDALS,
+                                     population=POPULATION, athletes=ATHLETES, nations=NATIONS)
+    return evaluate(table, NATIONS, **options)
+
+
+def test_criteria_per_nation():
+    result = evaluate_nations()
+    assert {nation: set(result.criteria_keys(nation)) for nation in NATIONS} == EXPECTED
+    assert {nation: result.tier(nation) for nation in NATIONS} == EXPECTED_TIERS
+
+
+def test_empty_team_counts_only_with_min_athletes_zero():
+    assert 'small_athletes' not in evaluate_nations().criteria_keys('FIJ')
+    assert 'small_athletes' in evaluate_nations(min_athletes=0).criteria_keys('FIJ')
+
+
+def test_population_zero_is_small_and_missing_is_not():
+    result = evaluate_nations()
+    assert 'small_population' in result.criteria_keys('SMR')
+    assert 'small_population' not in result.criteria_keys('BOL')
+
+
+@pytest.mark.parametrize('consumer', sorted(LEGACY))
+def test_changes_from_legacy_rules(consumer):
+    rules, options, changed = LEGACY[consumer]
+    result = evaluate_nations(**options)
+    for nation in NATIONS:
+        before = legacy_criteria(nation, **rules)
+        after = set(result.criteria_keys(nation))
+        assert before ^ after == changed.get(nation, set()), nation
+
+
+def test_unknown_nations_do_not_grow_the_table():
+    table = NationTable.from_sources(medals=MEDALS, population=POPULATION, nations=NATIONS)
+    size = len(table)
+    result = evaluate(table, ['ZZZ', 'PNG'])
+    assert len(table) == size and 'ZZZ' not in table
+    assert set(result.criteria_keys('PNG')) == {
+        'no_olympic_gold', 'no_olympic_medals', 'no_winter_gold', 'no_winter_medals',
+        'southern_hemisphere'}
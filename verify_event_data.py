@@ -1,13 +1,12 @@
 """Quick verification of parsed event data."""
-import json
+
+from src.snapshot import load_json
 
 # Load event data
-with open('data/event_nations_2026.json', 'r', encoding='utf-8') as f:
-    event_data = json.load(f)
+event_data = load_json('data/event_nations_2026.json')
 
 # Load nation data
-with open('data/nation_events_2026.json', 'r', encoding='utf-8') as f:
-    nation_data = json.load(f)
+nation_data = load_json('data/nation_events_2026.json')
 
 print("=" * 60)
 print("EVENT MAPPING VERIFICATION")
@@ -1,13 +1,12 @@
 """Final verification of complete schedule system."""
-import json
+
+from src.snapshot import load_json
 from datetime import datetime
 
 # Load all data files
-with open('data/nation_schedules_2026.json', 'r', encoding='utf-8') as f:
-    nation_schedules = json.load(f)
+nation_schedules = load_json('data/nation_schedules_2026.json')
 
-with open('data/daily_underdog_schedule_2026.json', 'r', encoding='utf-8') as f:
-    daily_schedule = json.load(f)
+daily_schedule = load_json('data/daily_underdog_schedule_2026.json')
 
 print("=" * 80)
 print("OLYMPIC UNDERDOG SCHEDULE SYSTEM - FINAL VERIFICATION")